@@ -0,0 +1,422 @@
+"""
+Calificación por lotes de las entregas del laboratorio integrado.
+
+Cada entrega es un subdirectorio (su nombre identifica al grupo) con el
+numpyless.py del grupo y, opcionalmente, su notebook. Cada una se califica
+en un subproceso propio, dentro de una copia temporal de su carpeta, así que
+una entrega que se cae, se cuelga o escribe archivos no afecta a las demás.
+Las entregas se reparten en un pool con un trabajador por núcleo.
+
+Las celdas que registran pruebas (las "NO MODIFIQUE ESTA CELDA") se toman
+siempre del notebook de referencia; el resto de las celdas de código salen
+del notebook de la entrega, o del de referencia si la entrega no trae uno.
+
+Uso Recomendado:
+    import calificacion_por_lotes as lotes
+
+    registros = lotes.calificar("entregas/", tiempo_limite=600)
+    lotes.to_csv(registros, "notas.csv")
+    lotes.to_json(registros, "notas.json")
+
+Desde la terminal:
+    python calificacion_por_lotes.py entregas/ --csv notas.csv --json notas.json
+    python calificacion_por_lotes.py entregas/ --procesos 8 --logs logs/
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Directorio del laboratorio (sistema_de_calificacion.py y el notebook)
+DIRECTORIO_LAB = os.path.dirname(os.path.abspath(__file__))
+NOTEBOOK_REFERENCIA = os.path.join(
+    DIRECTORIO_LAB, "laboratorio_integrado_bibliotecas.ipynb"
+)
+# Segundos que puede tardar una entrega completa antes de matarla
+TIEMPO_LIMITE = 600.0
+
+# Estados posibles de una entrega
+OK = "ok"
+ERROR = "error"
+TIEMPO_AGOTADO = "tiempo_agotado"
+
+# Columnas fijas del CSV; después va una columna por GrupoCalificacion
+COLUMNAS = [
+    "entrega",
+    "estado",
+    "nota_total",
+    "valor_total",
+    "porcentaje",
+    "segundos",
+    "mensaje",
+]
+
+
+# -------------------------------------------------------------------
+# Celdas a Ejecutar
+# -------------------------------------------------------------------
+
+
+def _celdas_de_codigo(ruta_notebook: str) -> list[str]:
+    with open(ruta_notebook, encoding="utf-8") as archivo:
+        notebook = json.load(archivo)
+    return [
+        "".join(celda["source"])
+        for celda in notebook["cells"]
+        if celda["cell_type"] == "code"
+    ]
+
+
+def _es_celda_de_pruebas(codigo: str) -> bool:
+    return "registrar_prueba" in codigo
+
+
+def _sin_magias(codigo: str) -> str:
+    """Comenta las líneas de IPython (%magia, !comando) que Python no entiende."""
+    return "\n".join(
+        "# " + linea if linea.lstrip().startswith(("%", "!")) else linea
+        for linea in codigo.splitlines()
+    )
+
+
+def celdas(ruta_notebook: str | None, referencia: str = NOTEBOOK_REFERENCIA):
+    """Arma la lista de celdas con que se califica una entrega.
+
+    La k-ésima celda de pruebas del notebook de la entrega se reemplaza por
+    la k-ésima del notebook de referencia; las celdas de pruebas de
+    referencia que sobren se agregan al final.
+
+    Args:
+        ruta_notebook: Notebook de la entrega (None = usar el de referencia).
+        referencia: Notebook con las pruebas oficiales.
+
+    Returns:
+        list[str]: Código de cada celda, en orden de ejecución.
+    """
+    oficiales = _celdas_de_codigo(referencia)
+    if ruta_notebook is None:
+        return [_sin_magias(c) for c in oficiales]
+
+    pruebas = [c for c in oficiales if _es_celda_de_pruebas(c)]
+    resultado = []
+    for codigo in _celdas_de_codigo(ruta_notebook):
+        if _es_celda_de_pruebas(codigo):
+            if pruebas:
+                resultado.append(pruebas.pop(0))
+        else:
+            resultado.append(codigo)
+    resultado.extend(pruebas)
+    return [_sin_magias(c) for c in resultado]
+
+
+# -------------------------------------------------------------------
+# Proceso Hijo: califica una entrega
+# -------------------------------------------------------------------
+
+
+def _buscar_notebook(directorio: str) -> str | None:
+    notebooks = sorted(
+        nombre
+        for nombre in os.listdir(directorio)
+        if nombre.endswith(".ipynb") and not nombre.startswith(".")
+    )
+    return os.path.join(directorio, notebooks[0]) if notebooks else None
+
+
+def _calificar_aqui(referencia: str, salida: str) -> None:
+    """Ejecuta las celdas en el directorio actual y guarda las notas en JSON.
+
+    Corre dentro del subproceso de cada entrega. El sistema de calificación
+    se importa antes de poner la carpeta de la entrega al frente de sys.path,
+    para que una copia modificada que venga en la entrega no lo reemplace.
+    """
+    import sistema_de_calificacion  # noqa: F401  (queda en sys.modules)
+
+    sys.path.insert(0, os.getcwd())
+    espacio = {"__name__": "__main__"}
+    errores = []
+    for indice, codigo in enumerate(celdas(_buscar_notebook("."), referencia)):
+        try:
+            exec(compile(codigo, f"<celda {indice}>", "exec"), espacio)
+        except BaseException as e:  # una celda rota no detiene las siguientes
+            errores.append(f"celda {indice}: {type(e).__name__}: {e}")
+            traceback.print_exc()
+
+    sistema = espacio.get("sistema")
+    if not isinstance(sistema, sistema_de_calificacion.SistemaCalificacion):
+        raise RuntimeError("el notebook no creó el objeto 'sistema'")
+    # calcular_nota_total() espera las pruebas encoladas y suma los contadores
+    nota_total, valor_total = sistema.calcular_nota_total()
+    sistema.cerrar()
+    with open(salida, "w", encoding="utf-8") as archivo:
+        json.dump(
+            {
+                "nota_total": nota_total,
+                "valor_total": valor_total,
+                "grupos": [g.obtener_estadisticas() for g in sistema.grupos],
+                "errores": errores,
+            },
+            archivo,
+            ensure_ascii=False,
+        )
+
+
+# -------------------------------------------------------------------
+# Proceso Padre: reparte las entregas
+# -------------------------------------------------------------------
+
+
+def entregas(directorio: str) -> list[str]:
+    """Lista las entregas (subdirectorios con numpyless.py), ordenadas.
+
+    Args:
+        directorio: Carpeta con una subcarpeta por grupo.
+
+    Returns:
+        list[str]: Rutas de las entregas.
+    """
+    return [
+        os.path.join(directorio, nombre)
+        for nombre in sorted(os.listdir(directorio))
+        if os.path.isfile(os.path.join(directorio, nombre, "numpyless.py"))
+    ]
+
+
+def _ultimas_lineas(texto: str, n: int = 3) -> str:
+    return " | ".join(linea for linea in texto.strip().splitlines()[-n:])
+
+
+def _matar(proceso: subprocess.Popen) -> None:
+    """Mata el subproceso y todo lo que haya lanzado (su grupo de procesos)."""
+    try:
+        os.killpg(proceso.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError):  # Windows o ya terminó
+        proceso.kill()
+
+
+def calificar_entrega(
+    ruta: str,
+    *,
+    referencia: str = NOTEBOOK_REFERENCIA,
+    tiempo_limite: float | None = TIEMPO_LIMITE,
+    logs: str | None = None,
+) -> dict:
+    """Califica una entrega en un subproceso aislado.
+
+    Args:
+        ruta: Carpeta de la entrega.
+        referencia: Notebook con las pruebas oficiales.
+        tiempo_limite: Segundos antes de matar el subproceso (None = sin límite).
+        logs: Carpeta donde guardar la salida de cada entrega (opcional).
+
+    Returns:
+        dict: Registro con las columnas de COLUMNAS y "grupos", una lista
+              con obtener_estadisticas() de cada GrupoCalificacion.
+    """
+    nombre = os.path.basename(os.path.normpath(ruta))
+    registro = dict.fromkeys(COLUMNAS, None)
+    registro.update(entrega=nombre, estado=ERROR, mensaje="", grupos=[])
+
+    inicio = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="calificacion_") as temporal:
+        copia = os.path.join(temporal, "entrega")
+        shutil.copytree(ruta, copia)
+        salida = os.path.join(temporal, "resultado.json")
+        entorno = dict(os.environ, MPLBACKEND="Agg")
+        if not logs:
+            # Nadie va a leer la salida de las pruebas: no generarla
+            entorno.setdefault("CALIFICACION_SALIDA", "silencio")
+        comando = [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--hijo",
+            os.path.abspath(referencia),
+            salida,
+        ]
+        with subprocess.Popen(
+            comando,
+            cwd=copia,
+            env=entorno,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            start_new_session=True,
+        ) as proceso:
+            try:
+                salida_texto, errores_texto = proceso.communicate(timeout=tiempo_limite)
+            except subprocess.TimeoutExpired:
+                _matar(proceso)
+                salida_texto, errores_texto = proceso.communicate()
+                registro["estado"] = TIEMPO_AGOTADO
+                registro["mensaje"] = f"TIEMPO AGOTADO (> {tiempo_limite:g} s)"
+
+        if proceso.returncode == 0 and os.path.exists(salida):
+            with open(salida, encoding="utf-8") as archivo:
+                resultado = json.load(archivo)
+            registro.update(
+                estado=OK,
+                nota_total=resultado["nota_total"],
+                valor_total=resultado["valor_total"],
+                grupos=resultado["grupos"],
+                mensaje="; ".join(resultado["errores"]),
+            )
+            if resultado["valor_total"] > 0:
+                registro["porcentaje"] = (
+                    resultado["nota_total"] / resultado["valor_total"] * 100
+                )
+        elif registro["estado"] != TIEMPO_AGOTADO:
+            registro["mensaje"] = (
+                f"código {proceso.returncode}: {_ultimas_lineas(errores_texto)}"
+            )
+    registro["segundos"] = time.perf_counter() - inicio
+
+    if logs:
+        os.makedirs(logs, exist_ok=True)
+        with open(os.path.join(logs, f"{nombre}.log"), "w", encoding="utf-8") as log:
+            log.write(salida_texto)
+            log.write(errores_texto)
+    return registro
+
+
+def calificar(
+    directorio: str,
+    *,
+    procesos: int | None = None,
+    referencia: str = NOTEBOOK_REFERENCIA,
+    tiempo_limite: float | None = TIEMPO_LIMITE,
+    logs: str | None = None,
+    verbose: bool = False,
+) -> list[dict]:
+    """Califica todas las entregas de un directorio.
+
+    Args:
+        directorio: Carpeta con una subcarpeta por grupo.
+        procesos: Entregas simultáneas (None = os.cpu_count()).
+        referencia: Notebook con las pruebas oficiales.
+        tiempo_limite: Segundos por entrega antes de matarla.
+        logs: Carpeta donde guardar la salida de cada entrega (opcional).
+        verbose: Imprime una línea por entrega al terminar.
+
+    Returns:
+        list[dict]: Un registro por entrega, en orden alfabético.
+    """
+    rutas = entregas(directorio)
+    registros = {}
+    with ThreadPoolExecutor(max_workers=procesos or os.cpu_count() or 1) as pool:
+        futuros = {
+            pool.submit(
+                calificar_entrega,
+                ruta,
+                referencia=referencia,
+                tiempo_limite=tiempo_limite,
+                logs=logs,
+            ): ruta
+            for ruta in rutas
+        }
+        for futuro in as_completed(futuros):
+            r = futuro.result()
+            registros[futuros[futuro]] = r
+            if verbose:
+                if r["estado"] == OK:
+                    print(
+                        f"✓ {r['entrega']}: {r['nota_total']:.2f}% / "
+                        f"{r['valor_total']:.2f}% ({r['segundos']:.1f} s)"
+                    )
+                else:
+                    simbolo = "⏱" if r["estado"] == TIEMPO_AGOTADO else "✗"
+                    print(f"{simbolo} {r['entrega']}: {r['mensaje']}")
+    return [registros[ruta] for ruta in rutas]
+
+
+# -------------------------------------------------------------------
+# Exportación
+# -------------------------------------------------------------------
+
+
+def _nombres_de_grupos(registros: list[dict]) -> list[str]:
+    nombres = {}
+    for r in registros:
+        for grupo in r["grupos"]:
+            nombres.setdefault(grupo["nombre"], None)
+    return list(nombres)
+
+
+def to_csv(registros: list[dict], path: str) -> None:
+    """Guarda una fila por entrega, con la nota de cada grupo como columna.
+
+    Args:
+        registros: Salida de calificar().
+        path: Archivo de destino.
+    """
+    grupos = _nombres_de_grupos(registros)
+    with open(path, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS + grupos)
+        escritor.writeheader()
+        for r in registros:
+            fila = {c: r[c] for c in COLUMNAS}
+            fila.update({g["nombre"]: g["nota_obtenida"] for g in r["grupos"]})
+            escritor.writerow(fila)
+
+
+def to_json(registros: list[dict], path: str) -> None:
+    """Guarda los registros completos (con estadísticas por grupo) en JSON.
+
+    Args:
+        registros: Salida de calificar().
+        path: Archivo de destino.
+    """
+    with open(path, "w", encoding="utf-8") as archivo:
+        json.dump(registros, archivo, ensure_ascii=False, indent=2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Punto de entrada de la línea de comandos.
+
+    Returns:
+        int: 0 si todas las entregas se calificaron, 1 si alguna falló.
+    """
+    parser = argparse.ArgumentParser(description="Calificación por lotes")
+    parser.add_argument("directorio", nargs="?", help="una subcarpeta por grupo")
+    parser.add_argument("--procesos", type=int, help="por defecto, uno por núcleo")
+    parser.add_argument("--tiempo-limite", type=float, default=TIEMPO_LIMITE)
+    parser.add_argument("--referencia", default=NOTEBOOK_REFERENCIA)
+    parser.add_argument("--csv", help="guardar resultados en CSV")
+    parser.add_argument("--json", help="guardar resultados en JSON")
+    parser.add_argument("--logs", help="carpeta para la salida de cada entrega")
+    parser.add_argument("--hijo", nargs=2, help=argparse.SUPPRESS)
+    opciones = parser.parse_args(argv)
+
+    if opciones.hijo:
+        _calificar_aqui(*opciones.hijo)
+        return 0
+    if not opciones.directorio:
+        parser.error("falta el directorio de entregas")
+
+    registros = calificar(
+        opciones.directorio,
+        procesos=opciones.procesos,
+        referencia=opciones.referencia,
+        tiempo_limite=opciones.tiempo_limite,
+        logs=opciones.logs,
+        verbose=True,
+    )
+    if opciones.csv:
+        to_csv(registros, opciones.csv)
+    if opciones.json:
+        to_json(registros, opciones.json)
+    return 0 if all(r["estado"] == OK for r in registros) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,44 +18,674 @@ Uso Recomendado:
 Tipos de Datos:
 - Vector: list[float] - Un array 1D de flotantes
 - Matriz: list[list[float]] - Un array 2D de flotantes (filas x columnas)
+- Matrix: Matriz compacta respaldada por un único buffer array('d')
+  (o array('f') / array('q') con dtype float32 / int64)
+- COOMatrix / CSRMatrix / CSCMatrix: Matrices dispersas (solo no ceros)
+- MappedMatrix: Matriz float64 en disco, mapeada con mmap
 """
 
+import atexit
+import builtins
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import OrderedDict
+from functools import wraps
+from itertools import chain, compress, repeat
+from operator import (
+    add as _suma,
+    gt as _mayor,
+    indexOf as _indice_de,
+    is_ as _es,
+    mul as _producto,
+    sub as _resta,
+    truediv as _cociente,
+)
+
 # --- Alias de Tipos Nativos ---
 Vector = list[float]
 Matriz = list[list[float]]
 
+# sum, min y max se redefinen como reducciones por eje (Sección 16); dentro
+# del módulo las versiones de Python se llaman siempre como builtins.*
+
+# math.sumprod existe desde Python 3.12; antes se usa sum(map(mul, ...))
+_sumprod = getattr(math, "sumprod", None) or (
+    lambda v, w: builtins.sum(map(_producto, v, w))
+)
+
+# --- Configuración del motor de matmul ---
+# Cantidad de columnas de B que se recorren juntas para reutilizarlas en caché
+TAMANO_BLOQUE = 64
+# Dimensión mínima (de m, n y p) a partir de la cual matmul usa Strassen
+UMBRAL_STRASSEN = 128
+
+# --- Configuración de ejecución paralela ---
+# Procesos por defecto para matmul, add_matrices, multiply_matrix y batch_dot
+# (1 = serie; 0 o negativo = todos los núcleos). Cada función acepta workers=.
+PROCESOS = 1
+# Trabajo mínimo (m*n*p en matmul, m*n en el resto) para que valga la pena
+# repartir entre procesos; por debajo se ejecuta en serie
+UMBRAL_PARALELO = 1_000_000
+_BYTES_FLOAT = array("d").itemsize
+
+# --- Tipos de almacenamiento de Matrix (dtype) ---
+# Nombre del dtype -> código de tipo del array.array que guarda los elementos
+DTYPES = {"float64": "d", "float32": "f", "int64": "q"}
+_NOMBRES_DTYPE = {codigo: nombre for nombre, codigo in DTYPES.items()}
+# Código de tipo -> descriptor de NumPy sin el orden de bytes
+_DESCRIPTORES = {"d": "f8", "f": "f4", "q": "i8"}
+# Nombres aceptados en dtype= (además de float e int de Python)
+_CODIGOS_DTYPE = {**DTYPES, "float": "d", "int": "q", "f8": "d", "f4": "f", "i8": "q"}
+
+# --- Configuración de matrices en disco ---
+# Lado de las teselas con que se procesan las matrices mapeadas (MappedMatrix)
+TAMANO_TESELA = 256
+
+# --- Configuración del autoajuste ---
+# Si es True, matmul cronometra sus núcleos candidatos la primera vez que ve
+# una clase de forma y recuerda el más rápido, también en disco (ver
+# autotune_matmul). Se activa con la variable de entorno NUMPYLESS_AUTOTUNE=1.
+AUTOAJUSTE = os.environ.get("NUMPYLESS_AUTOTUNE", "") not in ("", "0")
+# Trabajo mínimo (m*n*p) para autoajustar; por debajo manda el núcleo fijo
+UMBRAL_AUTOAJUSTE = 64**3
+
+
+def __getattr__(nombre: str):
+    # npl.bench carga la suite de benchmarks (numpyless_bench.py) solo al
+    # usarla, para que el núcleo siga siendo un único archivo independiente
+    if nombre == "bench":
+        import numpyless_bench
+
+        return numpyless_bench
+    raise AttributeError(f"module 'numpyless' has no attribute {nombre!r}")
+
+
+# -------------------------------------------------------------------
+# Sección 0: Matriz Compacta (Almacenamiento)
+# -------------------------------------------------------------------
+
+
+class Matrix:
+    """Matriz densa guardada en un único buffer plano array('d').
+
+    A diferencia de Matriz (lista de listas), una Matrix de 500x500 es un
+    solo objeto con 250 000 flotantes de 8 bytes contiguos, en lugar de
+    501 listas y 250 000 objetos float independientes.
+
+    El elemento (i, j) vive en
+    data[offset + i * strides[0] + j * strides[1]]. Para una matriz creada
+    normalmente offset == 0 y strides == (columnas, 1), es decir, orden por
+    filas (row-major).
+
+    Las vistas (M.T, M[i, :], M[:, j], M[a:b, c:d]) comparten el buffer con
+    la matriz original y solo cambian offset, shape y strides: no copian
+    datos. Para obtener una matriz independiente use copy().
+
+    El dtype (ver DTYPES) es el typecode del buffer: float64 ('d') por
+    defecto, float32 ('f', 4 bytes por elemento, la mitad de memoria) o
+    int64 ('q', enteros exactos). Las operaciones promueven como NumPy:
+    dos operandos del mismo dtype lo conservan y cualquier mezcla da
+    float64. Guardar flotantes en int64 trunca hacia cero, como astype().
+
+    Ejemplo:
+        >>> M = Matrix.from_lists([[1, 2], [3, 4]])
+        >>> M.shape
+        (2, 2)
+        >>> M[1, 0]
+        3.0
+        >>> M.T.tolist()
+        [[1.0, 3.0], [2.0, 4.0]]
+        >>> M[:, 1].tolist()
+        [[2.0], [4.0]]
+    """
+
+    __slots__ = ("_data", "_shape", "_strides", "_offset")
+
+    def __init__(
+        self,
+        data: array,
+        shape: tuple[int, int],
+        strides: tuple[int, int] | None = None,
+        offset: int = 0,
+    ):
+        """Envuelve un buffer existente sin copiarlo.
+
+        Args:
+            data: Buffer plano array('d') con los elementos (o un
+                  memoryview de formato 'd', 'f' o 'q' sobre memoria
+                  ajena, ver from_buffer()). Con array('f') o array('q')
+                  la matriz es float32 o int64.
+            shape: Tupla (filas, columnas).
+            strides: Saltos (fila, columna) en el buffer. Por defecto
+                     (columnas, 1), es decir, orden por filas.
+            offset: Posición del elemento (0, 0) en el buffer.
+
+        Raises:
+            ValueError: Si el buffer es demasiado pequeño para la forma.
+        """
+        filas, columnas = shape
+        if filas < 0 or columnas < 0:
+            raise ValueError(f"Forma inválida: {shape}")
+        if strides is None:
+            strides = (columnas, 1)
+        if filas and columnas:
+            ultimo = offset + (filas - 1) * strides[0] + (columnas - 1) * strides[1]
+            if offset < 0 or ultimo >= len(data):
+                raise ValueError(
+                    f"El buffer de {len(data)} elementos no alcanza para "
+                    f"la forma {shape}"
+                )
+        self._data = data
+        self._shape = (filas, columnas)
+        self._strides = tuple(strides)
+        self._offset = offset
+
+    # --- Construcción ---
+
+    @classmethod
+    def from_lists(cls, filas: Matriz, dtype=None) -> "Matrix":
+        """Crea una Matrix a partir de una lista de listas.
+
+        Args:
+            filas: Matriz rectangular como lista de listas.
+            dtype: Tipo de almacenamiento ("float64", "float32" o "int64";
+                   por defecto float64). Si filas ya es una Matrix de ese
+                   dtype (o no se indica), se devuelve tal cual.
+
+        Returns:
+            Matrix: Una matriz compacta con los mismos valores.
+
+        Raises:
+            ValueError: Si las filas no tienen todas la misma longitud o el
+                        dtype no está en DTYPES.
+
+        Ejemplo:
+            >>> Matrix.from_lists([[1, 2], [3, 4]], dtype="int64")
+            Matrix([[1, 2], [3, 4]], dtype='int64')
+        """
+        if isinstance(filas, Matrix):
+            if dtype is None or _codigo(dtype) == filas._codigo:
+                return filas
+            return filas.astype(dtype)
+        codigo = _codigo(dtype)
+        columnas = len(filas[0]) if filas else 0
+        data = array(codigo)
+        for fila in filas:
+            if len(fila) != columnas:
+                raise ValueError("Todas las filas deben tener la misma longitud")
+            if codigo == "q" or isinstance(fila, array):
+                # Trunca a int64 y evita que extend() mezcle typecodes
+                fila = _buffer(codigo, fila)
+            data.extend(fila)
+        return cls(data, (len(filas), columnas))
+
+    @classmethod
+    def full(cls, shape: tuple[int, int], valor: float, dtype=None) -> "Matrix":
+        """Crea una Matrix de la forma dada rellena con un valor."""
+        filas, columnas = shape
+        data = _buffer(_codigo(dtype), [valor]) * (filas * columnas)
+        return cls(data, (filas, columnas))
+
+    @classmethod
+    def zeros(cls, shape: tuple[int, int], dtype=None) -> "Matrix":
+        """Crea una Matrix de ceros."""
+        return cls.full(shape, 0, dtype)
+
+    @classmethod
+    def ones(cls, shape: tuple[int, int], dtype=None) -> "Matrix":
+        """Crea una Matrix de unos."""
+        return cls.full(shape, 1, dtype)
+
+    @classmethod
+    def identity(cls, n: int, dtype=None) -> "Matrix":
+        """Crea una Matrix identidad de n x n."""
+        M = cls.full((n, n), 0, dtype)
+        # La diagonal de un buffer n x n está cada n + 1 posiciones
+        M._data[:: n + 1] = _buffer(M._codigo, [1]) * n
+        return M
+
+    # --- Información ---
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Tupla (filas, columnas)."""
+        return self._shape
+
+    @property
+    def strides(self) -> tuple[int, int]:
+        """Saltos (fila, columna) en el buffer plano."""
+        return self._strides
+
+    @property
+    def size(self) -> int:
+        """Número total de elementos."""
+        return self._shape[0] * self._shape[1]
+
+    @property
+    def dtype(self) -> str:
+        """Tipo de almacenamiento: "float64", "float32" o "int64"."""
+        return _NOMBRES_DTYPE[self._codigo]
+
+    @property
+    def _codigo(self) -> str:
+        """Typecode del buffer ('d', 'f' o 'q')."""
+        datos = self._data
+        return datos.typecode if isinstance(datos, array) else datos.format[-1]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes que ocupan los elementos (size * bytes por elemento)."""
+        return self.size * self._data.itemsize
+
+    @property
+    def T(self) -> "Matrix":
+        """Vista transpuesta: comparte el buffer, solo intercambia strides."""
+        s0, s1 = self._strides
+        filas, columnas = self._shape
+        return Matrix(self._data, (columnas, filas), (s1, s0), self._offset)
+
+    def _es_contigua(self) -> bool:
+        """True si el buffer es exactamente la matriz en orden por filas."""
+        return (
+            self._offset == 0
+            and self._strides == (self._shape[1], 1)
+            and len(self._data) == self.size
+        )
+
+    # --- Acceso ---
+
+    def _fila(self, i: int) -> array:
+        """Copia de la fila i como array del dtype (una sola operación en C)."""
+        s0, s1 = self._strides
+        columnas = self._shape[1]
+        inicio = self._offset + i * s0
+        return self._data[inicio : inicio + (columnas - 1) * s1 + 1 : s1]
+
+    def _columna(self, j: int) -> array:
+        """Copia de la columna j como array del dtype (una operación en C)."""
+        s0, s1 = self._strides
+        filas = self._shape[0]
+        inicio = self._offset + j * s1
+        return self._data[inicio : inicio + (filas - 1) * s0 + 1 : s0]
+
+    def _plana(self) -> array:
+        """Buffer contiguo en orden por filas (sin copiar si ya lo es)."""
+        if self._es_contigua():
+            return self._data
+        filas, columnas = self._shape
+        if columnas == 0:
+            return array(self._codigo)
+        if self._strides == (columnas, 1):
+            # Filas consecutivas dentro de un buffer más grande: un solo corte
+            return self._data[self._offset : self._offset + self.size]
+        return array(self._codigo, chain.from_iterable(map(self._fila, range(filas))))
+
+    def _asignar_fila(self, i: int, valores) -> None:
+        """Sobrescribe la fila i en el buffer (sirve también para vistas)."""
+        valores = _buffer(self._codigo, valores)
+        s0, s1 = self._strides
+        inicio = self._offset + i * s0
+        self._data[inicio : inicio + (self._shape[1] - 1) * s1 + 1 : s1] = valores
+
+    def copy(self) -> "Matrix":
+        """Materializa la matriz (o vista) en un buffer nuevo y contiguo."""
+        plana = self._plana()
+        if plana is self._data or not isinstance(plana, array):
+            copia = array(self._codigo)
+            copia.frombytes(memoryview(plana).cast("B"))
+            plana = copia
+        return Matrix(plana, self._shape)
+
+    def astype(self, dtype) -> "Matrix":
+        """Copia contigua de la matriz con otro tipo de almacenamiento.
+
+        Pasar a int64 trunca hacia cero y pasar a float32 redondea al
+        flotante de 4 bytes más cercano, igual que en NumPy.
+
+        Equivalente en NumPy: A.astype(dtype)
+
+        Ejemplo:
+            >>> Matrix.from_lists([[1.7, -2.5]]).astype("int64").tolist()
+            [[1, -2]]
+        """
+        codigo = _codigo(dtype)
+        if codigo == self._codigo:
+            return self.copy()
+        return Matrix(_buffer(codigo, self._plana()), self._shape)
+
+    def _indice(self, i: int, j: int) -> int:
+        filas, columnas = self._shape
+        if i < 0:
+            i += filas
+        if j < 0:
+            j += columnas
+        if not (0 <= i < filas and 0 <= j < columnas):
+            raise IndexError(f"Índice ({i}, {j}) fuera de rango para {self._shape}")
+        return self._offset + i * self._strides[0] + j * self._strides[1]
+
+    @staticmethod
+    def _rango(indice: int | slice, dimension: int) -> tuple[int, int, int]:
+        """Traduce un índice o slice de un eje a (inicio, longitud, paso)."""
+        if isinstance(indice, slice):
+            inicio, fin, paso = indice.indices(dimension)
+            if paso <= 0:
+                raise ValueError("Las vistas solo admiten pasos positivos")
+            return inicio, len(range(inicio, fin, paso)), paso
+        if indice < 0:
+            indice += dimension
+        if not 0 <= indice < dimension:
+            raise IndexError(f"Índice {indice} fuera de rango para {dimension}")
+        return indice, 1, 1
+
+    def __getitem__(self, indice: tuple[int | slice, int | slice]) -> "float | Matrix":
+        """M[i, j] devuelve un float; si algún índice es slice, una vista.
+
+        Un índice entero en un eje deja ese eje con longitud 1, así
+        M[i, :] es una vista 1 x n y M[:, j] una vista n x 1.
+        """
+        i, j = indice
+        if not isinstance(i, slice) and not isinstance(j, slice):
+            return self._data[self._indice(i, j)]
+        fila0, filas, paso_f = self._rango(i, self._shape[0])
+        col0, columnas, paso_c = self._rango(j, self._shape[1])
+        s0, s1 = self._strides
+        return Matrix(
+            self._data,
+            (filas, columnas),
+            (s0 * paso_f, s1 * paso_c),
+            self._offset + fila0 * s0 + col0 * s1,
+        )
+
+    def __setitem__(self, indice: tuple[int, int], valor: float) -> None:
+        i, j = indice
+        if self._codigo == "q":
+            valor = int(valor)
+        self._data[self._indice(i, j)] = valor
+
+    def __len__(self) -> int:
+        return self._shape[0]
+
+    def __iter__(self):
+        """Itera sobre las filas, cada una como array del dtype."""
+        if self._shape[1] == 0:
+            return (array(self._codigo) for _ in range(self._shape[0]))
+        return map(self._fila, range(self._shape[0]))
+
+    # --- Conversión ---
+
+    def tolist(self) -> Matriz:
+        """Convierte la matriz a lista de listas (Matriz).
+
+        Ejemplo:
+            >>> Matrix.identity(2).tolist()
+            [[1.0, 0.0], [0.0, 1.0]]
+        """
+        return [fila.tolist() for fila in self]
+
+    # --- Protocolo de buffer (interoperabilidad sin copias) ---
+
+    @property
+    def data(self) -> memoryview:
+        """memoryview 2D (formato 'd', 'f' o 'q') sobre el buffer, sin copiar.
+
+        Raises:
+            BufferError: Si es una vista no contigua (M.T, M[:, j]...);
+                         use copy() primero.
+        """
+        filas, columnas = self._shape
+        s0, s1 = self._strides
+        if (s1 != 1 and columnas > 1) or (s0 != columnas and filas > 1):
+            raise BufferError("La vista no es contigua; use copy() primero")
+        plano = memoryview(self._data)[self._offset : self._offset + self.size]
+        if not self.size:
+            return plano  # memoryview no admite formas con ceros
+        return plano.cast("B").cast(self._codigo, self._shape)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exporta el buffer (PEP 688, Python 3.12+): memoryview(M)."""
+        return self.data
+
+    @property
+    def __array_interface__(self) -> dict:
+        """Describe el buffer para NumPy: np.asarray(M) comparte memoria.
+
+        Incluye strides, así que también las vistas (M.T, M[a:b, c:d]) se
+        convierten sin copiar.
+        """
+        s0, s1 = self._strides
+        bytes_elemento = self._data.itemsize
+        orden = "<" if sys.byteorder == "little" else ">"
+        return {
+            "version": 3,
+            "shape": self._shape,
+            "typestr": orden + _DESCRIPTORES[self._codigo],
+            "data": self._data,
+            "offset": self._offset * bytes_elemento,
+            "strides": (s0 * bytes_elemento, s1 * bytes_elemento),
+        }
+
+    def tobytes(self) -> bytes:
+        """Los elementos en orden por filas como bytes nativos de su dtype."""
+        return memoryview(self._plana()).tobytes()
+
+    @classmethod
+    def frombytes(cls, datos: bytes, shape: tuple[int, int], dtype=None) -> "Matrix":
+        """Crea una Matrix copiando bytes nativos (inversa de tobytes()).
+
+        Args:
+            datos: Bytes de los elementos en orden por filas.
+            shape: Tupla (filas, columnas).
+            dtype: Tipo de los elementos (float64 por defecto).
+
+        Raises:
+            ValueError: Si la cantidad de bytes no coincide con la forma.
+        """
+        filas, columnas = shape
+        plana = array(_codigo(dtype))
+        plana.frombytes(memoryview(datos).cast("B"))
+        if len(plana) != filas * columnas:
+            raise ValueError(
+                f"{len(plana)} elementos no alcanzan para la forma {shape}"
+            )
+        return cls(plana, (filas, columnas))
+
+    def __eq__(self, otra) -> bool:
+        if isinstance(otra, Matrix):
+            return self._shape == otra._shape and self._plana() == otra._plana()
+        if isinstance(otra, list):
+            return self.tolist() == otra
+        return NotImplemented
+
+    __hash__ = None  # Mutable, igual que list
+
+    def __repr__(self) -> str:
+        if self._codigo == "d":
+            return f"Matrix({self.tolist()!r})"
+        return f"Matrix({self.tolist()!r}, dtype={self.dtype!r})"
+
+
+def _vector(v: "Vector | Matrix"):
+    """Acepta una vista de una fila o columna como vector (sin copiar filas)."""
+    if isinstance(v, Matrix):
+        filas, columnas = v.shape
+        if filas == 1:
+            return v._fila(0)
+        if columnas == 1:
+            return v._columna(0)
+        raise ValueError(f"Se esperaba un vector y se recibió una matriz {v.shape}")
+    return v
+
+
+def _es_vector(x) -> bool:
+    """True si x es una secuencia plana de números y no una matriz."""
+    if isinstance(x, (Matrix, _Dispersa, MappedMatrix)):
+        return False
+    return not x or not hasattr(x[0], "__len__")
+
+
+def _filas(A: "Matriz | Matrix"):
+    """Devuelve las filas de A como secuencias indexables de flotantes."""
+    return list(A) if isinstance(A, Matrix) else A
+
+
+def _columnas(A: "Matriz | Matrix"):
+    """Devuelve las columnas de A como secuencias indexables de flotantes."""
+    if isinstance(A, Matrix):
+        return [A._columna(j) for j in range(A.shape[1])] if A.shape[0] else []
+    return list(zip(*A))
+
+
+def _desde_filas(filas, forma: tuple[int, int], codigo: str = "d") -> Matrix:
+    """Empaqueta un iterable de filas en una Matrix contigua de la forma dada."""
+    return Matrix(array(codigo, chain.from_iterable(filas)), forma)
+
+
+def _codigo(dtype) -> str:
+    """Typecode de array para un dtype ("float32", float, np.int64...)."""
+    if dtype is None:
+        return "d"
+    # Tipos de Python y de NumPy (float, np.float32) se reconocen por nombre
+    nombre = getattr(dtype, "__name__", None) or str(dtype)
+    try:
+        return _CODIGOS_DTYPE[nombre]
+    except KeyError:
+        raise ValueError(
+            f"dtype no soportado: {dtype!r} (use {', '.join(DTYPES)})"
+        ) from None
+
+
+def _codigo_de(x) -> str:
+    """Typecode con que está guardado x (las listas cuentan como float64)."""
+    if isinstance(x, Matrix):
+        return x._codigo
+    if isinstance(x, array):
+        return x.typecode
+    return "d"
+
+
+def _promover(*codigos: str) -> str:
+    """Typecode del resultado de combinar operandos con esos typecodes.
+
+    Igual que en NumPy: el mismo dtype se conserva y cualquier mezcla
+    (también float32 con int64) sube a float64, que representa a ambos.
+    """
+    primero = codigos[0]
+    return primero if all(codigo == primero for codigo in codigos) else "d"
+
+
+def _promover_escalar(codigo: str, c: float) -> str:
+    """Typecode de escalar una matriz: int64 por un float pasa a float64."""
+    return "d" if codigo == "q" and not isinstance(c, int) else codigo
+
+
+def _buffer(codigo: str, valores) -> array:
+    """array(codigo, valores); hacia int64 trunca los flotantes (astype)."""
+    if isinstance(valores, array) and valores.typecode == codigo:
+        return valores
+    if codigo == "q":
+        valores = map(int, valores)
+    return array(codigo, valores)
+
+
+def _comparte_memoria(out, *operandos) -> bool:
+    """True si out es alguno de los operandos o comparte su buffer o filas."""
+    for x in operandos:
+        if out is x:
+            return True
+        if isinstance(out, Matrix) and isinstance(x, Matrix):
+            if out._data is x._data:
+                return True
+        elif _es_lista_de_filas(out) and _es_lista_de_filas(x):
+            if any(map(_es, out, x)):
+                return True
+    return False
+
+
+def _es_lista_de_filas(x) -> bool:
+    return isinstance(x, list) and bool(x) and isinstance(x[0], list)
+
+
+def _validar_out(out, forma: tuple[int, ...]) -> None:
+    actual = (len(out),) if len(forma) == 1 else shape(out)
+    if actual != forma:
+        raise ValueError(f"out debe tener forma {forma} (tiene {actual})")
+
+
+def _escribir_vector(out, valores) -> Vector:
+    """Escribe valores en el vector out sin reemplazarlo."""
+    if isinstance(out, array):
+        out[:] = array(out.typecode, valores)
+    else:
+        out[:] = valores
+    return out
+
+
+def _escribir_filas(out, filas):
+    """Escribe un iterable de filas en out (Matriz o Matrix) sin reemplazarlo."""
+    if isinstance(out, Matrix):
+        for i, fila in enumerate(filas):
+            out._asignar_fila(i, fila)
+    else:
+        for destino, fila in zip(out, filas):
+            destino[:] = fila
+    return out
+
+
 # -------------------------------------------------------------------
 # Sección 1: Creación de Arrays (⭐ Básico)
 # -------------------------------------------------------------------
 
 
-def zeros(shape: tuple[int, int]) -> Matriz:
+def zeros(
+    shape: tuple[int, int], *, compacta: bool = False, dtype=None
+) -> Matriz | Matrix:
     """Crea una matriz rellena de ceros.
 
-    Equivalente en NumPy: np.zeros(shape)
+    Equivalente en NumPy: np.zeros(shape, dtype=dtype)
 
     Args:
         shape: Tupla (filas, columnas) que define las dimensiones.
+        compacta: Si True devuelve una Matrix en lugar de lista de listas.
+        dtype: "float64", "float32" o "int64". Si se indica, el resultado
+               es una Matrix con ese tipo de almacenamiento.
 
     Returns:
         Matriz: Una matriz de shape con valores 0.0.
 
-    Ejemplo:
+    Ejemplos:
         >>> zeros((2, 3))
         [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
 
+        >>> zeros((1, 2), dtype="int64")
+        Matrix([[0, 0]], dtype='int64')
+
     Pista: Usa listas por comprensión anidadas
     """
-    raise NotImplementedError("Función no implementada.")
+    if compacta or dtype is not None:
+        return Matrix.zeros(shape, dtype)
+    filas, columnas = shape
+    return [[0.0] * columnas for _ in range(filas)]
 
 
-def ones(shape: tuple[int, int]) -> Matriz:
+def ones(
+    shape: tuple[int, int], *, compacta: bool = False, dtype=None
+) -> Matriz | Matrix:
     """Crea una matriz rellena de unos.
 
-    Equivalente en NumPy: np.ones(shape)
+    Equivalente en NumPy: np.ones(shape, dtype=dtype)
 
     Args:
         shape: Tupla (filas, columnas) que define las dimensiones.
+        compacta: Si True devuelve una Matrix en lugar de lista de listas.
+        dtype: "float64", "float32" o "int64". Si se indica, el resultado
+               es una Matrix con ese tipo de almacenamiento.
 
     Returns:
         Matriz: Una matriz de shape con valores 1.0.
@@ -66,16 +696,22 @@ def ones(shape: tuple[int, int]) -> Matriz:
 
     Pista: Similar a zeros() pero con 1.0
     """
-    raise NotImplementedError("Función no implementada.")
+    if compacta or dtype is not None:
+        return Matrix.ones(shape, dtype)
+    filas, columnas = shape
+    return [[1.0] * columnas for _ in range(filas)]
 
 
-def identity(n: int) -> Matriz:
+def identity(n: int, *, compacta: bool = False, dtype=None) -> Matriz | Matrix:
     """Crea una matriz identidad cuadrada.
 
-    Equivalente en NumPy: np.identity(n)
+    Equivalente en NumPy: np.identity(n, dtype=dtype)
 
     Args:
         n: El tamaño (número de filas y columnas) de la matriz.
+        compacta: Si True devuelve una Matrix en lugar de lista de listas.
+        dtype: "float64", "float32" o "int64". Si se indica, el resultado
+               es una Matrix con ese tipo de almacenamiento.
 
     Returns:
         Matriz: Una matriz identidad de n x n.
@@ -88,7 +724,14 @@ def identity(n: int) -> Matriz:
 
     Pista: La diagonal tiene 1.0 cuando fila == columna
     """
-    raise NotImplementedError("Función no implementada.")
+    if compacta or dtype is not None:
+        return Matrix.identity(n, dtype)
+    if n in _IDENTIDAD_PEQUENA:
+        return _IDENTIDAD_PEQUENA[n]()
+    resultado = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        resultado[i][i] = 1.0
+    return resultado
 
 
 # -------------------------------------------------------------------
@@ -96,7 +739,7 @@ def identity(n: int) -> Matriz:
 # -------------------------------------------------------------------
 
 
-def shape(A: Matriz) -> tuple[int, int]:
+def shape(A: Matriz | Matrix) -> tuple[int, int]:
     """Devuelve las dimensiones de una matriz como (filas, columnas).
 
     Equivalente en NumPy: A.shape
@@ -113,10 +756,14 @@ def shape(A: Matriz) -> tuple[int, int]:
 
     Pista: len(A) da filas, len(A[0]) da columnas
     """
-    raise NotImplementedError("Función no implementada.")
+    if isinstance(A, (Matrix, _Dispersa, MappedMatrix)):
+        return A.shape
+    return (len(A), len(A[0]) if A else 0)
 
 
-def transpose(A: Matriz) -> Matriz:
+def transpose(
+    A: Matriz | Matrix, *, out: Matriz | Matrix | None = None
+) -> Matriz | Matrix:
     """Devuelve la transpuesta de una matriz A.
 
     La transpuesta intercambia filas por columnas: A_t[j][i] = A[i][j].
@@ -125,9 +772,14 @@ def transpose(A: Matriz) -> Matriz:
 
     Args:
         A: La matriz de entrada.
+        out: Matriz donde escribir la transpuesta (no puede ser A). Con
+             una MappedMatrix la transpuesta se escribe por teselas.
 
     Returns:
-        Matriz: La matriz transpuesta.
+        Matriz: La matriz transpuesta. Si A es Matrix se devuelve la vista
+        A.T, que comparte memoria con A (use .copy() para materializarla).
+        Si A es MappedMatrix y no se da out, el resultado va a un .npy
+        temporal.
 
     Ejemplo:
         >>> transpose([[1, 2, 3], [4, 5, 6]])
@@ -135,7 +787,25 @@ def transpose(A: Matriz) -> Matriz:
 
     Pista: Usa zip(*A) o listas por comprensión
     """
-    raise NotImplementedError("Función no implementada.")
+    if out is None and type(A) is list:
+        resultado = _pequena(_TRANSPOSE_PEQUENO, A)
+        if resultado is not None:
+            return resultado
+    if _es_perezosa(A):
+        return _nodo_transpuesta(A)
+    if _es_dispersa(A):
+        return _disperso_transpose(A)
+    if out is not None and _comparte_memoria(out, A):
+        raise ValueError("out no puede compartir memoria con A")
+    if _es_mapeada(A, out):
+        return _mapeada_transpose(A, out)
+    if out is not None:
+        filas, columnas = shape(A)
+        _validar_out(out, (columnas, filas))
+        return _escribir_filas(out, _columnas(A))
+    if isinstance(A, Matrix):
+        return A.T
+    return [list(columna) for columna in zip(*A)]
 
 
 # -------------------------------------------------------------------
@@ -151,11 +821,12 @@ def dot(v: Vector, w: Vector) -> float:
     Equivalente en NumPy: np.dot(v, w)
 
     Args:
-        v: El primer vector.
-        w: El segundo vector.
+        v: El primer vector (o una vista de fila/columna de una Matrix).
+        w: El segundo vector (o una vista de fila/columna de una Matrix).
 
     Returns:
-        float: El resultado del producto punto.
+        float: El resultado del producto punto (int exacto si ambos
+        vectores son int64, ver Matrix.dtype).
 
     Raises:
         ValueError: Si los vectores no tienen la misma dimensión.
@@ -166,20 +837,29 @@ def dot(v: Vector, w: Vector) -> float:
 
     Pista: Usa sum() y zip()
     """
-    raise NotImplementedError("Función no implementada.")
+    v, w = _vector(v), _vector(w)
+    if len(v) != len(w):
+        raise ValueError(
+            f"Los vectores deben tener la misma dimensión ({len(v)} != {len(w)})"
+        )
+    if _promover(_codigo_de(v), _codigo_de(w)) == "q":
+        # Con enteros de Python la suma de productos no redondea nunca
+        return int(_sumprod(v, w))
+    return float(_sumprod(v, w))
 
 
-def add(v: Vector, w: Vector) -> Vector:
+def add(v: Vector, w: Vector, *, out: Vector | None = None) -> Vector:
     """Suma dos vectores elemento a elemento.
 
-    Equivalente en NumPy: v + w
+    Equivalente en NumPy: v + w (o np.add(v, w, out=out))
 
     Args:
         v: El primer vector.
         w: El segundo vector.
+        out: Vector donde escribir el resultado en lugar de crear uno nuevo.
 
     Returns:
-        Vector: El vector resultante de la suma.
+        Vector: El vector resultante de la suma (out si se indicó).
 
     Raises:
         ValueError: Si los vectores no tienen la misma dimensión.
@@ -190,20 +870,30 @@ def add(v: Vector, w: Vector) -> Vector:
 
     Pista: Usa listas por comprensión con zip()
     """
-    raise NotImplementedError("Función no implementada.")
+    if _es_perezosa(v, w):
+        return _nodo_suma(v, w)
+    if len(v) != len(w):
+        raise ValueError(
+            f"Los vectores deben tener la misma dimensión ({len(v)} != {len(w)})"
+        )
+    if out is not None:
+        _validar_out(out, (len(v),))
+        return _escribir_vector(out, map(float, map(_suma, v, w)))
+    return list(map(float, map(_suma, v, w)))
 
 
-def multiply(c: float, v: Vector) -> Vector:
+def multiply(c: float, v: Vector, *, out: Vector | None = None) -> Vector:
     """Multiplica cada elemento de un vector por un escalar.
 
-    Equivalente en NumPy: c * v
+    Equivalente en NumPy: c * v (o np.multiply(c, v, out=out))
 
     Args:
         c: El escalar.
         v: El vector.
+        out: Vector donde escribir el resultado en lugar de crear uno nuevo.
 
     Returns:
-        Vector: El vector resultante escalado.
+        Vector: El vector resultante escalado (out si se indicó).
 
     Ejemplo:
         >>> multiply(2.5, [1, 2, 3])
@@ -211,7 +901,33 @@ def multiply(c: float, v: Vector) -> Vector:
 
     Pista: Multiplica c por cada elemento
     """
-    raise NotImplementedError("Función no implementada.")
+    if _es_perezosa(v):
+        return _nodo_escala(c, v)
+    if out is not None:
+        _validar_out(out, (len(v),))
+        return _escribir_vector(out, map(float, map(_producto, repeat(c), v)))
+    return list(map(float, map(_producto, repeat(c), v)))
+
+
+def iadd(v: Vector, w: Vector) -> Vector:
+    """Suma w a v en su lugar (v += w) sin crear un vector nuevo.
+
+    Equivalente en NumPy: v += w
+
+    Ejemplo:
+        >>> v = [1.0, 2.0]
+        >>> iadd(v, [3, 4])
+        [4.0, 6.0]
+    """
+    return add(v, w, out=v)
+
+
+def imultiply(c: float, v: Vector) -> Vector:
+    """Escala v en su lugar (v *= c) sin crear un vector nuevo.
+
+    Equivalente en NumPy: v *= c
+    """
+    return multiply(c, v, out=v)
 
 
 def norm(v: Vector) -> float:
@@ -222,7 +938,8 @@ def norm(v: Vector) -> float:
     Equivalente en NumPy: np.linalg.norm(v)
 
     Args:
-        v: El vector.
+        v: El vector (o una matriz dispersa, de la que se da la norma de
+           Frobenius).
 
     Returns:
         float: La magnitud del vector.
@@ -233,7 +950,9 @@ def norm(v: Vector) -> float:
 
     Pista: Usa dot(v, v) y luego sqrt() del módulo math
     """
-    raise NotImplementedError("Función no implementada.")
+    if _es_dispersa(v):
+        return _disperso_norm(v)
+    return math.sqrt(dot(v, v))
 
 
 # -------------------------------------------------------------------
@@ -241,17 +960,29 @@ def norm(v: Vector) -> float:
 # -------------------------------------------------------------------
 
 
-def add_matrices(A: Matriz, B: Matriz) -> Matriz:
+def add_matrices(
+    A: Matriz | Matrix,
+    B: Matriz | Matrix,
+    *,
+    workers: int | None = None,
+    out: Matriz | Matrix | None = None,
+) -> Matriz | Matrix:
     """Suma dos matrices elemento a elemento.
 
-    Equivalente en NumPy: A + B
+    Equivalente en NumPy: A + B (o np.add(A, B, out=out))
 
     Args:
         A: La primera matriz.
         B: La segunda matriz.
+        workers: Procesos a usar (None = PROCESOS, <= 0 = todos los núcleos).
+        out: Matriz donde escribir el resultado (puede ser A o B). Si algún
+             operando u out es MappedMatrix se trabaja por teselas; sin out
+             el resultado va a un .npy temporal.
 
     Returns:
-        Matriz: La matriz resultante de la suma.
+        Matriz: La matriz resultante de la suma (Matrix si alguna lo es, out
+        si se indicó). Dos Matrix del mismo dtype lo conservan; cualquier
+        mezcla de dtypes (o con listas) da float64.
 
     Raises:
         ValueError: Si las matrices no tienen la misma forma.
@@ -262,20 +993,66 @@ def add_matrices(A: Matriz, B: Matriz) -> Matriz:
 
     Pista: Suma elemento a elemento, fila por fila
     """
-    raise NotImplementedError("Función no implementada.")
+    if _es_perezosa(A, B):
+        return _nodo_suma(A, B)
+    if _es_dispersa(A, B):
+        return _disperso_suma(A, B)
+    if shape(A) != shape(B):
+        raise ValueError(
+            f"Las matrices deben tener la misma forma ({shape(A)} != {shape(B)})"
+        )
+    if _es_mapeada(A, B, out):
+        return _mapeada_elemento(add_matrices, A, B, out)
+    if out is not None:
+        _validar_out(out, shape(A))
+    codigo = _promover(_codigo_de(A), _codigo_de(B))
+    procesos = _paralelizar(workers, shape(A)[0] * shape(A)[1])
+    # int64 se suma en serie y exacto: los núcleos paralelos usan float64
+    if procesos and codigo != "q":
+        resultado = _suma_paralela(A, B, procesos)
+        return resultado if out is None else _escribir_filas(out, resultado)
+    if isinstance(A, Matrix) and isinstance(B, Matrix) and isinstance(out, Matrix):
+        # Fila por fila: la memoria extra es una fila, no otra matriz
+        for i, (fa, fb) in enumerate(zip(A, B)):
+            out._asignar_fila(i, array(codigo, map(_suma, fa, fb)))
+        return out
+    if out is not None:
+        # Mismos tipos que sin out: float, o int si el resultado es int64
+        convertir = int if codigo == "q" else float
+        filas = (
+            map(convertir, map(_suma, fa, fb)) for fa, fb in zip(_filas(A), _filas(B))
+        )
+        return _escribir_filas(out, filas)
+    if isinstance(A, Matrix) or isinstance(B, Matrix):
+        A, B = Matrix.from_lists(A), Matrix.from_lists(B)
+        data = array(codigo, map(_suma, A._plana(), B._plana()))
+        return Matrix(data, A.shape)
+    return [list(map(float, map(_suma, fa, fb))) for fa, fb in zip(A, B)]
 
 
-def multiply_matrix(c: float, A: Matriz) -> Matriz:
+def multiply_matrix(
+    c: float,
+    A: Matriz | Matrix,
+    *,
+    workers: int | None = None,
+    out: Matriz | Matrix | None = None,
+) -> Matriz | Matrix:
     """Multiplica cada elemento de una matriz por un escalar.
 
-    Equivalente en NumPy: c * A
+    Equivalente en NumPy: c * A (o np.multiply(c, A, out=out))
 
     Args:
         c: El escalar.
         A: La matriz.
+        workers: Procesos a usar (None = PROCESOS, <= 0 = todos los núcleos).
+        out: Matriz donde escribir el resultado (puede ser A). Si A u out
+             es MappedMatrix se trabaja por teselas; sin out el resultado
+             va a un .npy temporal.
 
     Returns:
-        Matriz: La matriz resultante escalada.
+        Matriz: La matriz resultante escalada (Matrix si A es Matrix, out si
+        se indicó). Conserva el dtype de A, salvo int64 por un escalar no
+        entero, que da float64.
 
     Ejemplo:
         >>> multiply_matrix(2, [[1, 2], [3, 4]])
@@ -283,10 +1060,159 @@ def multiply_matrix(c: float, A: Matriz) -> Matriz:
 
     Pista: Similar a multiply() pero para cada fila
     """
-    raise NotImplementedError("Función no implementada.")
+    if _es_perezosa(A):
+        return _nodo_escala(c, A)
+    if _es_dispersa(A):
+        return _disperso_escala(c, A)
+    if _es_mapeada(A, out):
+        return _mapeada_elemento(
+            lambda tesela, _: multiply_matrix(c, tesela), A, None, out
+        )
+    if out is not None:
+        _validar_out(out, shape(A))
+    codigo = _promover_escalar(_codigo_de(A), c)
+    procesos = _paralelizar(workers, shape(A)[0] * shape(A)[1])
+    if procesos and codigo != "q":
+        resultado = _escala_paralela(c, A, procesos)
+        return resultado if out is None else _escribir_filas(out, resultado)
+    if isinstance(A, Matrix) and isinstance(out, Matrix):
+        for i, fila in enumerate(A):
+            out._asignar_fila(i, array(codigo, map(_producto, repeat(c), fila)))
+        return out
+    if out is not None:
+        convertir = int if codigo == "q" else float
+        filas = (map(convertir, map(_producto, repeat(c), fila)) for fila in _filas(A))
+        return _escribir_filas(out, filas)
+    if isinstance(A, Matrix):
+        data = array(codigo, map(_producto, repeat(c), A._plana()))
+        return Matrix(data, A.shape)
+    return [multiply(c, fila) for fila in A]
+
+
+def iadd_matrices(A: Matriz | Matrix, B: Matriz | Matrix) -> Matriz | Matrix:
+    """Suma B a A en su lugar (A += B) sin crear una matriz nueva.
+
+    Equivalente en NumPy: A += B
+
+    Ejemplo:
+        >>> A = [[1.0, 2.0], [3.0, 4.0]]
+        >>> iadd_matrices(A, [[1, 1], [1, 1]])
+        [[2.0, 3.0], [4.0, 5.0]]
+    """
+    return add_matrices(A, B, out=A)
+
+
+def imultiply_matrix(c: float, A: Matriz | Matrix) -> Matriz | Matrix:
+    """Escala A en su lugar (A *= c) sin crear una matriz nueva.
+
+    Equivalente en NumPy: A *= c
+    """
+    return multiply_matrix(c, A, out=A)
+
+
+def _matmul_bloques(
+    filas_a,
+    columnas_b,
+    resultado: Matriz | None = None,
+    tamano: int | None = None,
+    convertir=float,
+) -> Matriz:
+    """Producto por bloques de A (por filas) con B (ya transpuesta).
+
+    Los bloques de TAMANO_BLOQUE (o tamano) columnas de B se reutilizan para
+    todas las filas de A antes de pasar al siguiente bloque, así se
+    mantienen en caché. Si se da resultado (lista de listas m x p), se
+    escribe ahí. Cada elemento pasa por convertir (int para int64).
+    """
+    p = len(columnas_b)
+    tamano = tamano or TAMANO_BLOQUE
+    if resultado is None:
+        resultado = [[convertir(0)] * p for _ in filas_a]
+    for j0 in range(0, p, tamano):
+        bloque = columnas_b[j0 : j0 + tamano]
+        j1 = j0 + len(bloque)
+        for fila_c, fila_a in zip(resultado, filas_a):
+            fila_c[j0:j1] = [convertir(_sumprod(fila_a, col)) for col in bloque]
+    return resultado
+
+
+def _sumar_bloques(X: Matriz, Y: Matriz) -> Matriz:
+    return [list(map(_suma, x, y)) for x, y in zip(X, Y)]
+
+
+def _restar_bloques(X: Matriz, Y: Matriz) -> Matriz:
+    return [list(map(_resta, x, y)) for x, y in zip(X, Y)]
+
+
+def _cuadrantes(M: Matriz, h_filas: int, h_columnas: int):
+    superior, inferior = M[:h_filas], M[h_filas:]
+    return (
+        [f[:h_columnas] for f in superior],
+        [f[h_columnas:] for f in superior],
+        [f[:h_columnas] for f in inferior],
+        [f[h_columnas:] for f in inferior],
+    )
+
+
+def _strassen(
+    A: Matriz, Bt: Matriz, umbral: int | None = None, convertir=float
+) -> Matriz:
+    """Producto A @ B por Strassen, recibiendo B ya transpuesta (Bt).
+
+    Trabajar con Bt evita transponer en cada nivel: los cuadrantes de Bt
+    son las transpuestas de los de B con B12 y B21 intercambiados, y la
+    suma conmuta con la transpuesta. La recursión baja hasta que alguna
+    dimensión es menor que umbral (UMBRAL_STRASSEN por defecto). Con
+    convertir=int solo hay sumas y productos de enteros: es exacto.
+    """
+    umbral = umbral or UMBRAL_STRASSEN
+    m, n, p = len(A), len(A[0]), len(Bt)
+    if builtins.min(m, n, p) < umbral:
+        return _matmul_bloques(A, Bt, convertir=convertir)
+
+    # Rellenar con ceros para que todas las dimensiones sean pares
+    cero = convertir(0)
+    if n % 2:
+        A = [list(f) + [cero] for f in A]
+        Bt = [list(f) + [cero] for f in Bt]
+    if m % 2:
+        A = A + [[cero] * len(A[0])]
+    if p % 2:
+        Bt = Bt + [[cero] * len(Bt[0])]
+    hm, hn, hp = len(A) // 2, len(A[0]) // 2, len(Bt) // 2
+
+    A11, A12, A21, A22 = _cuadrantes(A, hm, hn)
+    B11, B21, B12, B22 = _cuadrantes(Bt, hp, hn)  # transpuestos
+
+    def producto(X, Y):
+        return _strassen(X, Y, umbral, convertir)
+
+    M1 = producto(_sumar_bloques(A11, A22), _sumar_bloques(B11, B22))
+    M2 = producto(_sumar_bloques(A21, A22), B11)
+    M3 = producto(A11, _restar_bloques(B12, B22))
+    M4 = producto(A22, _restar_bloques(B21, B11))
+    M5 = producto(_sumar_bloques(A11, A12), B22)
+    M6 = producto(_restar_bloques(A21, A11), _sumar_bloques(B11, B12))
+    M7 = producto(_restar_bloques(A12, A22), _sumar_bloques(B21, B22))
+
+    C11 = _sumar_bloques(_restar_bloques(_sumar_bloques(M1, M4), M5), M7)
+    C12 = _sumar_bloques(M3, M5)
+    C21 = _sumar_bloques(M2, M4)
+    C22 = _sumar_bloques(_sumar_bloques(_restar_bloques(M1, M2), M3), M6)
+
+    superior = [c1 + c2 for c1, c2 in zip(C11, C12)]
+    inferior = [c1 + c2 for c1, c2 in zip(C21, C22)]
+    return [fila[:p] for fila in (superior + inferior)[:m]]
 
 
-def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
+def matmul(
+    A: Matriz | Matrix,
+    B: Matriz | Matrix | Vector,
+    *,
+    workers: int | None = None,
+    out: Matriz | Matrix | Vector | None = None,
+    cache: bool = False,
+) -> Matriz | Matrix | Vector:
     """Multiplica una matriz A por una matriz B o vector v.
 
     Regla: El número de columnas de A debe ser igual al número de
@@ -297,9 +1223,21 @@ def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
     Args:
         A: La matriz izquierda (m × n).
         B: La matriz derecha (n × p) o vector (n).
+        workers: Procesos a usar (None = PROCESOS, <= 0 = todos los núcleos).
+        out: Destino del resultado. No puede ser A ni B, porque se
+             seguirían leyendo mientras se sobrescribe. Si algún operando u
+             out es MappedMatrix, el producto se hace por teselas (ver
+             TAMANO_TESELA); sin out el resultado va a un .npy temporal.
+        cache: Con la caché activa (ver enable_cache), guardar y reutilizar
+               el producto de dos matrices (sin out) según la huella de A y
+               B. Solo conviene con operandos que no cambian entre
+               llamadas: la huella cuesta O(n²) en cada llamada.
 
     Returns:
         Matriz (m × p) o Vector (m): El resultado de la multiplicación.
+        Si A o B es Matrix, el producto matriz-matriz es una Matrix con el
+        dtype común de ambas (float64 si difieren, ver Matrix). Si se
+        indicó out, se devuelve out.
 
     Raises:
         ValueError: Si las dimensiones no son compatibles.
@@ -313,8 +1251,99 @@ def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
 
     Pista: Para matrices, cada elemento resultado[i][j] es el
            producto punto de la fila i de A con la columna j de B
+
+    Rendimiento:
+        B se transpone una sola vez y las columnas se procesan en bloques
+        de TAMANO_BLOQUE. Si m, n y p son todos >= UMBRAL_STRASSEN se usa
+        la recursión de Strassen (7 productos en lugar de 8 por nivel).
+        Con varios procesos y m*n*p >= UMBRAL_PARALELO, las filas de A se
+        reparten en bloques entre procesos que leen A, B.T y escriben el
+        resultado en memoria compartida. Con AUTOAJUSTE activo (y sin
+        workers), el núcleo se elige cronometrando los candidatos.
+        Con dos Matrix int64 todo se calcula en serie con enteros de
+        Python: exacto y sin pasar por float.
+        Las matrices 2x2, 3x3 y 4x4 en listas van a núcleos desenrollados
+        (ver batch_matmul para aplicarlos a muchas matrices).
     """
-    raise NotImplementedError("Función no implementada.")
+    if out is None and workers is None and type(A) is list and type(B) is list:
+        if len(A) == len(B):
+            resultado = _pequena(_MATMUL_PEQUENO, A, B)
+            if resultado is not None:
+                return resultado
+    if _es_perezosa(A, B):
+        return _nodo_matmul(A, B)
+    if _es_dispersa(A, B):
+        return _disperso_matmul(A, B)
+    m, n = shape(A)
+    es_vector = _es_vector(B)
+    if out is not None and _comparte_memoria(out, A, B):
+        raise ValueError("out no puede compartir memoria con A ni con B")
+    if _es_mapeada(A, B, out):
+        return _mapeada_matmul(A, B, out)
+
+    if es_vector:
+        if n != len(B):
+            raise ValueError(
+                f"Dimensiones incompatibles: A es {m}x{n} y v tiene {len(B)} elementos"
+            )
+        convertir = int if _promover(_codigo_de(A), _codigo_de(B)) == "q" else float
+        productos = (convertir(_sumprod(fila, B)) for fila in _filas(A))
+        if out is not None:
+            _validar_out(out, (m,))
+            return _escribir_vector(out, productos)
+        return list(productos)
+
+    n_b, p = shape(B)
+    if n != n_b:
+        raise ValueError(f"Dimensiones incompatibles: A es {m}x{n} y B es {n_b}x{p}")
+    if out is not None:
+        _validar_out(out, (m, p))
+
+    if cache and _CACHE is not None and out is None:
+        return _CACHE.obtener(
+            ("matmul", _huella(A), _huella(B)),
+            lambda: _matmul_denso(A, B, (m, n, p), workers, None),
+        )
+    return _matmul_denso(A, B, (m, n, p), workers, out)
+
+
+def _matmul_denso(A, B, dims: tuple[int, int, int], workers, out):
+    """Elige y ejecuta el núcleo de matmul para dos matrices ya validadas."""
+    m, n, p = dims
+    codigo = _promover(_codigo_de(A), _codigo_de(B))
+    # int64 va siempre al camino exacto en serie; el autoajuste y los
+    # núcleos paralelos calculan en float64
+    exacto = codigo == "q"
+    autoajustar = AUTOAJUSTE and workers is None and n and not exacto
+    if autoajustar and m * n * p >= UMBRAL_AUTOAJUSTE:
+        resultado = _matmul_autoajustado(A, B, (m, n, p))
+        return resultado if out is None else _escribir_filas(out, resultado)
+
+    procesos = _paralelizar(workers, m * n * p)
+    if procesos and not exacto:
+        resultado = _matmul_paralelo(A, B, procesos)
+        return resultado if out is None else _escribir_filas(out, resultado)
+
+    convertir = int if exacto else float
+    if n == 0:
+        resultado = [[convertir(0)] * p for _ in range(m)]
+    else:
+        # Se transpone B una sola vez para recorrer sus columnas como filas
+        columnas_b = _columnas(B)
+        filas_a = _filas(A)
+        if builtins.min(m, n, p) >= UMBRAL_STRASSEN:
+            resultado = _strassen(filas_a, columnas_b, convertir=convertir)
+        elif out is not None and not isinstance(out, Matrix):
+            # Las filas de out se rellenan directamente, sin matriz temporal
+            return _matmul_bloques(filas_a, columnas_b, out, convertir=convertir)
+        else:
+            resultado = _matmul_bloques(filas_a, columnas_b, convertir=convertir)
+
+    if out is not None:
+        return _escribir_filas(out, resultado)
+    if isinstance(A, Matrix) or isinstance(B, Matrix):
+        return _desde_filas(resultado, (m, p), codigo)
+    return resultado
 
 
 # -------------------------------------------------------------------
@@ -322,7 +1351,7 @@ def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
 # -------------------------------------------------------------------
 
 
-def det(A: Matriz) -> float:
+def det(A: Matriz | Matrix) -> float:
     """Calcula el determinante de una matriz cuadrada.
 
     NOTA: Esta es la función más difícil. Es opcional pero da puntos extra.
@@ -331,12 +1360,14 @@ def det(A: Matriz) -> float:
         det([[a, b], [c, d]]) = a*d - b*c
 
     Para matriz 3×3 y mayores:
-        Usa expansión de cofactores (recursivo) o eliminación gaussiana.
+        Se usa la factorización LU: det(A) = signo(P) * producto de la
+        diagonal de U. Es O(n³), a diferencia de la expansión de cofactores
+        que es O(n!) y no termina con matrices de 100x100.
 
     Equivalente en NumPy: np.linalg.det(A)
 
     Args:
-        A: La matriz cuadrada.
+        A: La matriz cuadrada (o una factorización LU ya calculada).
 
     Returns:
         float: El valor del determinante.
@@ -354,6 +1385,3433 @@ def det(A: Matriz) -> float:
     Pistas:
     - Caso base: matriz 1×1 devuelve el único elemento
     - Caso 2×2: usa la fórmula directa
-    - Caso 3×3+: expansión por primera fila (recursivo)
+    - Caso 3×3+: eliminación gaussiana con pivoteo parcial (ver lu())
+
+    Rendimiento:
+        Hasta 4x4 (en listas) se usan fórmulas cerradas desenrolladas.
+    """
+    if type(A) is list:
+        resultado = _pequena(_DET_PEQUENO, A)
+        if resultado is not None:
+            return resultado
+    return _factorizar(A).det()
+
+
+class LU:
+    """Factorización PA = LU con pivoteo parcial, reutilizable.
+
+    Factorizar cuesta O(n³); cada solve posterior cuesta solo O(n²), así
+    que conviene guardar el objeto cuando se resuelven muchos sistemas con
+    la misma matriz.
+
+    L (triangular inferior con diagonal de unos) y U (triangular superior)
+    se guardan juntas en una sola matriz, como hace LAPACK.
+
+    Ejemplo:
+        >>> F = lu([[4, 3], [6, 3]])
+        >>> F.solve([10, 12])
+        [1.0, 2.0]
+        >>> F.det()
+        -6.0
+    """
+
+    __slots__ = ("_lu", "_perm", "_signo", "_singular", "_compacta")
+
+    def __init__(self, A: Matriz | Matrix):
+        n, columnas = shape(A)
+        if n != columnas:
+            raise ValueError(f"La matriz debe ser cuadrada (es {n}x{columnas})")
+
+        filas = [list(map(float, fila)) for fila in _filas(A)]
+        perm = list(range(n))
+        signo = 1.0
+        singular = False
+        for k in range(n):
+            pivote = builtins.max(range(k, n), key=lambda i: abs(filas[i][k]))
+            if filas[pivote][k] == 0.0:
+                singular = True
+                continue
+            if pivote != k:
+                filas[k], filas[pivote] = filas[pivote], filas[k]
+                perm[k], perm[pivote] = perm[pivote], perm[k]
+                signo = -signo
+            fila_k = filas[k]
+            diagonal = fila_k[k]
+            cola_k = fila_k[k + 1 :]
+            for fila_i in filas[k + 1 :]:
+                factor = fila_i[k] / diagonal
+                fila_i[k] = factor
+                if factor:
+                    fila_i[k + 1 :] = map(
+                        _suma, fila_i[k + 1 :], map(_producto, repeat(-factor), cola_k)
+                    )
+
+        self._lu = filas
+        self._perm = perm
+        self._signo = signo
+        self._singular = singular
+        self._compacta = isinstance(A, Matrix)
+
+    @property
+    def n(self) -> int:
+        """Dimensión de la matriz factorizada."""
+        return len(self._lu)
+
+    @property
+    def perm(self) -> list[int]:
+        """Permutación de filas: la fila i de PA es la fila perm[i] de A."""
+        return list(self._perm)
+
+    @property
+    def L(self) -> Matriz:
+        """Factor triangular inferior con diagonal de unos."""
+        n = self.n
+        return [
+            fila[:i] + [1.0] + [0.0] * (n - i - 1) for i, fila in enumerate(self._lu)
+        ]
+
+    @property
+    def U(self) -> Matriz:
+        """Factor triangular superior."""
+        return [[0.0] * i + fila[i:] for i, fila in enumerate(self._lu)]
+
+    def det(self) -> float:
+        """Determinante: signo de la permutación por la diagonal de U."""
+        if self._singular:
+            return 0.0
+        resultado = self._signo
+        for i, fila in enumerate(self._lu):
+            resultado *= fila[i]
+        return resultado
+
+    def solve(self, b: Vector) -> Vector:
+        """Resuelve A x = b en O(n²) usando la factorización.
+
+        Raises:
+            ValueError: Si b no tiene n elementos o A es singular.
+        """
+        n = self.n
+        if len(b) != n:
+            raise ValueError(f"b debe tener {n} elementos (tiene {len(b)})")
+        if self._singular:
+            raise ValueError(
+                "La matriz es singular; el sistema no tiene solución única"
+            )
+
+        # Sustitución hacia adelante: L y = P b
+        y = [float(b[p]) for p in self._perm]
+        for i, fila in enumerate(self._lu):
+            if i:
+                y[i] -= _sumprod(fila[:i], y[:i])
+        # Sustitución hacia atrás: U x = y
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            fila = self._lu[i]
+            x[i] = (y[i] - _sumprod(fila[i + 1 :], x[i + 1 :])) / fila[i]
+        return x
+
+    def solve_many(self, B: Matriz | Matrix) -> Matriz | Matrix:
+        """Resuelve A X = B para cada columna de B (n x k).
+
+        Returns:
+            Matriz: X de n x k (Matrix si B es Matrix).
+        """
+        n_b, k = shape(B)
+        if n_b != self.n:
+            raise ValueError(f"B debe tener {self.n} filas (tiene {n_b})")
+        soluciones = [self.solve(columna) for columna in _columnas(B)]
+        if k:
+            filas = [list(fila) for fila in zip(*soluciones)]
+        else:
+            filas = [[] for _ in range(n_b)]
+        if isinstance(B, Matrix):
+            return _desde_filas(filas, (n_b, k))
+        return filas
+
+    def inv(self) -> Matriz | Matrix:
+        """Inversa de A resolviendo A X = I (Matrix si A era Matrix)."""
+        return self.solve_many(identity(self.n, compacta=self._compacta))
+
+
+def _factorizar(A: "Matriz | Matrix | LU") -> LU:
+    """Devuelve A si ya es una factorización, o la calcula (o la toma de caché)."""
+    if isinstance(A, LU):
+        return A
+    if _CACHE is not None:
+        return _CACHE.obtener(("lu", _huella(A)), lambda: LU(A))
+    return LU(A)
+
+
+def lu(A: Matriz | Matrix) -> LU:
+    """Factoriza una matriz cuadrada como PA = LU con pivoteo parcial.
+
+    Equivalente en SciPy: scipy.linalg.lu_factor(A)
+
+    Args:
+        A: La matriz cuadrada.
+
+    Returns:
+        LU: Factorización reutilizable con det(), solve(), solve_many() e inv().
+
+    Raises:
+        ValueError: Si la matriz no es cuadrada.
+
+    Ejemplo:
+        >>> F = lu([[1, 2], [3, 4]])
+        >>> F.U
+        [[3.0, 4.0], [0.0, 0.6666666666666667]]
+    """
+    return _factorizar(A)
+
+
+def solve(A: Matriz | Matrix | LU, b: Vector) -> Vector:
+    """Resuelve el sistema lineal A x = b.
+
+    Equivalente en NumPy: np.linalg.solve(A, b)
+
+    Args:
+        A: La matriz cuadrada, o una factorización LU para no repetirla.
+        b: El vector del lado derecho.
+
+    Returns:
+        Vector: La solución x.
+
+    Raises:
+        ValueError: Si las dimensiones no coinciden o A es singular.
+
+    Ejemplo:
+        >>> solve([[2, 0], [0, 4]], [2, 8])
+        [1.0, 2.0]
+    """
+    return _factorizar(A).solve(b)
+
+
+def solve_many(A: Matriz | Matrix | LU, B: Matriz | Matrix) -> Matriz | Matrix:
+    """Resuelve A X = B para varias columnas del lado derecho a la vez.
+
+    La factorización O(n³) se hace una sola vez; cada columna cuesta O(n²).
+
+    Equivalente en NumPy: np.linalg.solve(A, B)
+
+    Args:
+        A: La matriz cuadrada (n x n), o una factorización LU.
+        B: Matriz n x k cuyas columnas son los lados derechos.
+
+    Returns:
+        Matriz: La solución X (n x k).
+
+    Raises:
+        ValueError: Si las dimensiones no coinciden o A es singular.
+    """
+    return _factorizar(A).solve_many(B)
+
+
+def inv(A: Matriz | Matrix | LU) -> Matriz | Matrix:
+    """Calcula la inversa de una matriz cuadrada.
+
+    Equivalente en NumPy: np.linalg.inv(A)
+
+    Args:
+        A: La matriz cuadrada, o una factorización LU.
+
+    Returns:
+        Matriz: La inversa de A.
+
+    Raises:
+        ValueError: Si A no es cuadrada o es singular.
+
+    Ejemplo:
+        >>> inv([[2, 0], [0, 4]])
+        [[0.5, 0.0], [0.0, 0.25]]
     """
-    raise NotImplementedError("Función no implementada.")
+    if _CACHE is not None and not isinstance(A, LU):
+        return _CACHE.obtener(("inv", _huella(A)), lambda: _factorizar(A).inv())
+    return _factorizar(A).inv()
+
+
+def matrix_power(A: Matriz | Matrix, k: int) -> Matriz | Matrix:
+    """Eleva una matriz cuadrada a la potencia entera k.
+
+    Usa exponenciación binaria: A^13 = A^8 · A^4 · A^1, así que hace
+    O(log k) productos en lugar de k - 1.
+
+    Equivalente en NumPy: np.linalg.matrix_power(A, k)
+
+    Args:
+        A: La matriz cuadrada.
+        k: Exponente entero. k = 0 da la identidad; k < 0 usa la inversa.
+
+    Returns:
+        Matriz: A^k (Matrix si A es Matrix).
+
+    Raises:
+        ValueError: Si A no es cuadrada (o es singular con k < 0).
+
+    Ejemplo:
+        >>> matrix_power([[1, 1], [1, 0]], 10)  # Fibonacci
+        [[89.0, 55.0], [55.0, 34.0]]
+    """
+    n, columnas = shape(A)
+    if n != columnas:
+        raise ValueError(f"La matriz debe ser cuadrada (es {n}x{columnas})")
+    if k < 0:
+        A, k = inv(A), -k
+    resultado = None
+    potencia = A
+    while k:
+        if k & 1:
+            resultado = potencia if resultado is None else matmul(resultado, potencia)
+        k >>= 1
+        if k:
+            potencia = matmul(potencia, potencia)
+    if resultado is None:
+        return identity(n, compacta=isinstance(A, Matrix))
+    if resultado is A:
+        return A.copy() if isinstance(A, Matrix) else [list(map(float, f)) for f in A]
+    return resultado
+
+
+def _preparar_iterativo(A, b: "Vector | None" = None):
+    """Valida A (cuadrada) y b; las dispersas pasan a CSR una sola vez."""
+    if isinstance(A, _Dispersa):
+        A = A.tocsr()
+    n, columnas = shape(A)
+    if n != columnas:
+        raise ValueError(f"La matriz debe ser cuadrada (es {n}x{columnas})")
+    if b is not None and len(b) != n:
+        raise ValueError(f"b debe tener {n} elementos (tiene {len(b)})")
+    return A, n
+
+
+def _validar_max_iter(max_iter: int) -> None:
+    if max_iter < 0:
+        raise ValueError(f"max_iter debe ser >= 0 (es {max_iter})")
+
+
+def _diagonal(A, n: int) -> Vector:
+    if isinstance(A, CSRMatrix):
+        diagonal = [0.0] * n
+        for i, (indices, valores) in enumerate(A._tramos()):
+            for j, x in zip(indices, valores):
+                if j == i:
+                    diagonal[i] += x
+        return diagonal
+    if isinstance(A, Matrix):
+        return [A[i, i] for i in range(n)]
+    return [float(A[i][i]) for i in range(n)]
+
+
+def _info(iteraciones: int, residuo: float, convergio: bool) -> dict:
+    """Estadísticas de convergencia de los métodos iterativos."""
+    return {"iteraciones": iteraciones, "residuo": residuo, "convergio": convergio}
+
+
+def power_iteration(
+    A,
+    *,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    x0: Vector | None = None,
+) -> tuple[float, Vector, dict]:
+    """Aproxima el autovalor dominante (mayor en módulo) y su autovector.
+
+    Repite x <- A x / ||A x||. Cada paso es un solo producto matriz-vector,
+    así que funciona con matrices grandes y dispersas (CSR/COO/CSC) donde
+    factorizar no es posible: cadenas de Markov, PageRank, etc.
+
+    Args:
+        A: Matriz cuadrada (lista, Matrix o dispersa).
+        tol: Se detiene cuando ||A x - λ x|| <= tol * max(|λ|, 1).
+        max_iter: Máximo de iteraciones.
+        x0: Vector inicial (por defecto, uno fijo de componentes positivas).
+
+    Returns:
+        tuple: (autovalor, autovector de norma 1, info) con info =
+               {"iteraciones", "residuo", "convergio"}.
+
+    Raises:
+        ValueError: Si A no es cuadrada o max_iter es negativo.
+
+    Ejemplo:
+        >>> valor, vector, info = power_iteration([[2, 0], [0, 1]])
+        >>> round(valor, 6), info["convergio"]
+        (2.0, True)
+    """
+    A, n = _preparar_iterativo(A)
+    _validar_max_iter(max_iter)
+    if x0 is None:
+        rng = random.Random(0)
+        x0 = [rng.uniform(0.5, 1.5) for _ in range(n)]
+    escala = norm(x0) or 1.0
+    x = [v / escala for v in x0]
+    valor = residuo = 0.0
+    iteracion = 0  # con max_iter=0 se devuelve x0 normalizado sin iterar
+    for iteracion in range(1, max_iter + 1):
+        y = matmul(A, x)
+        valor = dot(x, y)  # cociente de Rayleigh (x tiene norma 1)
+        residuo = norm([yi - valor * xi for yi, xi in zip(y, x)])
+        if residuo <= tol * builtins.max(abs(valor), 1.0):
+            return valor, x, _info(iteracion, residuo, True)
+        largo = norm(y)
+        if largo == 0.0:  # x cayó en el núcleo de A
+            break
+        x = [yi / largo for yi in y]
+    return valor, x, _info(iteracion, residuo, False)
+
+
+def conjugate_gradient(
+    A,
+    b: Vector,
+    *,
+    tol: float = 1e-10,
+    max_iter: int | None = None,
+    x0: Vector | None = None,
+) -> tuple[Vector, dict]:
+    """Resuelve A x = b por gradiente conjugado (A simétrica definida positiva).
+
+    Solo necesita productos A·p, así que sirve para sistemas grandes y
+    dispersos que no conviene factorizar. En aritmética exacta converge en
+    a lo sumo n pasos.
+
+    Args:
+        A: Matriz simétrica definida positiva (lista, Matrix o dispersa).
+        b: Lado derecho.
+        tol: Se detiene cuando ||b - A x|| <= tol * ||b||.
+        max_iter: Máximo de iteraciones (por defecto 10 * n).
+        x0: Aproximación inicial (por defecto ceros).
+
+    Returns:
+        tuple: (x, info) con info = {"iteraciones", "residuo", "convergio"}.
+
+    Raises:
+        ValueError: Si las dimensiones no coinciden o max_iter es negativo.
+
+    Ejemplo:
+        >>> x, info = conjugate_gradient([[4, 1], [1, 3]], [1, 2])
+        >>> [round(v, 6) for v in x], info["convergio"]
+        ([0.090909, 0.636364], True)
+    """
+    A, n = _preparar_iterativo(A, b)
+    if max_iter is None:
+        max_iter = 10 * n
+    _validar_max_iter(max_iter)
+    if x0 is None:
+        x, r = [0.0] * n, list(map(float, b))
+    else:
+        x = list(map(float, x0))
+        r = [bi - ai for bi, ai in zip(b, matmul(A, x))]
+    limite = tol * (norm(b) or 1.0)
+    p = list(r)
+    rr = dot(r, r)
+    iteracion = 0
+    while math.sqrt(rr) > limite and iteracion < max_iter:
+        iteracion += 1
+        Ap = matmul(A, p)
+        pAp = dot(p, Ap)
+        if pAp <= 0.0:
+            break  # A no es definida positiva en la dirección p
+        alfa = rr / pAp
+        iadd(x, multiply(alfa, p))
+        iadd(r, multiply(-alfa, Ap))
+        rr_nuevo = dot(r, r)
+        p = add(r, multiply(rr_nuevo / rr, p))
+        rr = rr_nuevo
+    residuo = math.sqrt(rr)
+    return x, _info(iteracion, residuo, residuo <= limite)
+
+
+def jacobi(
+    A,
+    b: Vector,
+    *,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    x0: Vector | None = None,
+) -> tuple[Vector, dict]:
+    """Resuelve A x = b por el método de Jacobi.
+
+    x_i <- (b_i - Σ_{j≠i} a_ij x_j) / a_ii. Converge si A es
+    estrictamente diagonal dominante; cada paso es un producto A·x.
+
+    Args:
+        A: Matriz cuadrada sin ceros en la diagonal (lista, Matrix o dispersa).
+        b: Lado derecho.
+        tol: Se detiene cuando ||b - A x|| <= tol * ||b||.
+        max_iter: Máximo de iteraciones.
+        x0: Aproximación inicial (por defecto ceros).
+
+    Returns:
+        tuple: (x, info) con info = {"iteraciones", "residuo", "convergio"}.
+
+    Raises:
+        ValueError: Si las dimensiones no coinciden, hay un cero en la
+                    diagonal o max_iter es negativo.
+
+    Ejemplo:
+        >>> x, info = jacobi([[4, 1], [2, 5]], [5, 7])
+        >>> [round(v, 6) for v in x], info["convergio"]
+        ([1.0, 1.0], True)
+    """
+    A, n = _preparar_iterativo(A, b)
+    _validar_max_iter(max_iter)
+    diagonal = _diagonal(A, n)
+    if 0.0 in diagonal:
+        raise ValueError(f"Cero en la diagonal (fila {diagonal.index(0.0)})")
+    x = [0.0] * n if x0 is None else list(map(float, x0))
+    limite = tol * (norm(b) or 1.0)
+    residuo = math.inf
+    for iteracion in range(max_iter + 1):
+        # r = b - A x; el nuevo x es x + r / diagonal (el término a_ii x_i
+        # de A x se cancela con el que se suma de vuelta)
+        r = [bi - ai for bi, ai in zip(b, matmul(A, x))]
+        residuo = norm(r)
+        if residuo <= limite:
+            return x, _info(iteracion, residuo, True)
+        if iteracion == max_iter:
+            break
+        x = [xi + ri / di for xi, ri, di in zip(x, r, diagonal)]
+    return x, _info(max_iter, residuo, False)
+
+
+# -------------------------------------------------------------------
+# Sección 6: Evaluación Perezosa (Grafo de Expresiones)
+# -------------------------------------------------------------------
+
+
+class Expr:
+    """Nodo de un grafo de expresiones perezoso.
+
+    Cuando add, multiply, add_matrices, multiply_matrix, matmul o
+    transpose reciben algún operando Expr, no calculan nada: devuelven un
+    nuevo nodo. El cálculo ocurre solo al llamar evaluate(), que:
+
+    - Fusiona sumas y productos por escalar en una sola pasada sobre los
+      datos (sin matrices intermedias): 2*A + 3*B se evalúa elemento a
+      elemento como 2*a + 3*b.
+    - Empuja las transpuestas hasta las hojas, donde son vistas gratuitas.
+    - Reordena cadenas de matmul con programación dinámica (problema de la
+      cadena de matrices) para minimizar el número de multiplicaciones.
+
+    Ejemplo:
+        >>> A, B = lazy([[1, 2], [3, 4]]), lazy([[5, 6], [7, 8]])
+        >>> expr = add_matrices(multiply_matrix(2, A), multiply_matrix(3, B))
+        >>> expr.evaluate()
+        [[17.0, 22.0], [27.0, 32.0]]
+    """
+
+    __slots__ = ("op", "args", "shape")
+
+    def __init__(self, op: str, args: tuple, shape: tuple[int, ...]):
+        self.op = op
+        self.args = args
+        self.shape = shape
+
+    def evaluate(self) -> Matriz | Matrix | Vector:
+        """Evalúa el grafo y devuelve el resultado.
+
+        Returns:
+            Vector si el resultado es unidimensional; si no, Matrix cuando
+            alguna hoja era Matrix y Matriz en otro caso.
+        """
+        resultado = _Evaluador().valor(self, False)
+        if isinstance(resultado, Matrix) and _tiene_hoja_compacta(self):
+            return resultado
+        return resultado.tolist()
+
+    def __repr__(self) -> str:
+        if self.op == "hoja":
+            return f"lazy(<{'x'.join(map(str, self.shape))}>)"
+        if self.op == "escala":
+            return f"({self.args[0]!r} * {self.args[1]!r})"
+        if self.op == "transpuesta":
+            return f"{self.args[0]!r}.T"
+        simbolo = "+" if self.op == "suma" else "@"
+        return f"({self.args[0]!r} {simbolo} {self.args[1]!r})"
+
+
+def lazy(A: Matriz | Matrix | Vector) -> Expr:
+    """Envuelve una matriz o vector como hoja de un grafo perezoso.
+
+    Args:
+        A: Matriz, Matrix o Vector.
+
+    Returns:
+        Expr: Hoja que se puede pasar a las funciones de NumpyLess.
+
+    Ejemplo:
+        >>> A = lazy([[1, 2], [3, 4]])
+        >>> matmul(A, transpose(A)).evaluate()
+        [[5.0, 11.0], [11.0, 25.0]]
+    """
+    if isinstance(A, Expr):
+        return A
+    # La hoja guarda el valor ya compacto y si el original era Matrix
+    if isinstance(A, Matrix):
+        return Expr("hoja", (A, True), A.shape)
+    if A and hasattr(A[0], "__len__"):
+        return Expr("hoja", (Matrix.from_lists(A), False), shape(A))
+    return Expr("hoja", (array("d", A), False), (len(A),))
+
+
+def _es_perezosa(*operandos) -> bool:
+    return any(isinstance(x, Expr) for x in operandos)
+
+
+def _nodo_suma(A, B) -> Expr:
+    A, B = lazy(A), lazy(B)
+    if A.shape != B.shape:
+        raise ValueError(
+            f"Los operandos deben tener la misma forma ({A.shape} != {B.shape})"
+        )
+    return Expr("suma", (A, B), A.shape)
+
+
+def _nodo_escala(c: float, A) -> Expr:
+    A = lazy(A)
+    return Expr("escala", (float(c), A), A.shape)
+
+
+def _nodo_transpuesta(A) -> Expr:
+    A = lazy(A)
+    if len(A.shape) != 2:
+        raise ValueError("Solo se pueden transponer matrices")
+    return Expr("transpuesta", (A,), A.shape[::-1])
+
+
+def _nodo_matmul(A, B) -> Expr:
+    A, B = lazy(A), lazy(B)
+    if len(A.shape) != 2:
+        raise ValueError("El operando izquierdo de matmul debe ser una matriz")
+    m, n = A.shape
+    if n != B.shape[0]:
+        raise ValueError(f"Dimensiones incompatibles: A es {m}x{n} y B es {B.shape}")
+    return Expr("matmul", (A, B), (m,) + B.shape[1:])
+
+
+def _tiene_hoja_compacta(raiz: Expr) -> bool:
+    pendientes, vistos = [raiz], set()
+    while pendientes:
+        nodo = pendientes.pop()
+        if id(nodo) in vistos:
+            continue
+        vistos.add(id(nodo))
+        if nodo.op == "hoja":
+            if nodo.args[1]:
+                return True
+        else:
+            pendientes.extend(x for x in nodo.args if isinstance(x, Expr))
+    return False
+
+
+def _orden_cadena(dims: list[int]) -> list[list[int]]:
+    """Programación dinámica de la cadena de matrices.
+
+    Args:
+        dims: La matriz k-ésima de la cadena es dims[k] x dims[k + 1].
+
+    Returns:
+        Tabla corte[i][j] con el índice donde conviene partir el producto
+        de las matrices i..j.
+    """
+    k = len(dims) - 1
+    costo = [[0] * k for _ in range(k)]
+    corte = [[0] * k for _ in range(k)]
+    for largo in range(2, k + 1):
+        for i in range(k - largo + 1):
+            j = i + largo - 1
+            mejor = None
+            for s in range(i, j):
+                c = costo[i][s] + costo[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if mejor is None or c < mejor:
+                    mejor, corte[i][j] = c, s
+            costo[i][j] = mejor
+    return corte
+
+
+class _Evaluador:
+    """Evalúa un grafo de Expr una sola vez por nodo (memoización)."""
+
+    def __init__(self):
+        self._memo: dict[tuple[int, bool], Matrix | array] = {}
+
+    def valor(self, nodo: Expr, transpuesta: bool) -> "Matrix | array":
+        clave = (id(nodo), transpuesta)
+        if clave not in self._memo:
+            self._memo[clave] = self._calcular(nodo, transpuesta)
+        return self._memo[clave]
+
+    def _calcular(self, nodo: Expr, transpuesta: bool) -> "Matrix | array":
+        if nodo.op == "hoja":
+            valor = nodo.args[0]
+            return valor.T if transpuesta else valor
+        if nodo.op == "transpuesta":
+            return self.valor(nodo.args[0], not transpuesta)
+        if nodo.op == "matmul":
+            return self._cadena(nodo, transpuesta)
+        return self._combinacion(nodo, transpuesta)
+
+    # --- Fusión de operaciones elemento a elemento ---
+
+    def _terminos(self, nodo: Expr, coef: float, transpuesta: bool, terminos: dict):
+        """Aplana sumas y escalas en {(id, transpuesta): [coef, nodo]}."""
+        if nodo.op == "suma":
+            self._terminos(nodo.args[0], coef, transpuesta, terminos)
+            self._terminos(nodo.args[1], coef, transpuesta, terminos)
+        elif nodo.op == "escala":
+            self._terminos(nodo.args[1], coef * nodo.args[0], transpuesta, terminos)
+        elif nodo.op == "transpuesta":
+            self._terminos(nodo.args[0], coef, not transpuesta, terminos)
+        else:
+            clave = (id(nodo), transpuesta)
+            if clave in terminos:
+                terminos[clave][0] += coef
+            else:
+                terminos[clave] = [coef, nodo]
+
+    def _combinacion(self, nodo: Expr, transpuesta: bool) -> "Matrix | array":
+        terminos: dict = {}
+        self._terminos(nodo, 1.0, transpuesta, terminos)
+        coefs = []
+        buffers = []
+        for (_, t), (coef, base) in terminos.items():
+            valor = self.valor(base, t)
+            coefs.append(coef)
+            buffers.append(valor._plana() if isinstance(valor, Matrix) else valor)
+
+        # Una sola pasada: cada elemento es sum(coef_k * x_k)
+        if len(buffers) == 1:
+            datos = array("d", map(_producto, repeat(coefs[0]), buffers[0]))
+        else:
+            datos = array("d", map(lambda *xs: _sumprod(coefs, xs), *buffers))
+
+        forma = nodo.shape[::-1] if transpuesta else nodo.shape
+        return Matrix(datos, forma) if len(forma) == 2 else datos
+
+    # --- Cadenas de matmul ---
+
+    def _factores(self, nodo: Expr, transpuesta: bool, factores: list) -> float:
+        """Aplana una cadena de matmul; devuelve el escalar acumulado."""
+        if nodo.op == "matmul":
+            izquierda, derecha = nodo.args
+            if transpuesta:
+                # (X @ Y).T == Y.T @ X.T
+                izquierda, derecha = derecha, izquierda
+            coef = self._factores(izquierda, transpuesta, factores)
+            return coef * self._factores(derecha, transpuesta, factores)
+        if nodo.op == "escala":
+            return nodo.args[0] * self._factores(nodo.args[1], transpuesta, factores)
+        if nodo.op == "transpuesta":
+            return self._factores(nodo.args[0], not transpuesta, factores)
+        factores.append(self.valor(nodo, transpuesta))
+        return 1.0
+
+    def _cadena(self, nodo: Expr, transpuesta: bool) -> "Matrix | array":
+        factores: list = []
+        coef = self._factores(nodo, transpuesta, factores)
+
+        # Un vector al final de la cadena cuenta como una matriz n x 1
+        dims = [factores[0].shape[0]]
+        dims.extend(f.shape[1] if isinstance(f, Matrix) else 1 for f in factores)
+
+        if coef != 1.0:
+            # El escalar se aplica al factor más pequeño (la pasada más barata)
+            k = builtins.min(range(len(factores)), key=lambda i: dims[i] * dims[i + 1])
+            f = factores[k]
+            if isinstance(f, Matrix):
+                factores[k] = multiply_matrix(coef, f)
+            else:
+                factores[k] = array("d", map(_producto, repeat(coef), f))
+
+        corte = _orden_cadena(dims)
+
+        def producto(i: int, j: int):
+            if i == j:
+                return factores[i]
+            s = corte[i][j]
+            izquierda, derecha = producto(i, s), producto(s + 1, j)
+            resultado = matmul(izquierda, derecha)
+            return resultado if isinstance(resultado, Matrix) else array("d", resultado)
+
+        return producto(0, len(factores) - 1)
+
+
+# -------------------------------------------------------------------
+# Sección 7: Operaciones por Lotes (Muchos Vectores a la Vez)
+# -------------------------------------------------------------------
+
+
+def _misma_forma(X, Y) -> None:
+    if shape(X) != shape(Y):
+        raise ValueError(
+            f"Los lotes deben tener la misma forma ({shape(X)} != {shape(Y)})"
+        )
+
+
+def batch_dot(
+    X: Matriz | Matrix, Y: Matriz | Matrix, *, workers: int | None = None
+) -> Vector:
+    """Producto punto fila a fila de dos lotes de vectores.
+
+    Equivale a [dot(X[i], Y[i]) for i in range(m)] pero en un solo recorrido,
+    sin pagar el costo de una llamada a dot() por fila.
+
+    Equivalente en NumPy: np.einsum("ij,ij->i", X, Y)
+
+    Args:
+        X: Lote de m vectores (m x n), uno por fila.
+        Y: Lote de m vectores (m x n), uno por fila.
+        workers: Procesos a usar (None = PROCESOS, <= 0 = todos los núcleos).
+
+    Returns:
+        Vector: Los m productos punto.
+
+    Raises:
+        ValueError: Si X e Y no tienen la misma forma.
+
+    Ejemplo:
+        >>> batch_dot([[1, 2], [3, 4]], [[5, 6], [7, 8]])
+        [17.0, 53.0]
+    """
+    _misma_forma(X, Y)
+    procesos = _paralelizar(workers, shape(X)[0] * shape(X)[1])
+    if procesos:
+        return _batch_dot_paralelo(X, Y, procesos)
+    return list(map(float, map(_sumprod, _filas(X), _filas(Y))))
+
+
+def batch_norm(X: Matriz | Matrix) -> Vector:
+    """Norma L2 de cada fila de un lote de vectores.
+
+    Equivalente en NumPy: np.linalg.norm(X, axis=1)
+
+    Args:
+        X: Lote de m vectores (m x n), uno por fila.
+
+    Returns:
+        Vector: Las m normas.
+
+    Ejemplo:
+        >>> batch_norm([[3, 4], [6, 8]])
+        [5.0, 10.0]
+    """
+    filas = _filas(X)
+    return list(map(math.sqrt, map(_sumprod, filas, filas)))
+
+
+def batch_axpy(
+    a: float | Vector, X: Matriz | Matrix, Y: Matriz | Matrix
+) -> Matriz | Matrix:
+    """Calcula a * X + Y fila a fila (la operación "axpy" de BLAS por lotes).
+
+    Equivalente en NumPy: a[:, None] * X + Y (o a * X + Y si a es escalar)
+
+    Args:
+        a: Escalar común, o un escalar por fila (vector de m elementos).
+        X: Lote de m vectores (m x n).
+        Y: Lote de m vectores (m x n).
+
+    Returns:
+        Matriz: El lote resultante (Matrix si X o Y es Matrix).
+
+    Raises:
+        ValueError: Si las formas no coinciden.
+
+    Ejemplo:
+        >>> batch_axpy([1, 2], [[1, 1], [1, 1]], [[0, 1], [2, 3]])
+        [[1.0, 2.0], [4.0, 5.0]]
+    """
+    _misma_forma(X, Y)
+    m, n = shape(X)
+    if isinstance(a, (int, float)):
+        escalas = repeat(float(a), m)
+    else:
+        if len(a) != m:
+            raise ValueError(f"Se esperaban {m} escalares (hay {len(a)})")
+        escalas = map(float, a)
+    resultado = [
+        list(map(_suma, map(_producto, repeat(ai), x), y))
+        for ai, x, y in zip(escalas, _filas(X), _filas(Y))
+    ]
+    if isinstance(X, Matrix) or isinstance(Y, Matrix):
+        return _desde_filas(resultado, (m, n))
+    return resultado
+
+
+def pairwise_distances(
+    X: Matriz | Matrix,
+    Y: Matriz | Matrix | None = None,
+    metrica: str = "sqeuclidean",
+) -> Matriz | Matrix:
+    """Distancias entre cada fila de X y cada fila de Y.
+
+    Todos los productos punto se calculan de una vez con el mismo motor
+    por bloques de matmul (X @ Y.T), y luego:
+
+    - "sqeuclidean": ||x - y||² = ||x||² + ||y||² - 2 x·y
+    - "cosine": 1 - x·y / (||x|| ||y||)  (1.0 si algún vector es cero)
+
+    Equivalente en SciPy: scipy.spatial.distance.cdist(X, Y, metrica)
+
+    Args:
+        X: Lote de m vectores (m x n).
+        Y: Lote de p vectores (p x n). Si es None se usa X.
+        metrica: "sqeuclidean" o "cosine".
+
+    Returns:
+        Matriz: Matriz m x p de distancias (Matrix si X o Y es Matrix).
+
+    Raises:
+        ValueError: Si las dimensiones no coinciden o la métrica no existe.
+
+    Ejemplo:
+        >>> pairwise_distances([[0, 0], [1, 1]], [[1, 0]])
+        [[1.0], [1.0]]
+    """
+    if Y is None:
+        Y = X
+    m, n = shape(X)
+    p, n_y = shape(Y)
+    if n != n_y and m and p:
+        raise ValueError(f"Los vectores deben tener la misma dimensión ({n} != {n_y})")
+    if metrica not in ("sqeuclidean", "cosine"):
+        raise ValueError(f"Métrica desconocida: {metrica!r}")
+
+    filas_x, filas_y = _filas(X), _filas(Y)
+    # Las filas de Y son las columnas de Y.T: no hace falta transponer
+    productos = _matmul_bloques(filas_x, filas_y)
+    normas_x = list(map(_sumprod, filas_x, filas_x))
+    normas_y = list(map(_sumprod, filas_y, filas_y))
+
+    if metrica == "sqeuclidean":
+        resultado = [
+            [builtins.max(nx + ny - 2.0 * c, 0.0) for ny, c in zip(normas_y, fila)]
+            for nx, fila in zip(normas_x, productos)
+        ]
+    else:
+        raices_y = list(map(math.sqrt, normas_y))
+        resultado = []
+        for nx, fila in zip(normas_x, productos):
+            rx = math.sqrt(nx)
+            resultado.append(
+                [
+                    1.0 - c / (rx * ry) if rx and ry else 1.0
+                    for ry, c in zip(raices_y, fila)
+                ]
+            )
+
+    if isinstance(X, Matrix) or isinstance(Y, Matrix):
+        return _desde_filas(resultado, (m, p))
+    return resultado
+
+
+# -------------------------------------------------------------------
+# Sección 8: Ejecución Paralela (Procesos y Memoria Compartida)
+# -------------------------------------------------------------------
+
+_POOL = None
+_POOL_PROCESOS = 0
+
+
+def _procesos(workers: int | None) -> int:
+    """Traduce el argumento workers (None = PROCESOS, <= 0 = todos los núcleos)."""
+    if workers is None:
+        workers = PROCESOS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _obtener_pool(procesos: int):
+    """Devuelve un pool de procesos reutilizable de ese tamaño."""
+    global _POOL, _POOL_PROCESOS
+    if _POOL is None or _POOL_PROCESOS != procesos:
+        if _POOL is not None:
+            _POOL.shutdown()
+        from concurrent.futures import ProcessPoolExecutor
+
+        _POOL = ProcessPoolExecutor(max_workers=procesos)
+        _POOL_PROCESOS = procesos
+    return _POOL
+
+
+@atexit.register
+def _cerrar_pool() -> None:
+    if _POOL is not None:
+        _POOL.shutdown()
+
+
+def _compartir(datos: "array | int"):
+    """Crea un bloque de memoria compartida con los datos (o vacío de n floats)."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    n = datos if isinstance(datos, int) else len(datos)
+    bloque = SharedMemory(create=True, size=builtins.max(n, 1) * _BYTES_FLOAT)
+    if not isinstance(datos, int) and n:
+        bloque.buf[: n * _BYTES_FLOAT] = memoryview(datos).cast("B")
+    return bloque
+
+
+def _leer(buf: memoryview, inicio: int, fin: int) -> array:
+    """Copia los floats [inicio, fin) de un buffer de bytes a un array('d')."""
+    datos = array("d")
+    datos.frombytes(buf[inicio * _BYTES_FLOAT : fin * _BYTES_FLOAT])
+    return datos
+
+
+def _escribir(buf: memoryview, inicio: int, datos: array) -> None:
+    buf[inicio * _BYTES_FLOAT : (inicio + len(datos)) * _BYTES_FLOAT] = memoryview(
+        datos
+    ).cast("B")
+
+
+def _kernel_matmul(bufs, dims, fila0: int, fila1: int) -> None:
+    buf_a, buf_bt, buf_c = bufs
+    _, n, p = dims
+    filas_a = [_leer(buf_a, i * n, (i + 1) * n) for i in range(fila0, fila1)]
+    columnas_b = [_leer(buf_bt, j * n, (j + 1) * n) for j in range(p)]
+    resultado = _matmul_bloques(filas_a, columnas_b)
+    _escribir(buf_c, fila0 * p, array("d", chain.from_iterable(resultado)))
+
+
+def _kernel_suma(bufs, dims, fila0: int, fila1: int) -> None:
+    buf_a, buf_b, buf_c = bufs
+    _, n = dims
+    a = _leer(buf_a, fila0 * n, fila1 * n)
+    b = _leer(buf_b, fila0 * n, fila1 * n)
+    _escribir(buf_c, fila0 * n, array("d", map(_suma, a, b)))
+
+
+def _kernel_escala(bufs, dims, fila0: int, fila1: int) -> None:
+    buf_a, buf_c = bufs
+    _, n, c = dims
+    a = _leer(buf_a, fila0 * n, fila1 * n)
+    _escribir(buf_c, fila0 * n, array("d", map(_producto, repeat(c), a)))
+
+
+def _kernel_batch_dot(bufs, dims, fila0: int, fila1: int) -> None:
+    buf_x, buf_y, buf_c = bufs
+    _, n = dims
+    resultado = array(
+        "d",
+        (
+            _sumprod(_leer(buf_x, i * n, (i + 1) * n), _leer(buf_y, i * n, (i + 1) * n))
+            for i in range(fila0, fila1)
+        ),
+    )
+    _escribir(buf_c, fila0, resultado)
+
+
+_KERNELS_PARALELOS = {
+    "matmul": _kernel_matmul,
+    "suma": _kernel_suma,
+    "escala": _kernel_escala,
+    "batch_dot": _kernel_batch_dot,
+}
+
+
+def _trabajador(op: str, nombres: list[str], dims: tuple, fila0: int, fila1: int):
+    """Punto de entrada en el proceso hijo: solo recibe nombres de bloques."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    bloques = [SharedMemory(name=nombre) for nombre in nombres]
+    try:
+        _KERNELS_PARALELOS[op]([b.buf for b in bloques], dims, fila0, fila1)
+    finally:
+        for bloque in bloques:
+            bloque.close()
+
+
+def _ejecutar_paralelo(
+    op: str, entradas: list[array], tamano_salida: int, dims: tuple, procesos: int
+) -> array:
+    """Reparte las filas en bloques entre los procesos y junta el resultado.
+
+    Los operandos y el resultado viven en memoria compartida, así que a
+    los procesos solo se les envían nombres y rangos de filas.
+    """
+    filas = dims[0]
+    bloques = [_compartir(x) for x in entradas]
+    salida = _compartir(tamano_salida)
+    try:
+        nombres = [b.name for b in bloques] + [salida.name]
+        pool = _obtener_pool(procesos)
+        paso = -(-filas // procesos)
+        tareas = [
+            pool.submit(
+                _trabajador, op, nombres, dims, f0, builtins.min(f0 + paso, filas)
+            )
+            for f0 in range(0, filas, paso)
+        ]
+        for tarea in tareas:
+            tarea.result()
+        return _leer(salida.buf, 0, tamano_salida)
+    finally:
+        for bloque in bloques + [salida]:
+            bloque.close()
+            bloque.unlink()
+
+
+def _paralelizar(workers: int | None, trabajo: int) -> int:
+    """Número de procesos a usar, o 0 si conviene ejecutar en serie."""
+    procesos = _procesos(workers)
+    if procesos <= 1 or trabajo < UMBRAL_PARALELO:
+        return 0
+    return procesos
+
+
+def _como_salida(
+    datos: array, forma: tuple[int, int], compacta: bool, codigo: str = "d"
+):
+    if compacta:
+        return Matrix(_buffer(codigo, datos), forma)
+    filas, columnas = forma
+    return [datos[i * columnas : (i + 1) * columnas].tolist() for i in range(filas)]
+
+
+def _plano(A: "Matriz | Matrix") -> array:
+    """Buffer float64 contiguo en orden por filas de cualquier matriz."""
+    if isinstance(A, Matrix):
+        return _buffer("d", A._plana()) if A._codigo != "d" else A._plana()
+    return array("d", chain.from_iterable(A))
+
+
+def _matmul_paralelo(A, B, procesos: int):
+    m, n = shape(A)
+    p = shape(B)[1]
+    bt = array("d", chain.from_iterable(_columnas(B)))
+    datos = _ejecutar_paralelo("matmul", [_plano(A), bt], m * p, (m, n, p), procesos)
+    return _como_salida(
+        datos,
+        (m, p),
+        isinstance(A, Matrix) or isinstance(B, Matrix),
+        _promover(_codigo_de(A), _codigo_de(B)),
+    )
+
+
+def _suma_paralela(A, B, procesos: int):
+    m, n = shape(A)
+    datos = _ejecutar_paralelo("suma", [_plano(A), _plano(B)], m * n, (m, n), procesos)
+    return _como_salida(
+        datos,
+        (m, n),
+        isinstance(A, Matrix) or isinstance(B, Matrix),
+        _promover(_codigo_de(A), _codigo_de(B)),
+    )
+
+
+def _escala_paralela(c: float, A, procesos: int):
+    m, n = shape(A)
+    datos = _ejecutar_paralelo("escala", [_plano(A)], m * n, (m, n, c), procesos)
+    codigo = _promover_escalar(_codigo_de(A), c)
+    return _como_salida(datos, (m, n), isinstance(A, Matrix), codigo)
+
+
+def _batch_dot_paralelo(X, Y, procesos: int) -> Vector:
+    m, n = shape(X)
+    datos = _ejecutar_paralelo("batch_dot", [_plano(X), _plano(Y)], m, (m, n), procesos)
+    return datos.tolist()
+
+
+# -------------------------------------------------------------------
+# Sección 9: Matrices Dispersas (COO, CSR, CSC)
+# -------------------------------------------------------------------
+
+
+class _Dispersa:
+    """Base común de los formatos dispersos: solo guarda los no ceros."""
+
+    __slots__ = ("_shape", "data")
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Tupla (filas, columnas)."""
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """Número de elementos guardados (no ceros)."""
+        return len(self.data)
+
+    def todense(self, *, compacta: bool = False) -> Matriz | Matrix:
+        """Convierte a matriz densa (Matrix si compacta=True).
+
+        Recorre las tripletas de tocoo() y suma las repetidas; CSR la
+        redefine para escribir sus filas sin pasar por COO.
+        """
+        coo = self.tocoo()
+        m, n = self._shape
+        resultado = [[0.0] * n for _ in range(m)]
+        for i, j, x in zip(coo.filas, coo.columnas, coo.data):
+            resultado[i][j] += x
+        return _desde_filas(resultado, (m, n)) if compacta else resultado
+
+    def __repr__(self) -> str:
+        filas, columnas = self._shape
+        return f"{type(self).__name__}(<{filas}x{columnas}, nnz={self.nnz}>)"
+
+
+class COOMatrix(_Dispersa):
+    """Matriz dispersa en formato de coordenadas (fila, columna, valor).
+
+    Es el formato cómodo para construir: se agregan tripletas en cualquier
+    orden (las repetidas se suman al convertir). Para calcular conviene
+    convertirla con tocsr() o tocsc().
+
+    Ejemplo:
+        >>> S = COOMatrix([0, 1], [1, 0], [5.0, 7.0], (2, 2))
+        >>> S.todense()
+        [[0.0, 5.0], [7.0, 0.0]]
+    """
+
+    __slots__ = ("filas", "columnas")
+
+    def __init__(self, filas, columnas, valores, shape: tuple[int, int]):
+        if not len(filas) == len(columnas) == len(valores):
+            raise ValueError("filas, columnas y valores deben tener la misma longitud")
+        m, n = shape
+        if any(not 0 <= i < m for i in filas) or any(
+            not 0 <= j < n for j in columnas
+        ):
+            raise ValueError(f"Hay índices fuera de la forma {shape}")
+        self._shape = (m, n)
+        self.filas = array("q", filas)
+        self.columnas = array("q", columnas)
+        self.data = array("d", valores)
+
+    @classmethod
+    def from_dense(cls, A: Matriz | Matrix) -> "COOMatrix":
+        """Crea una COOMatrix con los elementos no nulos de A."""
+        filas, columnas, valores = [], [], []
+        for i, fila in enumerate(_filas(A)):
+            for j, x in enumerate(fila):
+                if x:
+                    filas.append(i)
+                    columnas.append(j)
+                    valores.append(x)
+        return cls(filas, columnas, valores, shape(A))
+
+    def tocsr(self) -> "CSRMatrix":
+        """Convierte a CSR ordenando por (fila, columna) y sumando repetidos."""
+        indptr, indices, data = _comprimir(
+            self.filas, self.columnas, self.data, self._shape[0]
+        )
+        return CSRMatrix(indptr, indices, data, self._shape)
+
+    def tocsc(self) -> "CSCMatrix":
+        """Convierte a CSC ordenando por (columna, fila) y sumando repetidos."""
+        indptr, indices, data = _comprimir(
+            self.columnas, self.filas, self.data, self._shape[1]
+        )
+        return CSCMatrix(indptr, indices, data, self._shape)
+
+    def tocoo(self) -> "COOMatrix":
+        return self
+
+    @property
+    def T(self) -> "COOMatrix":
+        """Transpuesta: intercambia los arreglos de filas y columnas."""
+        m, n = self._shape
+        return COOMatrix(self.columnas, self.filas, self.data, (n, m))
+
+
+class _Comprimida(_Dispersa):
+    """Base de CSR y CSC: guarda indptr, indices y data.
+
+    indptr[k]..indptr[k + 1] delimita la fila (CSR) o columna (CSC) k
+    dentro de indices y data.
+    """
+
+    __slots__ = ("indptr", "indices")
+
+    def __init__(self, indptr, indices, data, shape: tuple[int, int]):
+        self.indptr = indptr if isinstance(indptr, array) else array("q", indptr)
+        self.indices = indices if isinstance(indices, array) else array("q", indices)
+        self.data = data if isinstance(data, array) else array("d", data)
+        self._shape = tuple(shape)
+
+    def _tramos(self):
+        """Itera (índices, valores) de cada fila (CSR) o columna (CSC)."""
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for k in range(len(indptr) - 1):
+            a, b = indptr[k], indptr[k + 1]
+            yield indices[a:b], data[a:b]
+
+
+class CSRMatrix(_Comprimida):
+    """Matriz dispersa comprimida por filas (Compressed Sparse Row).
+
+    Es el formato para calcular: matmul por filas, sumas y escalados
+    recorren solo los no ceros.
+
+    Ejemplo:
+        >>> S = CSRMatrix.from_dense([[1, 0, 0], [0, 0, 2]])
+        >>> list(S.indptr), list(S.indices), list(S.data)
+        ([0, 1, 2], [0, 2], [1.0, 2.0])
+        >>> matmul(S, [1, 1, 1])
+        [1.0, 2.0]
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dense(cls, A: Matriz | Matrix) -> "CSRMatrix":
+        """Crea una CSRMatrix con los elementos no nulos de A."""
+        indptr, indices, data = array("q", [0]), array("q"), array("d")
+        for fila in _filas(A):
+            for j, x in enumerate(fila):
+                if x:
+                    indices.append(j)
+                    data.append(x)
+            indptr.append(len(data))
+        return cls(indptr, indices, data, shape(A))
+
+    @property
+    def T(self) -> "CSCMatrix":
+        """Transpuesta sin copiar: la CSR de A es la CSC de A.T."""
+        m, n = self._shape
+        return CSCMatrix(self.indptr, self.indices, self.data, (n, m))
+
+    def tocsr(self) -> "CSRMatrix":
+        return self
+
+    def tocsc(self) -> "CSCMatrix":
+        """Reordena por columnas en O(nnz)."""
+        indptr, indices, data = _transponer_estructura(
+            self.indptr, self.indices, self.data, self._shape[1]
+        )
+        return CSCMatrix(indptr, indices, data, self._shape)
+
+    def tocoo(self) -> COOMatrix:
+        filas = chain.from_iterable(
+            repeat(i, self.indptr[i + 1] - self.indptr[i])
+            for i in range(self._shape[0])
+        )
+        return COOMatrix(list(filas), self.indices, self.data, self._shape)
+
+    def todense(self, *, compacta: bool = False) -> Matriz | Matrix:
+        m, n = self._shape
+        resultado = [[0.0] * n for _ in range(m)]
+        for fila, (indices, valores) in zip(resultado, self._tramos()):
+            for j, x in zip(indices, valores):
+                fila[j] = x
+        return _desde_filas(resultado, (m, n)) if compacta else resultado
+
+
+class CSCMatrix(_Comprimida):
+    """Matriz dispersa comprimida por columnas (Compressed Sparse Column).
+
+    Es la transpuesta natural de CSR: CSRMatrix.T devuelve una CSCMatrix
+    que comparte los mismos arreglos. Para calcular se convierte a CSR.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dense(cls, A: Matriz | Matrix) -> "CSCMatrix":
+        """Crea una CSCMatrix con los elementos no nulos de A."""
+        return CSRMatrix.from_dense(A).tocsc()
+
+    @property
+    def T(self) -> CSRMatrix:
+        """Transpuesta sin copiar: la CSC de A es la CSR de A.T."""
+        m, n = self._shape
+        return CSRMatrix(self.indptr, self.indices, self.data, (n, m))
+
+    def tocsr(self) -> CSRMatrix:
+        """Reordena por filas en O(nnz)."""
+        indptr, indices, data = _transponer_estructura(
+            self.indptr, self.indices, self.data, self._shape[0]
+        )
+        return CSRMatrix(indptr, indices, data, self._shape)
+
+    def tocsc(self) -> "CSCMatrix":
+        return self
+
+    def tocoo(self) -> COOMatrix:
+        return self.T.tocoo().T
+
+
+def _comprimir(principales, secundarios, valores, n_principal: int):
+    """Agrupa tripletas por índice principal, ordena y suma repetidos."""
+    orden = sorted(range(len(valores)), key=lambda k: (principales[k], secundarios[k]))
+    indptr = array("q", [0]) * (n_principal + 1)
+    indices, data = array("q"), array("d")
+    anterior = None
+    for k in orden:
+        clave = (principales[k], secundarios[k])
+        if clave == anterior:
+            data[-1] += valores[k]
+            continue
+        anterior = clave
+        indices.append(secundarios[k])
+        data.append(valores[k])
+        indptr[principales[k] + 1] += 1
+    for i in range(n_principal):
+        indptr[i + 1] += indptr[i]
+    return indptr, indices, data
+
+
+def _transponer_estructura(indptr, indices, data, n_secundario: int):
+    """Convierte CSR <-> CSC con un conteo por índice secundario (O(nnz))."""
+    conteos = array("q", [0]) * (n_secundario + 1)
+    for j in indices:
+        conteos[j + 1] += 1
+    for j in range(n_secundario):
+        conteos[j + 1] += conteos[j]
+    nuevo_indptr = array("q", conteos)
+    siguiente = conteos[:-1]
+    nuevos_indices = array("q", [0]) * len(indices)
+    nuevos_datos = array("d", [0.0]) * len(data)
+    for i in range(len(indptr) - 1):
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            destino = siguiente[j]
+            nuevos_indices[destino] = i
+            nuevos_datos[destino] = data[k]
+            siguiente[j] = destino + 1
+    return nuevo_indptr, nuevos_indices, nuevos_datos
+
+
+def _es_dispersa(*operandos) -> bool:
+    return any(isinstance(x, _Dispersa) for x in operandos)
+
+
+def _disperso_transpose(S: _Dispersa) -> _Dispersa:
+    return S.T
+
+
+def _disperso_escala(c: float, S: _Dispersa) -> _Dispersa:
+    datos = array("d", map(_producto, repeat(c), S.data))
+    if isinstance(S, COOMatrix):
+        return COOMatrix(S.filas, S.columnas, datos, S.shape)
+    return type(S)(S.indptr, S.indices, datos, S.shape)
+
+
+def _disperso_norm(S: _Dispersa) -> float:
+    """Norma de Frobenius: solo depende de los no ceros."""
+    if isinstance(S, COOMatrix):
+        S = S.tocsr()  # suma los repetidos antes de elevar al cuadrado
+    return math.sqrt(_sumprod(S.data, S.data))
+
+
+def _disperso_suma(A, B):
+    if shape(A) != shape(B):
+        raise ValueError(
+            f"Las matrices deben tener la misma forma ({shape(A)} != {shape(B)})"
+        )
+    if not isinstance(A, _Dispersa):
+        A, B = B, A
+    if isinstance(B, _Dispersa):
+        # Disperso + disperso: mezcla fila a fila, sigue siendo dispersa
+        indptr, indices, data = array("q", [0]), array("q"), array("d")
+        for (ia, va), (ib, vb) in zip(A.tocsr()._tramos(), B.tocsr()._tramos()):
+            acumulado = dict(zip(ia, va))
+            for j, x in zip(ib, vb):
+                acumulado[j] = acumulado.get(j, 0.0) + x
+            for j in sorted(acumulado):
+                if acumulado[j]:
+                    indices.append(j)
+                    data.append(acumulado[j])
+            indptr.append(len(data))
+        return CSRMatrix(indptr, indices, data, A.shape)
+
+    # Disperso + denso: se copia el denso y solo se tocan los no ceros
+    resultado = [list(map(float, fila)) for fila in _filas(B)]
+    for fila, (indices, valores) in zip(resultado, A.tocsr()._tramos()):
+        for j, x in zip(indices, valores):
+            fila[j] += x
+    if isinstance(B, Matrix):
+        return _desde_filas(resultado, B.shape)
+    return resultado
+
+
+def _disperso_matmul(A, B):
+    if isinstance(A, _Dispersa):
+        S = A.tocsr()
+        m, n = S.shape
+        if isinstance(B, _Dispersa):
+            return _csr_por_csr(S, B.tocsr())
+        if _es_vector(B):
+            if len(B) != n:
+                raise ValueError(
+                    f"Dimensiones incompatibles: A es {m}x{n} y v tiene "
+                    f"{len(B)} elementos"
+                )
+            return [
+                float(_sumprod(valores, map(B.__getitem__, indices)))
+                for indices, valores in S._tramos()
+            ]
+        n_b, p = shape(B)
+        if n != n_b:
+            raise ValueError(
+                f"Dimensiones incompatibles: A es {m}x{n} y B es {n_b}x{p}"
+            )
+        filas_b = _filas(B)
+        resultado = []
+        for indices, valores in S._tramos():
+            # Cada no cero suma x * B[j] directamente sobre la fila de salida
+            fila = [0.0] * p
+            for j, x in zip(indices, valores):
+                for k, y in enumerate(filas_b[j]):
+                    fila[k] += x * y
+            resultado.append(fila)
+        return _desde_filas(resultado, (m, p)) if isinstance(B, Matrix) else resultado
+
+    # Denso @ disperso = (disperso.T @ denso.T).T
+    producto = _disperso_matmul(B.T, transpose(A))
+    return transpose(producto)
+
+
+def _csr_por_csr(A: CSRMatrix, B: CSRMatrix) -> CSRMatrix:
+    """Algoritmo de Gustavson: acumula cada fila del producto en un dict."""
+    m, n = A.shape
+    n_b, p = B.shape
+    if n != n_b:
+        raise ValueError(f"Dimensiones incompatibles: A es {m}x{n} y B es {n_b}x{p}")
+    filas_b = list(B._tramos())
+    indptr, indices, data = array("q", [0]), array("q"), array("d")
+    for ia, va in A._tramos():
+        acumulado: dict[int, float] = {}
+        for k, x in zip(ia, va):
+            ib, vb = filas_b[k]
+            for j, y in zip(ib, vb):
+                acumulado[j] = acumulado.get(j, 0.0) + x * y
+        for j in sorted(acumulado):
+            indices.append(j)
+            data.append(acumulado[j])
+        indptr.append(len(data))
+    return CSRMatrix(indptr, indices, data, (m, p))
+
+
+# -------------------------------------------------------------------
+# Sección 10: Matrices en Disco (mmap) y Operaciones por Teselas
+# -------------------------------------------------------------------
+
+_NPY_MAGIA = b"\x93NUMPY"
+
+
+class MappedMatrix:
+    """Matriz float64 guardada en disco y mapeada a memoria con mmap.
+
+    Los datos no se cargan: el sistema operativo trae del disco solo las
+    páginas que se leen. matmul, transpose, add_matrices y multiply_matrix
+    la procesan por teselas de TAMANO_TESELA x TAMANO_TESELA, así la
+    memoria usada no depende del tamaño de la matriz.
+
+    Se abre con open_memmap() y se crea con create_memmap(). Acepta
+    archivos .npy (float64, orden C) o binarios crudos de float64 en orden
+    por filas.
+
+    Cuando una operación por teselas se llama sin out, el resultado se
+    escribe en un .npy temporal que pertenece a la MappedMatrix devuelta:
+    el archivo se borra al llamar close() (o al salir del with) o, si no
+    se cierra, cuando la matriz se recolecta o termina el intérprete. Para
+    conservar el resultado hay que pasar out=create_memmap(ruta, forma).
+
+    Ejemplo:
+        >>> import tempfile
+        >>> ruta = os.path.join(tempfile.mkdtemp(), "A.npy")
+        >>> with create_memmap(ruta, (2, 2)) as A:
+        ...     A.write_tile(0, 0, Matrix.from_lists([[1, 2], [3, 4]]))
+        >>> with open_memmap(ruta) as A:
+        ...     A.tolist()
+        [[1.0, 2.0], [3.0, 4.0]]
+        >>> os.remove(ruta)
+    """
+
+    __slots__ = (
+        "path",
+        "_shape",
+        "_archivo",
+        "_mm",
+        "_buf",
+        "_inicio",
+        "_temporal",
+        "__weakref__",
+    )
+
+    def __init__(self, path: str, shape: tuple[int, int], inicio: int, modo: str):
+        import mmap
+
+        self.path = path
+        self._shape = tuple(shape)
+        self._inicio = inicio
+        self._temporal = None
+        escritura = modo != "r"
+        self._archivo = open(path, "r+b" if escritura else "rb")
+        acceso = mmap.ACCESS_WRITE if escritura else mmap.ACCESS_READ
+        self._mm = mmap.mmap(self._archivo.fileno(), 0, access=acceso)
+        self._buf = memoryview(self._mm)
+        esperado = inicio + self.size * _BYTES_FLOAT
+        if len(self._mm) < esperado:
+            self.close()
+            raise ValueError(
+                f"El archivo {path} tiene {len(self._buf)} bytes; se esperaban "
+                f"{esperado} para la forma {shape}"
+            )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Tupla (filas, columnas)."""
+        return self._shape
+
+    @property
+    def size(self) -> int:
+        """Número total de elementos."""
+        return self._shape[0] * self._shape[1]
+
+    def _posicion(self, i: int, j: int) -> int:
+        return self._inicio + (i * self._shape[1] + j) * _BYTES_FLOAT
+
+    def read_tile(self, i0: int, i1: int, j0: int, j1: int) -> Matrix:
+        """Lee el bloque de filas [i0, i1) y columnas [j0, j1) a memoria."""
+        datos = array("d")
+        if j0 == 0 and j1 == self._shape[1]:
+            # Filas completas: un solo bloque contiguo del archivo
+            datos.frombytes(self._buf[self._posicion(i0, 0) : self._posicion(i1, 0)])
+        else:
+            for i in range(i0, i1):
+                inicio, fin = self._posicion(i, j0), self._posicion(i, j1)
+                datos.frombytes(self._buf[inicio:fin])
+        return Matrix(datos, (i1 - i0, j1 - j0))
+
+    def write_tile(self, i0: int, j0: int, M: Matriz | Matrix) -> None:
+        """Escribe el bloque M con su esquina superior izquierda en (i0, j0)."""
+        M = Matrix.from_lists(M, dtype="float64")
+        filas, columnas = M.shape
+        if i0 + filas > self._shape[0] or j0 + columnas > self._shape[1]:
+            raise ValueError(f"El bloque {M.shape} no cabe en ({i0}, {j0})")
+        if j0 == 0 and columnas == self._shape[1]:
+            plana = M._plana()
+            self._buf[self._posicion(i0, 0) : self._posicion(i0 + filas, 0)] = (
+                memoryview(plana).cast("B")
+            )
+            return
+        for i, fila in enumerate(M):
+            inicio = self._posicion(i0 + i, j0)
+            self._buf[inicio : inicio + columnas * _BYTES_FLOAT] = memoryview(
+                fila
+            ).cast("B")
+
+    def __getitem__(self, indice: tuple[int, int]) -> float:
+        i, j = indice
+        return self.read_tile(i, i + 1, j, j + 1)[0, 0]
+
+    def tolist(self) -> Matriz:
+        """Carga toda la matriz como lista de listas (solo si cabe en RAM)."""
+        return self.read_tile(0, self._shape[0], 0, self._shape[1]).tolist()
+
+    def flush(self) -> None:
+        """Asegura que lo escrito llegue al archivo."""
+        self._mm.flush()
+
+    def close(self) -> None:
+        """Libera el mapeo y cierra el archivo (y lo borra si es temporal)."""
+        if self._temporal is not None:
+            self._temporal()
+        elif not self._mm.closed:
+            _liberar_mapeo(self._buf, self._mm, self._archivo)
+
+    def __enter__(self) -> "MappedMatrix":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        filas, columnas = self._shape
+        return f"MappedMatrix({self.path!r}, <{filas}x{columnas}>)"
+
+
+def _liberar_mapeo(buf, mm, archivo, path: str | None = None) -> None:
+    """Cierra un mapeo; con path también borra el archivo (temporales)."""
+    if not mm.closed:
+        buf.release()
+        mm.close()
+        archivo.close()
+    if path is not None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _leer_cabecera_npy(archivo) -> tuple[tuple[int, int], int, str]:
+    """Devuelve (shape, byte de inicio de los datos, typecode) de un .npy."""
+    import ast
+    import struct
+
+    if archivo.read(6) != _NPY_MAGIA:
+        raise ValueError("No es un archivo .npy")
+    mayor, _ = archivo.read(2)
+    formato = "<H" if mayor == 1 else "<I"
+    (largo,) = struct.unpack(formato, archivo.read(struct.calcsize(formato)))
+    cabecera = ast.literal_eval(archivo.read(largo).decode("latin1"))
+    descr = cabecera["descr"]
+    codigo = _CODIGOS_DTYPE.get(descr[1:]) if descr[:1] in ("<", "|") else None
+    if codigo is None or sys.byteorder != "little":
+        raise ValueError(
+            f"Solo se admite float64, float32 o int64 little-endian ({descr})"
+        )
+    if cabecera["fortran_order"]:
+        raise ValueError("Solo se admiten arreglos .npy en orden C")
+    forma = tuple(cabecera["shape"])
+    if len(forma) == 1:
+        forma = (1, forma[0])
+    if len(forma) != 2:
+        raise ValueError(f"Se esperaba un arreglo 2D (forma {forma})")
+    return forma, archivo.tell(), codigo
+
+
+def _cabecera_npy(forma: tuple[int, int], codigo: str = "d") -> bytes:
+    """Cabecera .npy versión 1.0 alineada a 64 bytes."""
+    import struct
+
+    descr = "<" + _DESCRIPTORES[codigo]
+    texto = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {tuple(forma)}, }}"
+    relleno = -(len(_NPY_MAGIA) + 4 + len(texto) + 1) % 64
+    texto = texto + " " * relleno + "\n"
+    return _NPY_MAGIA + bytes([1, 0]) + struct.pack("<H", len(texto)) + texto.encode()
+
+
+def open_memmap(
+    path: str, shape: tuple[int, int] | None = None, mode: str = "r"
+) -> MappedMatrix:
+    """Abre una matriz float64 en disco sin cargarla en memoria.
+
+    Equivalente en NumPy: np.load(path, mmap_mode=mode)
+
+    Args:
+        path: Archivo .npy o binario crudo de float64 en orden por filas.
+        shape: Forma (obligatoria para archivos crudos; en .npy se lee de
+               la cabecera).
+        mode: "r" solo lectura, "r+" lectura y escritura.
+
+    Returns:
+        MappedMatrix: La matriz mapeada.
+
+    Raises:
+        ValueError: Si falta la forma o el archivo no coincide con ella.
+    """
+    with open(path, "rb") as archivo:
+        es_npy = archivo.read(6) == _NPY_MAGIA
+        archivo.seek(0)
+        if es_npy:
+            shape, inicio, codigo = _leer_cabecera_npy(archivo)
+            if codigo != "d":
+                raise ValueError(f"MappedMatrix solo admite float64 ({codigo!r})")
+        elif shape is None:
+            raise ValueError("Los archivos crudos necesitan shape=(filas, columnas)")
+        else:
+            inicio = 0
+    return MappedMatrix(path, shape, inicio, mode)
+
+
+def create_memmap(path: str, shape: tuple[int, int]) -> MappedMatrix:
+    """Crea (o sobrescribe) una matriz de ceros en disco y la abre para escribir.
+
+    Si path termina en .npy se escribe la cabecera de NumPy; si no, el
+    archivo es binario crudo.
+
+    Args:
+        path: Ruta del archivo.
+        shape: Tupla (filas, columnas).
+
+    Returns:
+        MappedMatrix: La matriz mapeada en modo lectura/escritura.
+    """
+    filas, columnas = shape
+    cabecera = _cabecera_npy((filas, columnas)) if path.endswith(".npy") else b""
+    with open(path, "wb") as archivo:
+        archivo.write(cabecera)
+        # truncate extiende el archivo con ceros sin escribirlos uno a uno
+        archivo.truncate(len(cabecera) + filas * columnas * _BYTES_FLOAT)
+    return MappedMatrix(path, (filas, columnas), len(cabecera), "r+")
+
+
+def _es_mapeada(*operandos) -> bool:
+    return any(isinstance(x, MappedMatrix) for x in operandos)
+
+
+def _tesela(X, i0: int, i1: int, j0: int, j1: int) -> Matrix:
+    """Bloque [i0, i1) x [j0, j1) de cualquier matriz, como Matrix."""
+    if isinstance(X, MappedMatrix):
+        return X.read_tile(i0, i1, j0, j1)
+    if isinstance(X, Matrix):
+        return X[i0:i1, j0:j1]
+    return Matrix.from_lists([fila[j0:j1] for fila in X[i0:i1]])
+
+
+def _escribir_tesela(out, i0: int, j0: int, M: Matrix) -> None:
+    if isinstance(out, MappedMatrix):
+        out.write_tile(i0, j0, M)
+    elif isinstance(out, Matrix):
+        filas, columnas = M.shape
+        _escribir_filas(out[i0 : i0 + filas, j0 : j0 + columnas], M)
+    else:
+        columnas = M.shape[1]
+        for fila_out, fila in zip(out[i0:], M):
+            fila_out[j0 : j0 + columnas] = fila.tolist()
+
+
+def _salida_mapeada(out, forma: tuple[int, int]):
+    """Destino de una operación por teselas; sin out, un .npy temporal.
+
+    El temporal es de la MappedMatrix devuelta: weakref.finalize lo cierra
+    y lo borra en close(), al recolectarla o al terminar el intérprete.
+    """
+    if out is None:
+        import tempfile
+        import weakref
+
+        descriptor, path = tempfile.mkstemp(prefix="numpyless_", suffix=".npy")
+        os.close(descriptor)
+        resultado = create_memmap(path, forma)
+        resultado._temporal = weakref.finalize(
+            resultado,
+            _liberar_mapeo,
+            resultado._buf,
+            resultado._mm,
+            resultado._archivo,
+            path,
+        )
+        return resultado
+    _validar_out(out, forma)
+    return out
+
+
+def _teselas(n: int):
+    return ((k, builtins.min(k + TAMANO_TESELA, n)) for k in range(0, n, TAMANO_TESELA))
+
+
+def _mapeada_matmul(A, B, out):
+    m, n = shape(A)
+    if _es_vector(B):
+        if n != len(B):
+            raise ValueError(
+                f"Dimensiones incompatibles: A es {m}x{n} y v tiene {len(B)} elementos"
+            )
+        resultado: Vector = []
+        for i0, i1 in _teselas(m):
+            resultado.extend(matmul(_tesela(A, i0, i1, 0, n), B))
+        return resultado
+
+    n_b, p = shape(B)
+    if n != n_b:
+        raise ValueError(f"Dimensiones incompatibles: A es {m}x{n} y B es {n_b}x{p}")
+    out = _salida_mapeada(out, (m, p))
+    # Memoria máxima: una tesela de A, una de B y una del resultado
+    for i0, i1 in _teselas(m):
+        for j0, j1 in _teselas(p):
+            acumulado = Matrix.zeros((i1 - i0, j1 - j0))
+            for k0, k1 in _teselas(n):
+                tesela_a = _tesela(A, i0, i1, k0, k1)
+                tesela_b = _tesela(B, k0, k1, j0, j1)
+                iadd_matrices(acumulado, matmul(tesela_a, tesela_b))
+            _escribir_tesela(out, i0, j0, acumulado)
+    return out
+
+
+def _mapeada_transpose(A, out):
+    m, n = shape(A)
+    out = _salida_mapeada(out, (n, m))
+    for i0, i1 in _teselas(m):
+        for j0, j1 in _teselas(n):
+            _escribir_tesela(out, j0, i0, _tesela(A, i0, i1, j0, j1).T)
+    return out
+
+
+def _mapeada_elemento(funcion, A, B, out):
+    """Aplica funcion(tesela_a, tesela_b) por bandas de filas completas."""
+    m, n = shape(A)
+    out = _salida_mapeada(out, (m, n))
+    filas_por_banda = builtins.max(
+        1, TAMANO_TESELA * TAMANO_TESELA // builtins.max(n, 1)
+    )
+    for i0 in range(0, m, filas_por_banda):
+        i1 = builtins.min(i0 + filas_por_banda, m)
+        tesela_b = None if B is None else _tesela(B, i0, i1, 0, n)
+        _escribir_tesela(out, i0, 0, funcion(_tesela(A, i0, i1, 0, n), tesela_b))
+    return out
+
+
+# -------------------------------------------------------------------
+# Sección 11: Núcleos para Matrices Pequeñas (2x2, 3x3, 4x4)
+# -------------------------------------------------------------------
+# En matrices diminutas los bucles genéricos y las validaciones cuestan más
+# que la aritmética. Estos núcleos desempaquetan los elementos en variables
+# locales y escriben las fórmulas completas. El desempaquetado valida la
+# forma: si una fila no tiene el largo esperado lanza ValueError (o
+# TypeError si no es una secuencia), y _pequena cae al camino genérico,
+# que da el mensaje de error habitual.
+
+
+def _matmul_2(A, B):
+    (a, b), (c, d) = A
+    (e, f), (g, h) = B
+    return [
+        [float(a * e + b * g), float(a * f + b * h)],
+        [float(c * e + d * g), float(c * f + d * h)],
+    ]
+
+
+def _matmul_3(A, B):
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = A
+    (b00, b01, b02), (b10, b11, b12), (b20, b21, b22) = B
+    return [
+        [
+            float(a00 * b00 + a01 * b10 + a02 * b20),
+            float(a00 * b01 + a01 * b11 + a02 * b21),
+            float(a00 * b02 + a01 * b12 + a02 * b22),
+        ],
+        [
+            float(a10 * b00 + a11 * b10 + a12 * b20),
+            float(a10 * b01 + a11 * b11 + a12 * b21),
+            float(a10 * b02 + a11 * b12 + a12 * b22),
+        ],
+        [
+            float(a20 * b00 + a21 * b10 + a22 * b20),
+            float(a20 * b01 + a21 * b11 + a22 * b21),
+            float(a20 * b02 + a21 * b12 + a22 * b22),
+        ],
+    ]
+
+
+def _matmul_4(A, B):
+    (
+        (a00, a01, a02, a03),
+        (a10, a11, a12, a13),
+        (a20, a21, a22, a23),
+        (a30, a31, a32, a33),
+    ) = A
+    (
+        (b00, b01, b02, b03),
+        (b10, b11, b12, b13),
+        (b20, b21, b22, b23),
+        (b30, b31, b32, b33),
+    ) = B
+    return [
+        [
+            float(a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30),
+            float(a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31),
+            float(a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32),
+            float(a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33),
+        ],
+        [
+            float(a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30),
+            float(a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31),
+            float(a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32),
+            float(a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33),
+        ],
+        [
+            float(a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30),
+            float(a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31),
+            float(a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32),
+            float(a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33),
+        ],
+        [
+            float(a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30),
+            float(a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31),
+            float(a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32),
+            float(a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33),
+        ],
+    ]
+
+
+def _det_2(A) -> float:
+    (a, b), (c, d) = A
+    return float(a * d - b * c)
+
+
+def _det_3(A) -> float:
+    (a, b, c), (d, e, f), (g, h, i) = A
+    return float(a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g))
+
+
+def _det_4(A) -> float:
+    (
+        (a00, a01, a02, a03),
+        (a10, a11, a12, a13),
+        (a20, a21, a22, a23),
+        (a30, a31, a32, a33),
+    ) = A
+    # Expansión de Laplace por menores 2x2 de las dos filas superiores
+    # (s) y de las dos inferiores (c)
+    s0 = a00 * a11 - a10 * a01
+    s1 = a00 * a12 - a10 * a02
+    s2 = a00 * a13 - a10 * a03
+    s3 = a01 * a12 - a11 * a02
+    s4 = a01 * a13 - a11 * a03
+    s5 = a02 * a13 - a12 * a03
+    c5 = a22 * a33 - a32 * a23
+    c4 = a21 * a33 - a31 * a23
+    c3 = a21 * a32 - a31 * a22
+    c2 = a20 * a33 - a30 * a23
+    c1 = a20 * a32 - a30 * a22
+    c0 = a20 * a31 - a30 * a21
+    return float(s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0)
+
+
+def _transpose_2(A):
+    (a, b), (c, d) = A
+    return [[a, c], [b, d]]
+
+
+def _transpose_3(A):
+    (a, b, c), (d, e, f), (g, h, i) = A
+    return [[a, d, g], [b, e, h], [c, f, i]]
+
+
+def _transpose_4(A):
+    (a, b, c, d), (e, f, g, h), (i, j, k, l), (m, n, o, p) = A
+    return [[a, e, i, m], [b, f, j, n], [c, g, k, o], [d, h, l, p]]
+
+
+_MATMUL_PEQUENO = {2: _matmul_2, 3: _matmul_3, 4: _matmul_4}
+_DET_PEQUENO = {2: _det_2, 3: _det_3, 4: _det_4}
+_TRANSPOSE_PEQUENO = {2: _transpose_2, 3: _transpose_3, 4: _transpose_4}
+_IDENTIDAD_PEQUENA = {
+    2: lambda: [[1.0, 0.0], [0.0, 1.0]],
+    3: lambda: [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+    4: lambda: [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ],
+}
+
+
+def _pequena(nucleos: dict, A, *otros):
+    """Aplica el núcleo para len(A), o devuelve None si no hay o no encaja."""
+    nucleo = nucleos.get(len(A))
+    if nucleo is None:
+        return None
+    try:
+        return nucleo(A, *otros)
+    except (ValueError, TypeError):
+        return None
+
+
+def _por_lotes(nucleos: dict, generica, lotes: list, *otros):
+    """Aplica un núcleo pequeño a todo el lote, o la versión genérica."""
+    if lotes and type(lotes[0]) is list:
+        nucleo = nucleos.get(len(lotes[0]))
+        if nucleo is not None:
+            try:
+                return list(map(nucleo, lotes, *otros))
+            except (ValueError, TypeError):
+                pass  # formas mezcladas: la versión genérica valida cada una
+    return list(map(generica, lotes, *otros))
+
+
+def batch_matmul(As: list[Matriz], Bs: "list[Matriz] | Matriz") -> list[Matriz]:
+    """Multiplica muchas matrices pequeñas de una vez: [A @ B for A, B ...].
+
+    Pensada para geometría y transformaciones: miles de productos 2x2,
+    3x3 o 4x4 con un solo núcleo desenrollado y sin validar ni despachar
+    en cada llamada. Otros tamaños usan matmul elemento a elemento.
+
+    Args:
+        As: Lista de matrices.
+        Bs: Lista de matrices del mismo largo, o una sola matriz que se
+            multiplica a la derecha de todas (por ejemplo, una transformación).
+
+    Returns:
+        list[Matriz]: Los productos, en el mismo orden.
+
+    Raises:
+        ValueError: Si las listas tienen distinto largo o alguna forma no es
+                    compatible.
+
+    Ejemplo:
+        >>> rotar = [[0, -1], [1, 0]]
+        >>> batch_matmul([[[1, 0], [0, 1]], [[2, 0], [0, 2]]], rotar)
+        [[[0.0, -1.0], [1.0, 0.0]], [[0.0, -2.0], [2.0, 0.0]]]
+    """
+    if Bs and Bs[0] and not hasattr(Bs[0][0], "__len__"):
+        Bs = repeat(Bs, len(As))  # una sola matriz para todo el lote
+    elif len(As) != len(Bs):
+        raise ValueError(f"Lotes de distinto largo: {len(As)} y {len(Bs)}")
+    return _por_lotes(_MATMUL_PEQUENO, matmul, As, Bs)
+
+
+def batch_det(As: list[Matriz]) -> Vector:
+    """Determinante de cada matriz de la lista.
+
+    Args:
+        As: Lista de matrices cuadradas.
+
+    Returns:
+        Vector: Un determinante por matriz.
+
+    Ejemplo:
+        >>> batch_det([[[4, 3], [2, 1]], [[1, 0], [0, 1]]])
+        [-2.0, 1.0]
+    """
+    return _por_lotes(_DET_PEQUENO, det, As)
+
+
+def batch_transpose(As: list[Matriz]) -> list[Matriz]:
+    """Transpuesta de cada matriz de la lista.
+
+    Args:
+        As: Lista de matrices.
+
+    Returns:
+        list[Matriz]: Las transpuestas, en el mismo orden.
+    """
+    return _por_lotes(_TRANSPOSE_PEQUENO, transpose, As)
+
+
+# -------------------------------------------------------------------
+# Sección 12: Autoajuste de Núcleos (Decisiones Persistentes por Forma)
+# -------------------------------------------------------------------
+# Qué núcleo de matmul es más rápido (tamaño de bloque, Strassen, procesos)
+# depende de la forma y de la máquina. Con AUTOAJUSTE activo, la primera
+# vez que aparece una clase de forma se cronometran los candidatos sobre
+# los datos reales y se guarda el ganador en un JSON; las siguientes
+# llamadas, y otros procesos que lean el mismo archivo, lo usan directo.
+
+_DECISIONES: dict | None = None
+
+
+def _ruta_autoajuste() -> str:
+    """Archivo de decisiones: NUMPYLESS_AUTOTUNE_CACHE o la caché del usuario."""
+    ruta = os.environ.get("NUMPYLESS_AUTOTUNE_CACHE")
+    if ruta:
+        return ruta
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "numpyless", "autotune.json")
+
+
+def _leer_decisiones() -> dict:
+    try:
+        with open(_ruta_autoajuste(), encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+    except (OSError, ValueError):
+        return {}
+    return datos if isinstance(datos, dict) else {}
+
+
+def _decisiones() -> dict:
+    global _DECISIONES
+    if _DECISIONES is None:
+        _DECISIONES = _leer_decisiones()
+    return _DECISIONES
+
+
+def _guardar_decision(clave: str, decision: dict) -> None:
+    _decisiones()[clave] = decision
+    ruta = _ruta_autoajuste()
+    try:
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        # Se relee para no pisar lo que otro proceso guardó mientras tanto
+        datos = _leer_decisiones()
+        datos[clave] = decision
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, indent=2, sort_keys=True)
+        os.replace(temporal, ruta)
+    except OSError:
+        pass  # sin disco escribible la decisión vive solo en memoria
+
+
+def _clave_autoajuste(funcion: str, dims: tuple[int, ...]) -> str:
+    # Clase de forma: cada dimensión sube a la potencia de 2 siguiente, así
+    # 300x300 y 500x500 comparten decisión (512x512)
+    clase = "x".join(str(1 << builtins.max(d - 1, 0).bit_length()) for d in dims)
+    version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    return f"{funcion}|{clase}|py{version}"
+
+
+def _elegir_nucleo(funcion: str, dims: tuple[int, ...], candidatos, ejecutar):
+    """Devuelve (nucleo, resultado); resultado es None si no hubo que medir.
+
+    Al medir, cada candidato calcula el resultado real una vez y se
+    devuelve el último, así el ajuste no repite trabajo de más.
+    """
+    clave = _clave_autoajuste(funcion, dims)
+    elegido = _decisiones().get(clave, {}).get("nucleo")
+    if elegido in candidatos:
+        return elegido, None
+    tiempos = {}
+    resultado = None
+    for nombre in candidatos:
+        inicio = time.perf_counter()
+        resultado = ejecutar(nombre)
+        tiempos[nombre] = time.perf_counter() - inicio
+    elegido = builtins.min(tiempos, key=tiempos.get)
+    _guardar_decision(clave, {"nucleo": elegido, "tiempos": tiempos})
+    return elegido, resultado
+
+
+def _candidatos_matmul(m: int, n: int, p: int) -> list[str]:
+    candidatos = ["bloques:32", "bloques:64", "bloques:128"]
+    menor = builtins.min(m, n, p)
+    # Strassen solo tiene sentido si hace al menos un nivel de recursión
+    candidatos += [f"strassen:{u}" for u in (64, 128, 256) if menor >= 2 * u]
+    if _procesos(None) > 1 and m * n * p >= UMBRAL_PARALELO:
+        candidatos.append("paralelo")
+    return candidatos
+
+
+def _nucleo_matmul(nombre: str, A, B, forma: tuple[int, int]):
+    tipo, _, parametro = nombre.partition(":")
+    if tipo == "paralelo":
+        return _matmul_paralelo(A, B, _procesos(None))
+    filas_a, columnas_b = _filas(A), _columnas(B)
+    if tipo == "strassen":
+        resultado = _strassen(filas_a, columnas_b, int(parametro))
+    else:
+        resultado = _matmul_bloques(filas_a, columnas_b, tamano=int(parametro))
+    if isinstance(A, Matrix) or isinstance(B, Matrix):
+        return _desde_filas(resultado, forma, _promover(_codigo_de(A), _codigo_de(B)))
+    return resultado
+
+
+def _matmul_autoajustado(A, B, dims: tuple[int, int, int]):
+    m, n, p = dims
+
+    def ejecutar(nombre: str):
+        return _nucleo_matmul(nombre, A, B, (m, p))
+
+    nombre, resultado = _elegir_nucleo(
+        "matmul", dims, _candidatos_matmul(m, n, p), ejecutar
+    )
+    return ejecutar(nombre) if resultado is None else resultado
+
+
+def autotune_matmul(m: int, n: int, p: int, *, semilla: int = 0) -> str:
+    """Cronometra los núcleos de matmul para una forma y guarda el ganador.
+
+    Sirve para ajustar por adelantado (por ejemplo, al instalar) en lugar
+    de pagar el ajuste en la primera llamada real. La decisión vale para
+    toda la clase de forma (dimensiones redondeadas a potencias de 2) y
+    la versión de Python, y se guarda en disco (NUMPYLESS_AUTOTUNE_CACHE o
+    ~/.cache/numpyless/autotune.json).
+
+    Args:
+        m, n, p: Forma del producto (m x n) @ (n x p).
+        semilla: Semilla de las matrices aleatorias de prueba.
+
+    Returns:
+        str: El núcleo elegido ("bloques:64", "strassen:128", "paralelo"...).
+
+    Ejemplo:
+        >>> autotune_matmul(256, 256, 256)  # doctest: +SKIP
+        'strassen:64'
+
+        El resultado depende de la máquina y la llamada escribe el caché en
+        disco; por eso el ejemplo no se ejecuta con doctest.
+    """
+    rng = random.Random(semilla)
+    A = [[rng.random() for _ in range(n)] for _ in range(m)]
+    B = [[rng.random() for _ in range(p)] for _ in range(n)]
+    clave = _clave_autoajuste("matmul", (m, n, p))
+    _decisiones().pop(clave, None)  # forzar una medición nueva
+    return _elegir_nucleo(
+        "matmul",
+        (m, n, p),
+        _candidatos_matmul(m, n, p),
+        lambda nombre: _nucleo_matmul(nombre, A, B, (m, p)),
+    )[0]
+
+
+def clear_autotune_cache() -> None:
+    """Olvida todas las decisiones del autoajuste (en memoria y en disco)."""
+    global _DECISIONES
+    _DECISIONES = {}
+    try:
+        os.remove(_ruta_autoajuste())
+    except FileNotFoundError:
+        pass
+
+
+# -------------------------------------------------------------------
+# Sección 13: Caché de Resultados (LRU por Huella de Contenido)
+# -------------------------------------------------------------------
+# Las listas no son hashables, así que functools.lru_cache no sirve. La
+# clave es una huella del contenido (forma + blake2b de los flotantes): si
+# quien llama modifica la matriz después, la huella cambia y no se reutiliza
+# un resultado viejo. Los resultados se devuelven copiados, así modificar
+# lo devuelto tampoco corrompe la caché.
+
+_CACHE: "_CacheLRU | None" = None
+
+
+class _CacheLRU:
+    """Diccionario acotado que descarta la entrada usada hace más tiempo."""
+
+    __slots__ = ("maxsize", "hits", "misses", "_datos")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._datos: OrderedDict = OrderedDict()
+
+    def obtener(self, clave, calcular):
+        """Devuelve (una copia de) el valor de clave, calculándolo si falta."""
+        datos = self._datos
+        if clave in datos:
+            datos.move_to_end(clave)
+            self.hits += 1
+            return _copia(datos[clave])
+        self.misses += 1
+        valor = calcular()
+        datos[clave] = valor
+        while len(datos) > self.maxsize:
+            datos.popitem(last=False)
+        return _copia(valor)
+
+
+def _huella(A) -> tuple:
+    """Clave de contenido de una matriz: (compacta, forma, dtype, digest)."""
+    if isinstance(A, Matrix):
+        datos = A._plana()
+    else:
+        datos = array("d", chain.from_iterable(A))
+    digest = hashlib.blake2b(datos, digest_size=16).digest()
+    return (isinstance(A, Matrix), shape(A), _codigo_de(A), digest)
+
+
+def _copia(valor):
+    if isinstance(valor, Matrix):
+        return valor.copy()
+    if isinstance(valor, list):
+        return [list(fila) for fila in valor]
+    return valor  # LU y flotantes no se modifican desde fuera
+
+
+def enable_cache(maxsize: int = 128) -> None:
+    """Activa la caché de resultados de det, lu, solve, solve_many, inv y matmul.
+
+    La factorización LU se guarda por huella de la matriz, así lu, det,
+    solve, solve_many e inv de una matriz ya vista no la recalculan (det de
+    listas hasta 4x4 usa fórmulas cerradas sin caché); inv guarda además su
+    resultado. matmul solo usa la caché si se le pide con cache=True, para
+    que los productos de matrices que cambian no desplacen a las LU.
+
+    Calcular la huella cuesta O(n²), poco frente al O(n³) que ahorra, pero
+    no conviene en matrices que cambian en cada llamada.
+
+    Args:
+        maxsize: Cantidad máxima de resultados guardados (LRU).
+
+    Ejemplo:
+        >>> enable_cache(64)
+        >>> A = [[4, 3], [6, 3]]
+        >>> x = solve(A, [10, 12])  # factoriza y guarda la LU
+        >>> y = solve(A, [1, 0])  # reutiliza la LU
+        >>> cache_info()["hits"]
+        1
+        >>> disable_cache()
+    """
+    global _CACHE
+    if maxsize < 1:
+        raise ValueError(f"maxsize debe ser positivo (es {maxsize})")
+    _CACHE = _CacheLRU(maxsize)
+
+
+def disable_cache() -> None:
+    """Desactiva la caché de resultados y libera lo guardado."""
+    global _CACHE
+    _CACHE = None
+
+
+def cache_clear() -> None:
+    """Vacía la caché (si está activa) y reinicia sus contadores."""
+    if _CACHE is not None:
+        _CACHE._datos.clear()
+        _CACHE.hits = _CACHE.misses = 0
+
+
+def cache_info() -> dict:
+    """Estado de la caché: hits, misses, size y maxsize (ceros si inactiva)."""
+    if _CACHE is None:
+        return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+    return {
+        "hits": _CACHE.hits,
+        "misses": _CACHE.misses,
+        "size": len(_CACHE._datos),
+        "maxsize": _CACHE.maxsize,
+    }
+
+
+# -------------------------------------------------------------------
+# Sección 14: Iteradores de Filas (Pipelines en Memoria Constante)
+# -------------------------------------------------------------------
+# Versiones generadoras de matmul, add_matrices y transpose: producen el
+# resultado fila por fila en lugar de construir la matriz completa, y
+# aceptan como entrada cualquier iterable de filas (por ejemplo, un archivo
+# leído línea a línea). Encadenadas, solo hay una fila viva por etapa.
+
+
+def _iter_filas(A):
+    """Itera las filas de una matriz, MappedMatrix o iterable de filas."""
+    if isinstance(A, MappedMatrix):
+        m, n = A.shape
+        return (A.read_tile(i, i + 1, 0, n)._fila(0) for i in range(m))
+    return iter(A)
+
+
+def iter_matmul(A, B: Matriz | Matrix):
+    """Genera las filas de A @ B una a una.
+
+    Cada fila de A se consume, se multiplica por B y se descarta: la
+    memoria usada es la de B (que sí se necesita completa, porque cada fila
+    del resultado la recorre entera) más una fila.
+
+    Args:
+        A: Matriz m x n o cualquier iterable de filas de largo n (un
+           generador, un csv.reader convertido a float, otro iter_*...).
+        B: Matriz n x p (lista de listas, Matrix o MappedMatrix).
+
+    Yields:
+        Vector: Cada fila del resultado (p flotantes).
+
+    Raises:
+        ValueError: Si una fila de A no tiene n elementos (al llegar a ella).
+
+    Ejemplo:
+        >>> import io
+        >>> archivo = io.StringIO("1,2\\n3,4\\n")  # como un open("datos.csv")
+        >>> filas = ([float(x) for x in linea.split(",")] for linea in archivo)
+        >>> list(iter_matmul(filas, [[1, 0], [0, 2]]))
+        [[1.0, 4.0], [3.0, 8.0]]
+    """
+    if isinstance(B, MappedMatrix):
+        B = B.read_tile(0, B.shape[0], 0, B.shape[1])
+    n, _ = shape(B)
+    columnas_b = _columnas(B)
+    for i, fila in enumerate(_iter_filas(A)):
+        if len(fila) != n:
+            raise ValueError(
+                f"Dimensiones incompatibles: la fila {i} de A tiene {len(fila)} "
+                f"elementos y B tiene {n} filas"
+            )
+        yield [float(_sumprod(fila, columna)) for columna in columnas_b]
+
+
+def iter_add_matrices(A, B):
+    """Genera las filas de A + B una a una, leyendo ambas en paralelo.
+
+    Args:
+        A: Matriz o iterable de filas.
+        B: Matriz o iterable de filas, con la misma forma que A.
+
+    Yields:
+        Vector: Cada fila de la suma.
+
+    Raises:
+        ValueError: Si alguna fila difiere en largo o si una entrada tiene
+                    más filas que la otra (al detectarlo).
+
+    Ejemplo:
+        >>> list(iter_add_matrices(iter([[1, 2]]), [[3, 4]]))
+        [[4.0, 6.0]]
+    """
+    filas_a, filas_b = _iter_filas(A), _iter_filas(B)
+    fin = object()
+    i = 0
+    while True:
+        fila_a, fila_b = next(filas_a, fin), next(filas_b, fin)
+        if fila_a is fin or fila_b is fin:
+            if fila_a is not fila_b:
+                corta = "A" if fila_a is fin else "B"
+                raise ValueError(f"{corta} termina tras {i} filas y la otra sigue")
+            return
+        if len(fila_a) != len(fila_b):
+            raise ValueError(
+                f"La fila {i} tiene {len(fila_a)} elementos en A y "
+                f"{len(fila_b)} en B"
+            )
+        yield [float(x) for x in map(_suma, fila_a, fila_b)]
+        i += 1
+
+
+def iter_transpose(A):
+    """Genera las filas de la transpuesta de A (las columnas de A) una a una.
+
+    Con una Matrix o lista de listas no se copia A: cada columna se arma
+    al pedirla. Un iterable de una sola pasada se carga primero, porque la
+    última fila de A aporta un elemento a cada fila de la transpuesta; aun
+    así el resultado no se materializa completo.
+
+    Args:
+        A: Matriz, MappedMatrix o iterable de filas.
+
+    Yields:
+        list: Cada columna de A.
+
+    Ejemplo:
+        >>> list(iter_transpose([[1, 2, 3], [4, 5, 6]]))
+        [[1, 4], [2, 5], [3, 6]]
+    """
+    if isinstance(A, Matrix):
+        for j in range(A.shape[1]):
+            yield A._columna(j).tolist()
+        return
+    if isinstance(A, MappedMatrix):
+        m, n = A.shape
+        for j in range(n):
+            yield A.read_tile(0, m, j, j + 1)._plana().tolist()
+        return
+    if not isinstance(A, list):
+        A = list(A)
+    for j in range(len(A[0]) if A else 0):
+        yield [fila[j] for fila in A]
+
+
+# -------------------------------------------------------------------
+# Sección 15: Interoperabilidad (Protocolo de Buffer y Serialización)
+# -------------------------------------------------------------------
+# Convertir con tolist() / np.array() copia elemento a elemento y cuesta
+# más que muchas operaciones. Matrix exporta su buffer (M.data,
+# __array_interface__ para NumPy) y from_buffer() envuelve el de otro
+# objeto, así los datos cruzan de una biblioteca a la otra sin copiarse.
+
+
+def _codigo_de_formato(vista: memoryview) -> str | None:
+    """Typecode de Matrix para el formato de un buffer, o None si no hay.
+
+    NumPy exporta int64 como 'l' en Linux y macOS (y como 'q' en Windows),
+    así que los enteros se reconocen por tamaño y no solo por letra.
+    """
+    formato = vista.format
+    orden, tipo = (formato[0], formato[1:]) if len(formato) == 2 else ("@", formato)
+    nativo = "<" if sys.byteorder == "little" else ">"
+    if orden not in ("@", "=", nativo) and not (orden == "!" and nativo == ">"):
+        return None
+    if tipo in ("d", "f"):
+        return tipo
+    if tipo in ("q", "l") and vista.itemsize == 8:
+        return "q"
+    return None
+
+
+def from_buffer(obj, shape: tuple[int, int] | None = None, dtype=None):
+    """Envuelve sin copiar cualquier objeto con protocolo de buffer.
+
+    Sirve para arreglos de NumPy (float64, float32 o int64, contiguos en
+    orden C), array('d'/'f'/'q'), bytearray, mmap, memoryview... Los
+    cambios de un lado se ven del otro. Si el buffer es de solo lectura
+    (bytes), la Matrix también lo es.
+
+    Equivalente en NumPy: np.frombuffer(obj, dtype)
+
+    Args:
+        obj: Objeto que exporta un buffer float64, float32 o int64 (o
+             bytes crudos).
+        shape: Forma (filas, columnas). Por defecto la del buffer si es 2D;
+               un buffer 1D sin shape se devuelve como vector.
+        dtype: Cómo leer los bytes crudos (por defecto float64). En un
+               buffer con formato debe coincidir con el suyo, o ser None.
+
+    Returns:
+        Matrix | memoryview: Matrix que comparte memoria (con el dtype del
+        buffer), o un memoryview 1D de ese formato (que sirve como Vector)
+        si no hay forma 2D.
+
+    Raises:
+        ValueError: Si el formato no es un dtype de Matrix, no coincide con
+                    dtype, el buffer no es contiguo o la forma no coincide.
+
+    Ejemplo:
+        >>> datos = array("d", range(6))
+        >>> M = from_buffer(datos, (2, 3))
+        >>> M[1, 2] = -1.0
+        >>> datos[5]
+        -1.0
+        >>> from_buffer(array("q", [1, 2, 3, 4]), (2, 2)).dtype
+        'int64'
+    """
+    vista = memoryview(obj)
+    es_bytes = vista.format in ("B", "b", "c")
+    if es_bytes:
+        codigo = _codigo(dtype)
+    else:
+        codigo = _codigo_de_formato(vista)
+        if codigo is None:
+            raise ValueError(
+                f"Se esperaba un buffer {', '.join(DTYPES)} (formato {vista.format!r})"
+            )
+        if dtype is not None and _codigo(dtype) != codigo:
+            raise ValueError(
+                f"El buffer es {_NOMBRES_DTYPE[codigo]}, no se puede leer como "
+                f"{_NOMBRES_DTYPE[_codigo(dtype)]}"
+            )
+    if not vista.c_contiguous:
+        raise ValueError("El buffer debe ser contiguo en orden C")
+    tamano = array(codigo).itemsize
+    if es_bytes and vista.nbytes % tamano:
+        raise ValueError(f"{vista.nbytes} bytes no es múltiplo de {tamano}")
+    if not es_bytes and vista.ndim > 2:
+        raise ValueError(f"Se esperaba un buffer 1D o 2D (forma {vista.shape})")
+    if shape is None and vista.ndim == 2 and not es_bytes:
+        shape = vista.shape
+    # memoryview no puede cambiar de formato si la forma tiene ceros
+    plano = vista.cast("B").cast(codigo) if vista.nbytes else memoryview(array(codigo))
+    if shape is None:
+        return plano
+    filas, columnas = shape
+    if filas * columnas != len(plano):
+        raise ValueError(f"{len(plano)} elementos no alcanzan para la forma {shape}")
+    return Matrix(plano, (filas, columnas))
+
+
+def save(path: str, A: "Matriz | Matrix") -> None:
+    """Guarda una matriz en disco con una sola escritura de su buffer.
+
+    Si path termina en .npy se escribe la cabecera de NumPy (np.load lo
+    lee); si no, el archivo es binario crudo en orden por filas. Una
+    Matrix se guarda con su dtype; las listas, como float64.
+
+    Equivalente en NumPy: np.save(path, A)
+
+    Args:
+        path: Ruta del archivo.
+        A: Matriz (lista de listas o Matrix).
+    """
+    plana = A._plana() if isinstance(A, Matrix) else _plano(A)
+    with open(path, "wb") as archivo:
+        if path.endswith(".npy"):
+            archivo.write(_cabecera_npy(shape(A), _codigo_de(A)))
+        archivo.write(plana)
+
+
+def load(path: str, shape: tuple[int, int] | None = None, dtype=None) -> Matrix:
+    """Lee una matriz guardada con save() (o np.save) en una sola lectura.
+
+    Equivalente en NumPy: np.load(path)
+
+    Args:
+        path: Archivo .npy o binario crudo.
+        shape: Forma (obligatoria para archivos crudos).
+        dtype: Tipo de los archivos crudos (float64 por defecto); en un
+               .npy lo indica la cabecera.
+
+    Returns:
+        Matrix: La matriz cargada en memoria.
+
+    Raises:
+        ValueError: Si falta la forma o el archivo no coincide con ella.
+    """
+    codigo = _codigo(dtype)
+    with open(path, "rb") as archivo:
+        es_npy = archivo.read(6) == _NPY_MAGIA
+        archivo.seek(0)
+        if es_npy:
+            shape, _, codigo = _leer_cabecera_npy(archivo)
+        elif shape is None:
+            raise ValueError("Los archivos crudos necesitan shape=(filas, columnas)")
+        filas, columnas = shape
+        plana = array(codigo)
+        try:
+            plana.fromfile(archivo, filas * columnas)
+        except EOFError:
+            raise ValueError(f"El archivo no alcanza para la forma {shape}") from None
+    return Matrix(plana, (filas, columnas))
+
+
+# -------------------------------------------------------------------
+# Sección 16: Reducciones por Eje y Broadcasting
+# -------------------------------------------------------------------
+# sum, mean, var, min, max y argmax recorren la matriz una sola vez, fila
+# por fila (una MappedMatrix también, sin cargarla entera), con
+# acumuladores estables: math.fsum para las sumas y Welford/Chan para la
+# varianza. Con axis=0 sobre una Matrix se reduce la vista A.T, cuyas
+# filas son cortes en C del buffer, y sobre listas zip(*A), que entrega
+# una columna por vez: ninguna de las dos construye la transpuesta.
+# Solo una MappedMatrix acumula las columnas recorriendo sus filas.
+#
+# broadcast_add, broadcast_subtract, broadcast_multiply y broadcast_divide
+# combinan cada fila de A con un escalar, un vector fila (1 x n) o un
+# vector columna (m x 1) sin construir el operando expandido a m x n.
+
+
+def _eje(axis: int | None) -> int | None:
+    """Normaliza axis a 0, 1 o None (acepta -1 y -2 como NumPy)."""
+    if axis is None:
+        return None
+    if axis not in (0, 1, -1, -2):
+        raise ValueError(f"axis debe ser 0, 1 o None (se recibió {axis!r})")
+    return axis % 2
+
+
+def _reducir(A, axis, nombre: str, por_fila, por_columnas, total, keepdims, codigo):
+    """Esqueleto común de las reducciones: una sola pasada por las filas.
+
+    por_fila reduce una secuencia (una fila, una columna de una Matrix o
+    un vector); por_columnas(filas, forma) reduce cada columna recorriendo
+    las filas una vez; total(filas, forma) reduce todos los elementos.
+    codigo es el typecode del resultado con keepdims sobre una Matrix.
+    """
+    axis = _eje(axis)
+    if _es_vector(A):
+        if axis == 1:
+            raise ValueError("Un vector solo admite axis=0 o None")
+        v = _vector(A)
+        if not len(v) and nombre != "sum":
+            raise ValueError(f"{nombre}() de un vector vacío")
+        resultado = por_fila(v)
+        return [resultado] if keepdims else resultado
+
+    m, n = forma = shape(A)
+    if not {None: m * n, 0: m, 1: n}[axis] and nombre != "sum":
+        raise ValueError(f"{nombre}() sin elementos que reducir (forma {forma})")
+    if axis is None:
+        resultado = total(_iter_filas(A), forma)
+    elif axis == 1:
+        resultado = list(map(por_fila, _iter_filas(A)))
+    elif isinstance(A, Matrix):
+        # Las columnas de A son las filas de la vista A.T (cortes en C)
+        resultado = list(map(por_fila, A.T))
+    elif isinstance(A, list) and m:
+        resultado = list(map(por_fila, zip(*A)))
+    else:
+        resultado = por_columnas(_iter_filas(A), forma)
+    if not keepdims:
+        return resultado
+
+    if axis is None:
+        filas, forma = [[resultado]], (1, 1)
+    elif axis == 0:
+        filas, forma = [resultado], (1, n)
+    else:
+        filas, forma = [[x] for x in resultado], (m, 1)
+    if isinstance(A, (Matrix, MappedMatrix)):
+        return _desde_filas(filas, forma, codigo)
+    return filas
+
+
+def _sumar(codigo: str):
+    """Suma exacta: enteros de Python para int64, math.fsum para flotantes."""
+    return builtins.sum if codigo == "q" else math.fsum
+
+
+def _suma_columnas(filas, n: int) -> Vector:
+    """Suma de cada columna con compensación de Kahan, fila por fila."""
+    sumas, errores = [0.0] * n, [0.0] * n
+    for fila in filas:
+        y = list(map(_resta, fila, errores))
+        t = list(map(_suma, sumas, y))
+        # Lo que se perdió al redondear t se descuenta de la fila siguiente
+        errores = list(map(_resta, map(_resta, t, sumas), y))
+        sumas = t
+    return sumas
+
+
+def _momentos(valores, base: float) -> tuple[int, float, float]:
+    """(cantidad, media de x - base, suma de desvíos al cuadrado).
+
+    Restar base (un valor de los datos) deja la media cerca de cero, así no
+    se redondea a la escala de los datos cuando éstos están lejos de cero;
+    la varianza no cambia. La secuencia ya está en memoria (una fila): se
+    recorre dos veces con fsum sin volver a leer la matriz.
+    """
+    k = len(valores)
+    x = list(map(_resta, valores, repeat(base)))
+    media = math.fsum(x) / k if k else 0.0
+    desvios = list(map(_resta, x, repeat(media)))
+    return k, media, math.fsum(map(_producto, desvios, desvios))
+
+
+def _momentos_columnas(filas, n: int) -> tuple[int, Vector]:
+    """Welford por columnas: (filas vistas, M2 de cada columna) en una pasada.
+
+    Los valores se desplazan restando la primera fila (la varianza no
+    cambia): así la media acumulada es pequeña y no se redondea a la escala
+    de los datos cuando éstos están lejos de cero.
+    """
+    k, medias, m2 = 0, [0.0] * n, [0.0] * n
+    base = None
+    for k, fila in enumerate(filas, 1):
+        if base is None:
+            base = list(fila)
+        x = list(map(_resta, fila, base))
+        delta = list(map(_resta, x, medias))
+        medias = list(map(_suma, medias, map(_cociente, delta, repeat(k))))
+        # M2 += delta * (x - media nueva)
+        m2 = list(map(_suma, m2, map(_producto, delta, map(_resta, x, medias))))
+    return k, m2
+
+
+def _momentos_total(filas) -> tuple[int, float]:
+    """Combina los momentos de cada fila con la fórmula de Chan et al.
+
+    Todas las filas se desplazan por el mismo valor (el primer elemento),
+    así sus medias son comparables y quedan cerca de cero.
+    """
+    k, media, m2 = 0, 0.0, 0.0
+    base = None
+    for fila in filas:
+        if not len(fila):
+            continue
+        if base is None:
+            base = fila[0]
+        k_fila, media_fila, m2_fila = _momentos(fila, base)
+        nuevo = k + k_fila
+        delta = media_fila - media
+        media += delta * k_fila / nuevo
+        m2 += m2_fila + delta * delta * k * k_fila / nuevo
+        k = nuevo
+    return k, m2
+
+
+def _extremos_columnas(elegir, filas) -> Vector:
+    """Mínimo o máximo (elegir) de cada columna, fila por fila."""
+    filas = iter(filas)
+    acumulado = list(next(filas))
+    for fila in filas:
+        acumulado = list(map(elegir, acumulado, fila))
+    return acumulado
+
+
+def _argmax(valores) -> int:
+    """Índice del primer máximo de una secuencia (dos recorridos en C)."""
+    return _indice_de(valores, builtins.max(valores))
+
+
+def _argmax_columnas(filas) -> list[int]:
+    """Fila del primer máximo de cada columna, en una pasada."""
+    filas = iter(filas)
+    mejores = list(next(filas))
+    indices = [0] * len(mejores)
+    for i, fila in enumerate(filas, 1):
+        # Solo se visitan en Python las columnas en que esta fila mejora
+        for j in compress(range(len(mejores)), map(_mayor, fila, mejores)):
+            mejores[j] = fila[j]
+            indices[j] = i
+    return indices
+
+
+def _argmax_total(filas, forma: tuple[int, int]) -> int:
+    """Índice plano (i * n + j) del primer máximo de toda la matriz."""
+    mejor, indice = None, 0
+    for i, fila in enumerate(filas):
+        j = _argmax(fila)
+        if mejor is None or fila[j] > mejor:
+            mejor, indice = fila[j], i * forma[1] + j
+    return indice
+
+
+def sum(
+    A: Matriz | Matrix | Vector, axis: int | None = None, *, keepdims: bool = False
+) -> float | Vector | Matriz | Matrix:
+    """Suma los elementos de A, en total o a lo largo de un eje.
+
+    Equivalente en NumPy: np.sum(A, axis=axis, keepdims=keepdims)
+
+    Args:
+        A: Matriz (lista de listas, Matrix o MappedMatrix) o vector.
+        axis: None suma todo; 0 suma cada columna (n valores); 1 suma cada
+              fila (m valores). También se aceptan -1 y -2.
+        keepdims: Si True el resultado conserva dos dimensiones (1 x n con
+                  axis=0, m x 1 con axis=1, 1 x 1 con axis=None), listo
+                  para broadcast_*. Es Matrix si A es Matrix o MappedMatrix.
+
+    Returns:
+        float | Vector: La suma (enteros exactos si A es int64).
+
+    Raises:
+        ValueError: Si axis no es 0, 1 o None.
+
+    Ejemplos:
+        >>> sum([[1, 2], [3, 4]])
+        10.0
+        >>> sum([[1, 2], [3, 4]], axis=0)
+        [4.0, 6.0]
+
+    Rendimiento:
+        Cada elemento se lee una vez. Las sumas usan math.fsum (redondeo
+        exacto), también por columnas en listas y Matrix; en una
+        MappedMatrix las columnas se acumulan fila a fila con compensación
+        de Kahan.
+    """
+    codigo = _codigo_de(A)
+    sumar = _sumar(codigo)
+
+    def por_columnas(filas, forma):
+        return _suma_columnas(filas, forma[1])
+
+    def total(filas, forma):
+        return sumar(chain.from_iterable(filas))
+
+    return _reducir(A, axis, "sum", sumar, por_columnas, total, keepdims, codigo)
+
+
+def mean(
+    A: Matriz | Matrix | Vector, axis: int | None = None, *, keepdims: bool = False
+) -> float | Vector | Matriz | Matrix:
+    """Media aritmética de A, en total o a lo largo de un eje.
+
+    Equivalente en NumPy: np.mean(A, axis=axis, keepdims=keepdims)
+
+    Args:
+        A: Matriz (lista de listas, Matrix o MappedMatrix) o vector.
+        axis: None, 0 (media de cada columna) o 1 (media de cada fila).
+        keepdims: Conserva dos dimensiones, como en sum().
+
+    Returns:
+        float | Vector: La media.
+
+    Raises:
+        ValueError: Si axis no es válido o no hay elementos.
+
+    Ejemplo:
+        >>> mean([[1, 2], [3, 4]], axis=1)
+        [1.5, 3.5]
+
+    Pista: Centrar columnas es broadcast_subtract(A, mean(A, axis=0))
+    """
+
+    def por_fila(fila):
+        return math.fsum(fila) / len(fila)
+
+    def por_columnas(filas, forma):
+        m, n = forma
+        return [s / m for s in _suma_columnas(filas, n)]
+
+    def total(filas, forma):
+        m, n = forma
+        return math.fsum(chain.from_iterable(filas)) / (m * n)
+
+    return _reducir(A, axis, "mean", por_fila, por_columnas, total, keepdims, "d")
+
+
+def var(
+    A: Matriz | Matrix | Vector,
+    axis: int | None = None,
+    *,
+    ddof: int = 0,
+    keepdims: bool = False,
+) -> float | Vector | Matriz | Matrix:
+    """Varianza de A, en total o a lo largo de un eje.
+
+    Fórmula: var = Σ (x - media)² / (N - ddof)
+
+    Equivalente en NumPy: np.var(A, axis=axis, ddof=ddof, keepdims=keepdims)
+
+    Args:
+        A: Matriz (lista de listas, Matrix o MappedMatrix) o vector.
+        axis: None, 0 (varianza de cada columna) o 1 (de cada fila).
+        ddof: Grados de libertad que se descuentan (1 = varianza muestral).
+        keepdims: Conserva dos dimensiones, como en sum().
+
+    Returns:
+        float | Vector: La varianza.
+
+    Raises:
+        ValueError: Si axis no es válido, no hay elementos o N <= ddof.
+
+    Ejemplo:
+        >>> var([[1, 2], [3, 4]], axis=0)
+        [1.0, 1.0]
+
+    Rendimiento:
+        Una sola pasada por las filas y sin la fórmula E[x²] - E[x]², que
+        pierde toda la precisión cuando la media es grande frente a la
+        dispersión. Por columnas se usa el algoritmo de Welford; para el
+        total se combinan los momentos de cada fila (Chan et al.). Los
+        valores se desplazan por uno de los datos antes de acumular.
+    """
+
+    def cociente(m2: float, k: int) -> float:
+        if k <= ddof:
+            raise ValueError(f"ddof={ddof} necesita más de {ddof} elementos")
+        return m2 / (k - ddof)
+
+    def por_fila(fila):
+        k, _, m2 = _momentos(fila, fila[0])
+        return cociente(m2, k)
+
+    def por_columnas(filas, forma):
+        k, m2 = _momentos_columnas(filas, forma[1])
+        return [cociente(x, k) for x in m2]
+
+    def total(filas, forma):
+        k, m2 = _momentos_total(filas)
+        return cociente(m2, k)
+
+    return _reducir(A, axis, "var", por_fila, por_columnas, total, keepdims, "d")
+
+
+def min(
+    A: Matriz | Matrix | Vector, axis: int | None = None, *, keepdims: bool = False
+) -> float | Vector | Matriz | Matrix:
+    """Mínimo de A, en total o a lo largo de un eje.
+
+    Equivalente en NumPy: np.min(A, axis=axis, keepdims=keepdims)
+
+    Args:
+        A: Matriz (lista de listas, Matrix o MappedMatrix) o vector.
+        axis: None, 0 (mínimo de cada columna) o 1 (de cada fila).
+        keepdims: Conserva dos dimensiones, como en sum().
+
+    Returns:
+        float | Vector: El mínimo (con el tipo de los elementos).
+
+    Raises:
+        ValueError: Si axis no es válido o no hay elementos.
+
+    Ejemplo:
+        >>> min([[4, 2], [3, 5]], axis=0)
+        [3, 2]
+    """
+
+    def por_columnas(filas, forma):
+        return _extremos_columnas(builtins.min, filas)
+
+    def total(filas, forma):
+        return builtins.min(map(builtins.min, filas))
+
+    return _reducir(
+        A, axis, "min", builtins.min, por_columnas, total, keepdims, _codigo_de(A)
+    )
+
+
+def max(
+    A: Matriz | Matrix | Vector, axis: int | None = None, *, keepdims: bool = False
+) -> float | Vector | Matriz | Matrix:
+    """Máximo de A, en total o a lo largo de un eje.
+
+    Equivalente en NumPy: np.max(A, axis=axis, keepdims=keepdims)
+
+    Ejemplo:
+        >>> max([[4, 2], [3, 5]], axis=1)
+        [4, 5]
+
+    Ver min() para los argumentos.
+    """
+
+    def por_columnas(filas, forma):
+        return _extremos_columnas(builtins.max, filas)
+
+    def total(filas, forma):
+        return builtins.max(map(builtins.max, filas))
+
+    return _reducir(
+        A, axis, "max", builtins.max, por_columnas, total, keepdims, _codigo_de(A)
+    )
+
+
+def argmax(
+    A: Matriz | Matrix | Vector, axis: int | None = None, *, keepdims: bool = False
+) -> int | list[int] | Matriz | Matrix:
+    """Posición del máximo de A, en total o a lo largo de un eje.
+
+    Si el máximo se repite se devuelve la primera aparición.
+
+    Equivalente en NumPy: np.argmax(A, axis=axis, keepdims=keepdims)
+
+    Args:
+        A: Matriz (lista de listas, Matrix o MappedMatrix) o vector.
+        axis: None (índice plano i * n + j), 0 (fila del máximo de cada
+              columna) o 1 (columna del máximo de cada fila).
+        keepdims: Conserva dos dimensiones, como en sum().
+
+    Returns:
+        int | list[int]: El índice o los índices.
+
+    Raises:
+        ValueError: Si axis no es válido o no hay elementos.
+
+    Ejemplo:
+        >>> argmax([[4, 2], [3, 5]], axis=0)
+        [0, 1]
+    """
+
+    def por_columnas(filas, forma):
+        return _argmax_columnas(filas)
+
+    return _reducir(
+        A, axis, "argmax", _argmax, por_columnas, _argmax_total, keepdims, "q"
+    )
+
+
+def _difundir(op, A, B, out, division: bool = False):
+    """Aplica op(a, b) entre A (m x n) y B difundido, fila por fila."""
+    m, n = shape(A)
+    if isinstance(B, (int, float)):
+        codigo = _promover_escalar(_codigo_de(A), B)
+        filas = (map(op, fila, repeat(B)) for fila in _iter_filas(A))
+    else:
+        codigo = _promover(_codigo_de(A), _codigo_de(B))
+        forma_b = (1, len(B)) if _es_vector(B) else shape(B)
+        if forma_b == (m, n):
+            filas = (map(op, fa, fb) for fa, fb in zip(_iter_filas(A), _iter_filas(B)))
+        elif forma_b == (1, 1):
+            return _difundir(op, A, next(_iter_filas(B))[0], out, division)
+        elif forma_b == (1, n):
+            # Copia de la fila de B: sirve aunque out comparta memoria con B
+            fila_b = list(_vector(B) if _es_vector(B) else next(_iter_filas(B)))
+            filas = (map(op, fila, fila_b) for fila in _iter_filas(A))
+        elif forma_b == (m, 1):
+            columna = [fila[0] for fila in _iter_filas(B)]
+            filas = (
+                map(op, fila, repeat(b)) for fila, b in zip(_iter_filas(A), columna)
+            )
+        else:
+            raise ValueError(
+                f"No se puede difundir B {forma_b} sobre A {(m, n)}: se "
+                f"esperaba un escalar o B de forma {(m, n)}, {(1, n)} o {(m, 1)}"
+            )
+    if division and codigo == "q":
+        codigo = "d"  # int64 / int64 da flotantes, como en NumPy
+    if out is not None:
+        _validar_out(out, (m, n))
+        return _escribir_filas(out, filas)
+    if isinstance(A, (Matrix, MappedMatrix)) or isinstance(B, Matrix):
+        return Matrix(array(codigo, chain.from_iterable(filas)), (m, n))
+    return [list(map(float, fila)) for fila in filas]
+
+
+def broadcast_add(
+    A: Matriz | Matrix,
+    B: "float | Vector | Matriz | Matrix",
+    *,
+    out: Matriz | Matrix | None = None,
+) -> Matriz | Matrix:
+    """Suma B a A difundiendo B por filas o columnas, sin expandirlo.
+
+    Equivalente en NumPy: A + B (con broadcasting)
+
+    Args:
+        A: Matriz m x n (lista de listas, Matrix o MappedMatrix).
+        B: Escalar; vector fila (Vector de n o matriz 1 x n), que se suma
+           a cada fila; vector columna (matriz m x 1, por ejemplo
+           sum(A, axis=1, keepdims=True)), que se suma a cada columna; o
+           matriz m x n.
+        out: Matriz m x n donde escribir el resultado (puede ser A).
+
+    Returns:
+        Matriz: A + B (Matrix si A o B lo es, out si se indicó). El dtype
+        se promueve como en add_matrices.
+
+    Raises:
+        ValueError: Si la forma de B no se puede difundir sobre A.
+
+    Ejemplo:
+        >>> broadcast_add([[1, 2], [3, 4]], [10, 20])
+        [[11.0, 22.0], [13.0, 24.0]]
+
+    Rendimiento:
+        Cada fila del resultado sale de un solo map() sobre la fila de A y
+        la fila de B (o repeat() de su escalar): B nunca se copia m veces.
+    """
+    return _difundir(_suma, A, B, out)
+
+
+def broadcast_subtract(
+    A: Matriz | Matrix,
+    B: "float | Vector | Matriz | Matrix",
+    *,
+    out: Matriz | Matrix | None = None,
+) -> Matriz | Matrix:
+    """Resta B de A difundiendo B (ver broadcast_add).
+
+    Equivalente en NumPy: A - B
+
+    Ejemplo:
+        >>> X = [[1, 10], [3, 30]]
+        >>> broadcast_subtract(X, mean(X, axis=0))  # centrar columnas
+        [[-1.0, -10.0], [1.0, 10.0]]
+    """
+    return _difundir(_resta, A, B, out)
+
+
+def broadcast_multiply(
+    A: Matriz | Matrix,
+    B: "float | Vector | Matriz | Matrix",
+    *,
+    out: Matriz | Matrix | None = None,
+) -> Matriz | Matrix:
+    """Multiplica A por B elemento a elemento difundiendo B (ver broadcast_add).
+
+    Equivalente en NumPy: A * B
+
+    Ejemplo:
+        >>> broadcast_multiply([[1, 2], [3, 4]], [[10], [100]])
+        [[10.0, 20.0], [300.0, 400.0]]
+    """
+    return _difundir(_producto, A, B, out)
+
+
+def broadcast_divide(
+    A: Matriz | Matrix,
+    B: "float | Vector | Matriz | Matrix",
+    *,
+    out: Matriz | Matrix | None = None,
+) -> Matriz | Matrix:
+    """Divide A por B elemento a elemento difundiendo B (ver broadcast_add).
+
+    El resultado siempre es de flotantes: int64 / int64 da float64.
+
+    Equivalente en NumPy: A / B
+
+    Raises:
+        ZeroDivisionError: Si algún divisor es cero.
+
+    Ejemplo:
+        >>> X = [[1, 3], [2, 2]]
+        >>> broadcast_divide(X, sum(X, axis=1, keepdims=True))  # filas suman 1
+        [[0.25, 0.75], [0.5, 0.5]]
+    """
+    return _difundir(_cociente, A, B, out, division=True)
+
+
+# -------------------------------------------------------------------
+# Sección 17: Perfilado (Conteo de Llamadas, Tiempos y Memoria)
+# -------------------------------------------------------------------
+
+# Funciones públicas que se envuelven mientras hay un Profiler activo
+_INSTRUMENTABLES = (
+    "zeros",
+    "ones",
+    "identity",
+    "shape",
+    "transpose",
+    "dot",
+    "add",
+    "multiply",
+    "iadd",
+    "imultiply",
+    "norm",
+    "add_matrices",
+    "multiply_matrix",
+    "iadd_matrices",
+    "imultiply_matrix",
+    "matmul",
+    "det",
+    "lu",
+    "solve",
+    "solve_many",
+    "inv",
+    "matrix_power",
+    "power_iteration",
+    "conjugate_gradient",
+    "jacobi",
+    "batch_dot",
+    "batch_norm",
+    "batch_axpy",
+    "pairwise_distances",
+    "batch_matmul",
+    "batch_det",
+    "batch_transpose",
+    "open_memmap",
+    "create_memmap",
+    "sum",
+    "mean",
+    "var",
+    "min",
+    "max",
+    "argmax",
+    "broadcast_add",
+    "broadcast_subtract",
+    "broadcast_multiply",
+    "broadcast_divide",
+)
+_PERFILADORES: list["Profiler"] = []
+_ORIGINALES: dict = {}
+
+
+class Profiler:
+    """Registra llamadas, tiempos, formas y memoria de las funciones públicas.
+
+    Mientras está activo, las funciones de _INSTRUMENTABLES se reemplazan
+    en el módulo por envolturas que miden cada llamada; al salir se
+    restauran las originales, así que desactivado no cuesta nada. Solo se
+    ven las llamadas hechas a través del módulo (npl.matmul), no las de
+    referencias tomadas antes con "from numpyless import matmul".
+
+    Los tiempos son inclusivos: si matmul llama a transpose, el tiempo de
+    transpose cuenta en ambas.
+
+    También se activa sin tocar el código con la variable de entorno
+    NUMPYLESS_PROFILE=1 (o =memoria); el reporte se imprime al terminar.
+    records() da una fila plana por función, lista para to_dataframe().
+
+    Ejemplo:
+        >>> import numpyless as npl
+        >>> with npl.profile() as perfil:
+        ...     C = npl.matmul([[1, 2], [3, 4]], [[5, 6], [7, 8]])
+        >>> fila = perfil.records()[0]
+        >>> fila["funcion"], fila["llamadas"], fila["formas"]
+        ('matmul', 1, '2x2, 2x2')
+    """
+
+    __slots__ = ("memoria", "_datos", "_inicio_tracemalloc")
+
+    def __init__(self, memoria: bool = False):
+        self.memoria = memoria
+        # nombre -> [llamadas, tiempo_total, tiempo_max, memoria_neta, formas]
+        self._datos: dict[str, list] = {}
+        self._inicio_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._inicio_tracemalloc = True
+        if not _PERFILADORES:
+            _instalar_envolturas()
+        _PERFILADORES.append(self)
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        _PERFILADORES.remove(self)
+        if not _PERFILADORES:
+            _quitar_envolturas()
+        if self._inicio_tracemalloc:
+            tracemalloc.stop()
+            self._inicio_tracemalloc = False
+
+    def _registrar(self, nombre: str, duracion: float, formas, delta: int) -> None:
+        datos = self._datos.get(nombre)
+        if datos is None:
+            datos = self._datos[nombre] = [0, 0.0, 0.0, 0, {}]
+        datos[0] += 1
+        datos[1] += duracion
+        if duracion > datos[2]:
+            datos[2] = duracion
+        datos[3] += delta
+        datos[4][formas] = datos[4].get(formas, 0) + 1
+
+    def reset(self) -> None:
+        """Borra todo lo registrado hasta ahora."""
+        self._datos.clear()
+
+    def records(self) -> list[dict]:
+        """Una fila plana por función, ordenadas por tiempo total.
+
+        Returns:
+            list[dict]: Claves funcion, llamadas, tiempo_total,
+                        tiempo_por_llamada, tiempo_max, formas (la firma
+                        de formas más frecuente), formas_distintas y, con
+                        memoria=True, memoria_neta (bytes).
+        """
+        filas = []
+        for nombre, (llamadas, total, maximo, neta, formas) in self._datos.items():
+            frecuente = builtins.max(formas, key=formas.get)
+            fila = {
+                "funcion": nombre,
+                "llamadas": llamadas,
+                "tiempo_total": total,
+                "tiempo_por_llamada": total / llamadas,
+                "tiempo_max": maximo,
+                "formas": ", ".join("x".join(map(str, f)) for f in frecuente),
+                "formas_distintas": len(formas),
+            }
+            if self.memoria:
+                fila["memoria_neta"] = neta
+            filas.append(fila)
+        filas.sort(key=lambda fila: fila["tiempo_total"], reverse=True)
+        return filas
+
+    def to_dataframe(self):
+        """records() como pandas.DataFrame (requiere pandas)."""
+        import pandas as pd
+
+        return pd.DataFrame(self.records())
+
+    def report(self) -> str:
+        """Reporte de texto con una línea por función."""
+        encabezado = (
+            f"{'funcion':<20}{'llamadas':>10}{'total (s)':>12}"
+            f"{'por llamada':>13}{'max (s)':>11}"
+        )
+        if self.memoria:
+            encabezado += f"{'memoria (B)':>13}"
+        lineas = [encabezado + "  formas", "-" * (len(encabezado) + 8)]
+        for fila in self.records():
+            linea = (
+                f"{fila['funcion']:<20}{fila['llamadas']:>10}"
+                f"{fila['tiempo_total']:>12.3e}{fila['tiempo_por_llamada']:>13.3e}"
+                f"{fila['tiempo_max']:>11.3e}"
+            )
+            if self.memoria:
+                linea += f"{fila['memoria_neta']:>13}"
+            lineas.append(f"{linea}  {fila['formas']}")
+        return "\n".join(lineas)
+
+    def __repr__(self) -> str:
+        return f"Profiler({len(self._datos)} funciones)"
+
+
+def profile(memoria: bool = False) -> Profiler:
+    """Crea un Profiler para usar con "with".
+
+    Args:
+        memoria: Medir también la memoria neta asignada por llamada con
+                 tracemalloc (más lento).
+
+    Returns:
+        Profiler: Úselo como administrador de contexto.
+
+    Ejemplo:
+        >>> import numpyless as npl
+        >>> with npl.profile(memoria=True) as perfil:
+        ...     X = npl.inv([[2, 0], [0, 2]])
+        >>> sorted(fila["funcion"] for fila in perfil.records())
+        ['identity', 'inv', 'shape']
+        >>> "memoria_neta" in perfil.records()[0]
+        True
+    """
+    return Profiler(memoria)
+
+
+def _forma_de(x):
+    if isinstance(x, (Matrix, _Dispersa, MappedMatrix, Expr)):
+        return x.shape
+    if isinstance(x, (list, tuple, array)):
+        if x and hasattr(x[0], "__len__"):
+            return (len(x), len(x[0]))
+        return (len(x),)
+    return None
+
+
+def _envolver(nombre: str, funcion):
+    reloj = time.perf_counter
+    obtener_memoria = tracemalloc.get_traced_memory
+
+    @wraps(funcion)
+    def envoltura(*args, **kwargs):
+        formas = tuple(f for f in map(_forma_de, args) if f is not None)
+        memoria = tracemalloc.is_tracing()
+        antes = obtener_memoria()[0] if memoria else 0
+        inicio = reloj()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            duracion = reloj() - inicio
+            delta = obtener_memoria()[0] - antes if memoria else 0
+            for perfilador in _PERFILADORES:
+                perfilador._registrar(nombre, duracion, formas, delta)
+
+    return envoltura
+
+
+def _instalar_envolturas() -> None:
+    modulo = globals()
+    for nombre in _INSTRUMENTABLES:
+        _ORIGINALES[nombre] = modulo[nombre]
+        modulo[nombre] = _envolver(nombre, modulo[nombre])
+
+
+def _quitar_envolturas() -> None:
+    globals().update(_ORIGINALES)
+    _ORIGINALES.clear()
+
+
+def _perfil_de_entorno() -> None:
+    valor = os.environ.get("NUMPYLESS_PROFILE", "").strip().lower()
+    if valor in ("", "0", "false", "no"):
+        return
+    perfil = Profiler(memoria=valor == "memoria").__enter__()
+    atexit.register(lambda: print(perfil.report(), file=sys.stderr))
+
+
+_perfil_de_entorno()
@@ -0,0 +1,482 @@
+"""
+Suite de benchmarks de NumpyLess (accesible también como numpyless.bench).
+
+Reemplaza el arnés manual con timeit del laboratorio: genera entradas con
+semilla fija, hace calentamiento, ajusta automáticamente cuántas veces se
+repite cada medición y resume los tiempos con mediana, rango intercuartil
+(IQR) y mínimo. Si NumPy está instalado mide también su equivalente.
+
+Los registros salen con las columnas exactas de df_benchmarks:
+funcion, tamaño, dimension, tiempo_numpy, tiempo_numpyless, ratio_velocidad
+
+Uso Recomendado:
+    import numpyless_bench as bench
+
+    registros = bench.run()                     # funciones y tamaños del lab
+    bench.to_csv(registros, "benchmarks.csv")
+    df_benchmarks = pd.DataFrame(registros)
+
+    # Detectar regresiones contra una corrida guardada
+    base = bench.load("benchmarks.csv")
+    bench.compare(bench.run(), base, tolerancia=0.25)
+
+Desde la terminal:
+    python numpyless_bench.py --funciones matmul dot --csv benchmarks.csv
+    python numpyless_bench.py --baseline benchmarks.csv   # sale con 1 si empeora
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import statistics
+import sys
+import time
+
+import numpyless as npl
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él tiempo_numpy queda en NaN
+    np = None
+
+# Columnas (y su orden) que espera df_benchmarks en el notebook
+COLUMNAS = [
+    "funcion",
+    "tamaño",
+    "dimension",
+    "tiempo_numpy",
+    "tiempo_numpyless",
+    "ratio_velocidad",
+]
+# Columnas extra que se agregan con detalle=True
+COLUMNAS_DETALLE = ["iqr_numpyless", "min_numpyless", "repeticiones"]
+
+# Tamaños del laboratorio; se pueden agregar otros ({"enorme": 1000})
+TAMANOS = {"pequeño": 10, "mediano": 100, "grande": 500}
+# Funciones cuya dimensión no sigue TAMANOS
+TAMANOS_POR_FUNCION = {"det": {"pequeño": 3, "mediano": 5, "grande": 7}}
+# Funciones que se miden por defecto (las que pide el notebook)
+FUNCIONES = ["matmul", "dot", "transpose", "add_matrices", "det"]
+
+# --- Control de las mediciones ---
+# Cada muestra dura al menos esto (se agrupan llamadas rápidas en un bucle)
+DURACION_MUESTRA = 0.005
+# Tiempo total aproximado que se dedica a medir una función en un tamaño
+TIEMPO_OBJETIVO = 0.5
+MIN_REPETICIONES = 5
+MAX_REPETICIONES = 50
+
+
+# -------------------------------------------------------------------
+# Generación de Entradas
+# -------------------------------------------------------------------
+
+
+def _vector(rng: random.Random, n: int) -> list[float]:
+    return [rng.uniform(-1.0, 1.0) for _ in range(n)]
+
+
+def _matriz(rng: random.Random, n: int) -> list[list[float]]:
+    return [_vector(rng, n) for _ in range(n)]
+
+
+def _sistema(rng: random.Random, n: int):
+    # Diagonal dominante: siempre invertible y bien condicionada
+    A = _matriz(rng, n)
+    for i in range(n):
+        A[i][i] += n
+    return A, _vector(rng, n)
+
+
+def _una_matriz(rng: random.Random, n: int):
+    return (_matriz(rng, n),)
+
+
+def _dos_matrices(rng: random.Random, n: int):
+    return _matriz(rng, n), _matriz(rng, n)
+
+
+def _dos_vectores(rng: random.Random, n: int):
+    return _vector(rng, n), _vector(rng, n)
+
+
+# Cada entrada: (generador de argumentos, función NumpyLess, nombre en NumPy
+# o lambda equivalente). Los argumentos son listas; para NumPy se convierten
+# con np.array.
+_SUITE = {
+    "matmul": (_dos_matrices, npl.matmul, "matmul"),
+    "dot": (_dos_vectores, npl.dot, "dot"),
+    "transpose": (_una_matriz, npl.transpose, "transpose"),
+    "add_matrices": (_dos_matrices, npl.add_matrices, "add"),
+    "multiply_matrix": (
+        lambda r, n: (r.uniform(-2.0, 2.0), _matriz(r, n)),
+        npl.multiply_matrix,
+        "multiply",
+    ),
+    "add": (_dos_vectores, npl.add, "add"),
+    "multiply": (
+        lambda r, n: (r.uniform(-2.0, 2.0), _vector(r, n)),
+        npl.multiply,
+        "multiply",
+    ),
+    "norm": (lambda r, n: (_vector(r, n),), npl.norm, lambda v: np.linalg.norm(v)),
+    "zeros": (lambda r, n: ((n, n),), npl.zeros, "zeros"),
+    "ones": (lambda r, n: ((n, n),), npl.ones, "ones"),
+    "identity": (lambda r, n: (n,), npl.identity, "identity"),
+    "det": (_una_matriz, npl.det, lambda A: np.linalg.det(A)),
+    "solve": (_sistema, npl.solve, lambda A, b: np.linalg.solve(A, b)),
+    "inv": (lambda r, n: (_sistema(r, n)[0],), npl.inv, lambda A: np.linalg.inv(A)),
+    "batch_dot": (
+        _dos_matrices,
+        npl.batch_dot,
+        lambda X, Y: np.einsum("ij,ij->i", X, Y),
+    ),
+    "batch_norm": (_una_matriz, npl.batch_norm, lambda X: np.linalg.norm(X, axis=1)),
+    "pairwise_distances": (
+        _una_matriz,
+        npl.pairwise_distances,
+        lambda X: ((X[:, None, :] - X[None, :, :]) ** 2).sum(axis=-1),
+    ),
+}
+
+
+def available() -> list[str]:
+    """Lista las funciones que sabe medir la suite.
+
+    Returns:
+        list[str]: Nombres de funciones de NumpyLess con benchmark.
+    """
+    return list(_SUITE)
+
+
+def inputs(funcion: str, dimension: int, *, semilla: int = 0) -> tuple:
+    """Genera los argumentos (reproducibles) con que se mide una función.
+
+    La misma (funcion, dimension, semilla) produce siempre los mismos datos,
+    así dos corridas miden exactamente el mismo trabajo.
+
+    Args:
+        funcion: Nombre de la función (ver available()).
+        dimension: Lado de las matrices / largo de los vectores.
+        semilla: Semilla base del generador.
+
+    Returns:
+        tuple: Argumentos posicionales para la función (con listas).
+
+    Raises:
+        ValueError: Si la función no está en la suite.
+    """
+    if funcion not in _SUITE:
+        raise ValueError(f"Función sin benchmark: {funcion!r}")
+    # Semilla de texto: random la convierte de forma estable entre corridas
+    rng = random.Random(f"{semilla}:{funcion}:{dimension}")
+    return _SUITE[funcion][0](rng, dimension)
+
+
+# -------------------------------------------------------------------
+# Medición
+# -------------------------------------------------------------------
+
+
+def measure(funcion, args: tuple, *, repeticiones: int | None = None) -> dict:
+    """Mide cuánto tarda funcion(*args) y resume las muestras.
+
+    Hace una llamada de calentamiento, agrupa llamadas rápidas en bucles de
+    al menos DURACION_MUESTRA segundos y, si no se indica repeticiones,
+    elige cuántas muestras tomar para gastar cerca de TIEMPO_OBJETIVO
+    (entre MIN_REPETICIONES y MAX_REPETICIONES).
+
+    Args:
+        funcion: Callable a medir.
+        args: Argumentos posicionales.
+        repeticiones: Cantidad fija de muestras (opcional).
+
+    Returns:
+        dict: {"mediana", "iqr", "min", "repeticiones", "llamadas"}; los
+              tiempos son segundos por llamada.
+    """
+    reloj = time.perf_counter
+    inicio = reloj()
+    funcion(*args)  # calentamiento (cachés, imports perezosos, pools)
+    una = max(reloj() - inicio, 1e-9)
+
+    llamadas = max(1, math.ceil(DURACION_MUESTRA / una))
+    if repeticiones is None:
+        repeticiones = int(TIEMPO_OBJETIVO / (una * llamadas))
+        repeticiones = min(max(repeticiones, MIN_REPETICIONES), MAX_REPETICIONES)
+
+    muestras = []
+    for _ in range(repeticiones):
+        inicio = reloj()
+        for _ in range(llamadas):
+            funcion(*args)
+        muestras.append((reloj() - inicio) / llamadas)
+
+    if len(muestras) >= 2:
+        q1, _, q3 = statistics.quantiles(muestras, n=4)
+    else:
+        q1 = q3 = muestras[0]
+    return {
+        "mediana": statistics.median(muestras),
+        "iqr": q3 - q1,
+        "min": min(muestras),
+        "repeticiones": repeticiones,
+        "llamadas": llamadas,
+    }
+
+
+def _medir_numpy(funcion: str, args: tuple) -> float:
+    if np is None:
+        return math.nan
+    referencia = _SUITE[funcion][2]
+    if isinstance(referencia, str):
+        referencia = getattr(np, referencia)
+    args_np = tuple(np.array(a) if isinstance(a, list) else a for a in args)
+    return measure(referencia, args_np)["mediana"]
+
+
+def benchmark(
+    funcion: str,
+    tamaño: str,
+    dimension: int,
+    *,
+    semilla: int = 0,
+    numpy: bool = True,
+    detalle: bool = False,
+) -> dict:
+    """Mide una función en un tamaño (reemplazo de benchmark_funcion del lab).
+
+    Args:
+        funcion: Nombre de la función (ver available()).
+        tamaño: Etiqueta del tamaño ('pequeño', 'mediano', 'grande', ...).
+        dimension: Dimensión numérica.
+        semilla: Semilla de las entradas.
+        numpy: Si es False no se mide NumPy (tiempo_numpy queda en NaN).
+        detalle: Agrega iqr_numpyless, min_numpyless y repeticiones.
+
+    Returns:
+        dict: Registro con las columnas de COLUMNAS (y COLUMNAS_DETALLE).
+
+    Ejemplo:
+        >>> r = benchmark("dot", "pequeño", 10, numpy=False)
+        >>> sorted(r) == sorted(COLUMNAS)
+        True
+    """
+    args = inputs(funcion, dimension, semilla=semilla)
+    estadisticas = measure(_SUITE[funcion][1], args)
+    tiempo_numpy = _medir_numpy(funcion, args) if numpy else math.nan
+    tiempo = estadisticas["mediana"]
+    registro = {
+        "funcion": funcion,
+        "tamaño": tamaño,
+        "dimension": dimension,
+        "tiempo_numpy": tiempo_numpy,
+        "tiempo_numpyless": tiempo,
+        "ratio_velocidad": tiempo / tiempo_numpy if tiempo_numpy > 0 else math.nan,
+    }
+    if detalle:
+        registro["iqr_numpyless"] = estadisticas["iqr"]
+        registro["min_numpyless"] = estadisticas["min"]
+        registro["repeticiones"] = estadisticas["repeticiones"]
+    return registro
+
+
+def run(
+    funciones: list[str] | None = None,
+    tamanos: dict[str, int] | None = None,
+    *,
+    semilla: int = 0,
+    numpy: bool = True,
+    detalle: bool = False,
+    verbose: bool = False,
+) -> list[dict]:
+    """Recorre todas las combinaciones función x tamaño.
+
+    Args:
+        funciones: Funciones a medir (por defecto FUNCIONES; "todas" o
+                   ["todas"] mide available()).
+        tamanos: {etiqueta: dimension}. Por defecto TAMANOS, salvo las
+                 funciones de TAMANOS_POR_FUNCION (det usa 3, 5 y 7).
+        semilla: Semilla de las entradas.
+        numpy: Medir también NumPy si está instalado.
+        detalle: Agregar columnas de COLUMNAS_DETALLE.
+        verbose: Imprimir cada registro a medida que se mide.
+
+    Returns:
+        list[dict]: Registros; pd.DataFrame(registros) da df_benchmarks.
+    """
+    if funciones is None:
+        funciones = FUNCIONES
+    elif funciones in ("todas", ["todas"]):
+        funciones = available()
+    registros = []
+    for funcion in funciones:
+        dims = tamanos or TAMANOS_POR_FUNCION.get(funcion, TAMANOS)
+        for tamaño, dimension in dims.items():
+            registro = benchmark(
+                funcion,
+                tamaño,
+                dimension,
+                semilla=semilla,
+                numpy=numpy,
+                detalle=detalle,
+            )
+            if verbose:
+                print(
+                    f"{funcion:>20} {tamaño:>8} n={dimension:<5} "
+                    f"{registro['tiempo_numpyless']:.3e} s"
+                )
+            registros.append(registro)
+    return registros
+
+
+# -------------------------------------------------------------------
+# Exportación y Regresiones
+# -------------------------------------------------------------------
+
+
+def _columnas(registros: list[dict]) -> list[str]:
+    extra = [c for c in COLUMNAS_DETALLE if registros and c in registros[0]]
+    return COLUMNAS + extra
+
+
+def to_csv(registros: list[dict], path: str) -> None:
+    """Guarda los registros en CSV (legible con pd.read_csv).
+
+    Args:
+        registros: Salida de run().
+        path: Archivo de destino.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=_columnas(registros))
+        escritor.writeheader()
+        escritor.writerows(registros)
+
+
+def to_json(registros: list[dict], path: str) -> None:
+    """Guarda los registros como una lista JSON (NaN se escribe como null).
+
+    Args:
+        registros: Salida de run().
+        path: Archivo de destino.
+    """
+    limpios = [
+        {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in r.items()}
+        for r in registros
+    ]
+    with open(path, "w", encoding="utf-8") as archivo:
+        json.dump(limpios, archivo, ensure_ascii=False, indent=2)
+
+
+def load(path: str) -> list[dict]:
+    """Lee registros guardados con to_csv() o to_json() (según la extensión).
+
+    Args:
+        path: Archivo .csv o .json.
+
+    Returns:
+        list[dict]: Registros con dimension como int y tiempos como float.
+    """
+    with open(path, encoding="utf-8") as archivo:
+        if path.endswith(".json"):
+            crudos = json.load(archivo)
+        else:
+            crudos = list(csv.DictReader(archivo))
+    registros = []
+    for crudo in crudos:
+        registro = dict(crudo)
+        registro["dimension"] = int(registro["dimension"])
+        if registro.get("repeticiones") not in (None, ""):
+            registro["repeticiones"] = int(registro["repeticiones"])
+        for clave in COLUMNAS[3:] + COLUMNAS_DETALLE[:2]:
+            if clave in registro:
+                valor = registro[clave]
+                registro[clave] = math.nan if valor in (None, "") else float(valor)
+        registros.append(registro)
+    return registros
+
+
+def compare(
+    registros: list[dict], base: list[dict], *, tolerancia: float = 0.25
+) -> list[dict]:
+    """Compara una corrida contra una base y devuelve las regresiones.
+
+    Una regresión es una (funcion, dimension) presente en ambas corridas
+    cuyo tiempo_numpyless creció más que la tolerancia relativa.
+
+    Args:
+        registros: Corrida nueva.
+        base: Corrida de referencia (por ejemplo, load("benchmarks.csv")).
+        tolerancia: Crecimiento permitido (0.25 = hasta 25 % más lento).
+
+    Returns:
+        list[dict]: Una entrada por regresión con funcion, dimension,
+                    tiempo_base, tiempo_nuevo y cambio (fracción).
+    """
+    referencia = {(r["funcion"], r["dimension"]): r["tiempo_numpyless"] for r in base}
+    regresiones = []
+    for r in registros:
+        anterior = referencia.get((r["funcion"], r["dimension"]))
+        if not anterior or math.isnan(anterior):
+            continue
+        cambio = r["tiempo_numpyless"] / anterior - 1.0
+        if cambio > tolerancia:
+            regresiones.append(
+                {
+                    "funcion": r["funcion"],
+                    "dimension": r["dimension"],
+                    "tiempo_base": anterior,
+                    "tiempo_nuevo": r["tiempo_numpyless"],
+                    "cambio": cambio,
+                }
+            )
+    return regresiones
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Punto de entrada de la línea de comandos.
+
+    Returns:
+        int: 0 si todo bien, 1 si hubo regresiones contra --baseline.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks de NumpyLess")
+    parser.add_argument("--funciones", nargs="+", help="por defecto las del lab")
+    parser.add_argument("--todas", action="store_true", help="medir todas")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-numpy", action="store_true")
+    parser.add_argument("--detalle", action="store_true")
+    parser.add_argument("--csv", help="guardar resultados en CSV")
+    parser.add_argument("--json", help="guardar resultados en JSON")
+    parser.add_argument("--baseline", help="CSV/JSON de referencia")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    opciones = parser.parse_args(argv)
+
+    registros = run(
+        available() if opciones.todas else opciones.funciones,
+        semilla=opciones.semilla,
+        numpy=not opciones.sin_numpy,
+        detalle=opciones.detalle,
+        verbose=True,
+    )
+    if opciones.csv:
+        to_csv(registros, opciones.csv)
+    if opciones.json:
+        to_json(registros, opciones.json)
+    if opciones.baseline:
+        regresiones = compare(
+            registros, load(opciones.baseline), tolerancia=opciones.tolerancia
+        )
+        for r in regresiones:
+            print(
+                f"REGRESIÓN {r['funcion']} n={r['dimension']}: "
+                f"{r['tiempo_base']:.3e} s -> {r['tiempo_nuevo']:.3e} s "
+                f"(+{r['cambio']:.0%})"
+            )
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
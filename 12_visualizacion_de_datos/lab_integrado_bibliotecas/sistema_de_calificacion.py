@@ -1,31 +1,969 @@
 # ===================================================================
 # Sistema de Calificación Modular y Configurable
 # ===================================================================
+import ast
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from multiprocessing.connection import wait
 from typing import Callable
 
+# Resultados posibles de una prueba
+PASADA = "pasada"
+FALLIDA = "fallida"
+NO_IMPLEMENTADA = "no_implementada"
+TIEMPO_AGOTADO = "tiempo_agotado"
+
+
+def _medicion(tiempo=None, cpu=None, memoria=None) -> dict:
+    """Medición de una prueba: segundos de reloj y de CPU, pico en bytes."""
+    return {"tiempo": tiempo, "cpu": cpu, "memoria": memoria}
+
+
+def _ejecutar_prueba(
+    funcion_prueba: Callable, medir_memoria: bool = False
+) -> tuple[str, str, dict]:
+    """Ejecuta una prueba, clasifica su resultado y mide cuánto costó.
+
+    El pico de memoria se mide con tracemalloc solo si `medir_memoria` es
+    True, porque multiplica varias veces el tiempo de las pruebas.
+
+    Returns:
+        tuple[str, str, dict]: (resultado, detalle, medicion) con el detalle
+        que se imprime tras el nombre de la prueba
+    """
+    rendimiento = isinstance(funcion_prueba, PruebaRendimiento)
+    rastrear = medir_memoria and not rendimiento and not tracemalloc.is_tracing()
+    if rastrear:
+        tracemalloc.start()
+    inicio, inicio_cpu = time.perf_counter(), time.process_time()
+    propia = {}
+    try:
+        if rendimiento:
+            resultado, detalle, propia = funcion_prueba.medir()
+        else:
+            funcion_prueba()
+            resultado, detalle = PASADA, ""
+    except NotImplementedError:
+        resultado, detalle = NO_IMPLEMENTADA, ""
+    except AssertionError as e:
+        resultado, detalle = FALLIDA, f"FALLÓ - {str(e)}"
+    except Exception as e:
+        resultado, detalle = FALLIDA, f"ERROR - {type(e).__name__}: {str(e)}"
+    finally:
+        medicion = _medicion(
+            time.perf_counter() - inicio, time.process_time() - inicio_cpu
+        )
+        if rastrear:
+            medicion["memoria"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    medicion.update(propia)
+    return resultado, detalle, medicion
+
+
+# ===================================================================
+# Pruebas de Rendimiento
+# ===================================================================
+
+# Segundos que tarda _carga_calibracion() en la máquina donde se fijaron los
+# presupuestos; en otra máquina los presupuestos se escalan en proporción
+CALIBRACION_REFERENCIA = 0.028
+_FACTOR_MAQUINA: float | None = None
+
+
+def _carga_calibracion() -> float:
+    """Multiplicación ingenua 64x64 con listas: Python puro, como numpyless."""
+    n = 64
+    a = [[float(i * j % 7) for j in range(n)] for i in range(n)]
+    inicio = time.perf_counter()
+    [[sum(a[i][k] * a[k][j] for k in range(n)) for j in range(n)] for i in range(n)]
+    return time.perf_counter() - inicio
+
+
+def factor_maquina() -> float:
+    """Qué tan lenta es esta máquina respecto de la de referencia.
+
+    Se calibra una vez por sesión (mediana de 5 corridas de la carga de
+    calibración). Un factor de 2.0 duplica todos los presupuestos de tiempo.
+
+    Returns:
+        float: Tiempo de calibración aquí / CALIBRACION_REFERENCIA
+    """
+    global _FACTOR_MAQUINA
+    if _FACTOR_MAQUINA is None:
+        mediana = statistics.median(_carga_calibracion() for _ in range(5))
+        _FACTOR_MAQUINA = mediana / CALIBRACION_REFERENCIA
+    return _FACTOR_MAQUINA
+
+
+def _formatear_tiempo(segundos: float) -> str:
+    if segundos < 1e-3:
+        return f"{segundos * 1e6:.1f} µs"
+    if segundos < 1:
+        return f"{segundos * 1e3:.1f} ms"
+    return f"{segundos:.2f} s"
+
+
+def _formatear_memoria(bytes_: float) -> str:
+    return f"{bytes_ / (1024 * 1024):.1f} MB"
+
+
+class PruebaRendimiento:
+    """Prueba que pasa si una operación cabe en un presupuesto de tiempo/memoria.
+
+    El presupuesto de tiempo se escribe en milisegundos de la máquina de
+    referencia y se multiplica por `factor_maquina()`, así la misma prueba es
+    igual de exigente en un portátil lento que en un servidor. Se compara la
+    mediana de `repeticiones` corridas, tras una de calentamiento; el pico de
+    memoria se mide en una corrida aparte con tracemalloc, para no inflar
+    los tiempos.
+
+    Si la operación lanza una excepción, la prueba se clasifica igual que
+    cualquier otra (FALTA IMPLEMENTACIÓN, FALLÓ o ERROR).
+    """
+
+    def __init__(
+        self,
+        operacion: Callable,
+        tiempo_ms: float | None = None,
+        memoria_mb: float | None = None,
+        repeticiones: int = 5,
+    ):
+        """Inicializa la prueba.
+
+        Args:
+            operacion: Función sin argumentos que se mide
+            tiempo_ms: Presupuesto en ms de la máquina de referencia
+            memoria_mb: Pico de memoria permitido en MB
+            repeticiones: Corridas medidas (se usa la mediana)
+        """
+        self.operacion = operacion
+        self.tiempo_ms = tiempo_ms
+        self.memoria_mb = memoria_mb
+        self.repeticiones = max(1, repeticiones)
+
+    def presupuesto(self) -> float | None:
+        """Presupuesto de tiempo en segundos para esta máquina."""
+        if self.tiempo_ms is None:
+            return None
+        return self.tiempo_ms / 1000 * factor_maquina()
+
+    def medir(self) -> tuple[str, str, dict]:
+        """Mide la operación y la compara con los presupuestos.
+
+        Returns:
+            tuple[str, str, dict]: (resultado, detalle, medicion); la medición
+            trae además presupuesto, memoria_max y cumple
+        """
+        self.operacion()  # calentamiento
+        tiempos, cpus = [], []
+        for _ in range(self.repeticiones):
+            inicio, inicio_cpu = time.perf_counter(), time.process_time()
+            self.operacion()
+            tiempos.append(time.perf_counter() - inicio)
+            cpus.append(time.process_time() - inicio_cpu)
+        medicion = _medicion(statistics.median(tiempos), statistics.median(cpus))
+
+        if self.memoria_mb is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            try:
+                self.operacion()
+                medicion["memoria"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        presupuesto = self.presupuesto()
+        memoria_max = None if self.memoria_mb is None else self.memoria_mb * 2**20
+        medicion["presupuesto"] = presupuesto
+        medicion["memoria_max"] = memoria_max
+
+        partes, excesos = [], []
+        if presupuesto is not None:
+            texto = f"{_formatear_tiempo(medicion['tiempo'])}"
+            if medicion["tiempo"] > presupuesto:
+                excesos.append(f"LENTO - {texto} > {_formatear_tiempo(presupuesto)}")
+            partes.append(f"{texto} ≤ {_formatear_tiempo(presupuesto)}")
+        if memoria_max is not None and medicion["memoria"] is not None:
+            texto = _formatear_memoria(medicion["memoria"])
+            if medicion["memoria"] > memoria_max:
+                excesos.append(
+                    f"MEMORIA - {texto} > {_formatear_memoria(memoria_max)}"
+                )
+            partes.append(f"{texto} ≤ {_formatear_memoria(memoria_max)}")
+
+        medicion["cumple"] = not excesos
+        if excesos:
+            return FALLIDA, "; ".join(excesos), medicion
+        return PASADA, ", ".join(partes), medicion
+
+    def __call__(self):
+        """Permite usar la prueba como una función de prueba común."""
+        resultado, detalle, _ = self.medir()
+        if resultado != PASADA:
+            raise AssertionError(detalle)
+
+
+def _limitar_memoria(megabytes: float):
+    """Limita la memoria del proceso actual a lo ya ocupado más `megabytes`.
+
+    El hijo nace con la memoria del proceso padre (el notebook con pandas ya
+    cargado), así que el límite se cuenta a partir de lo que ocupa al empezar.
+
+    Solo funciona en Unix (módulo `resource` con RLIMIT_AS); en otros sistemas,
+    o si el sistema rechaza el límite, la prueba corre sin él.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+    if not hasattr(resource, "RLIMIT_AS"):
+        return
+
+    actual = 0
+    try:
+        with open("/proc/self/statm") as f:
+            actual = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    limite = actual + int(megabytes * 1024 * 1024)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+    except (ValueError, OSError):
+        pass  # Por ejemplo, un límite mayor que el máximo permitido (macOS)
+
+
+def _proceso_prueba(
+    funcion_prueba: Callable, conexion, memoria_limite, medir_memoria: bool
+):
+    """Punto de entrada del proceso hijo: ejecuta la prueba y envía el resultado."""
+    if memoria_limite is not None:
+        _limitar_memoria(memoria_limite)
+    try:
+        resultado = _ejecutar_prueba(funcion_prueba, medir_memoria)
+    except BaseException as e:  # SystemExit, KeyboardInterrupt...
+        resultado = (FALLIDA, f"ERROR - {type(e).__name__}: {str(e)}", _medicion())
+    conexion.send(resultado)
+    conexion.close()
+
+
+# Detalle de una prueba cuyo proceso murió sin enviar su resultado
+_PROCESO_TERMINADO = "ERROR - el proceso terminó con código"
+
+
+def _por_limite_de_recursos(resultado: str, detalle: str) -> bool:
+    """True si el resultado depende de la máquina y no solo del código.
+
+    Es el caso de TIEMPO AGOTADO, de un MemoryError y de un hijo que murió sin
+    responder (al pasar el límite de memoria el sistema suele matarlo).
+    """
+    return resultado == TIEMPO_AGOTADO or (
+        resultado == FALLIDA
+        and detalle.startswith(("ERROR - MemoryError:", _PROCESO_TERMINADO))
+    )
+
+
+# Segundos que se espera a que un hijo termine después de enviar su resultado
+# (o de cerrar la conexión) antes de matarlo
+ESPERA_CIERRE = 1.0
+
+
+def _cerrar_proceso(proceso):
+    """Espera a que el hijo termine y lo mata si no lo hace a tiempo.
+
+    Un hijo que ya respondió puede quedar colgado al salir (por ejemplo, en un
+    finalizador o un hilo no daemon); join sin plazo bloquearía la calificación.
+    """
+    proceso.join(ESPERA_CIERRE)
+    if proceso.is_alive():
+        proceso.kill()
+        proceso.join()
+
+
+class EjecutorPruebas:
+    """Ejecuta pruebas en procesos aislados con límites de tiempo y memoria.
+
+    Cada prueba corre en su propio proceso creado con `fork`, de modo que las
+    funciones de prueba definidas en el notebook (closures sobre sus variables
+    globales) se heredan sin necesidad de serializarlas. Una prueba que se
+    cuelga se mata al vencer `tiempo_limite` y se anota como TIEMPO AGOTADO en
+    lugar de bloquear el resto de la calificación.
+
+    Con `procesos > 1` las pruebas se difieren: `registrar_prueba` las encola
+    y se ejecutan concurrentemente al llamar a `esperar()` (o al pedir la
+    nota o un resumen). Los resultados se anotan siempre en orden de registro,
+    así que la salida y el reparto de puntos no cambian.
+
+    Pista: los efectos de una prueba sobre variables globales se quedan en el
+        proceso hijo; los archivos que escriba sí persisten.
+    """
+
+    def __init__(
+        self,
+        procesos: int = 1,
+        tiempo_limite: float | None = None,
+        memoria_limite: float | None = None,
+        medir_memoria: bool = False,
+    ):
+        """Inicializa el ejecutor.
+
+        Args:
+            procesos: Pruebas simultáneas como máximo (0 = un proceso por núcleo)
+            tiempo_limite: Segundos de reloj por prueba (None = sin límite)
+            memoria_limite: MB adicionales por prueba (None = sin límite; solo
+                se aplica en Unix)
+            medir_memoria: Medir el pico de memoria de cada prueba
+        """
+        self.procesos = procesos if procesos > 0 else os.cpu_count() or 1
+        self.tiempo_limite = tiempo_limite
+        self.memoria_limite = memoria_limite
+        self.medir_memoria = medir_memoria
+        # (grupo, nombre, función, clave de caché, resultado ya conocido)
+        self._pendientes: list[tuple] = []
+        try:
+            self._contexto = multiprocessing.get_context("fork")
+        except ValueError:
+            # Sin fork (Windows) las pruebas corren en el propio proceso
+            self._contexto = None
+
+    @property
+    def diferido(self) -> bool:
+        """True si las pruebas se encolan para ejecutarse concurrentemente."""
+        return self._contexto is not None and self.procesos > 1
+
+    def ejecutar(self, funcion_prueba: Callable) -> tuple[str, str, dict]:
+        """Ejecuta una prueba de inmediato y retorna (resultado, detalle, medicion)."""
+        if self._contexto is None:
+            return _ejecutar_prueba(funcion_prueba, self.medir_memoria)
+        return self._ejecutar_lote([funcion_prueba])[0]
+
+    def registrar(
+        self,
+        grupo,
+        nombre_prueba: str,
+        funcion_prueba: Callable,
+        clave: str | None = None,
+        conocido: tuple[str, str, dict] | None = None,
+    ):
+        """Encola una prueba para la siguiente llamada a `esperar()`.
+
+        Si `conocido` trae un resultado (de la caché) la prueba no se ejecuta,
+        pero se anota en su turno para conservar el orden de registro.
+        """
+        self._pendientes.append((grupo, nombre_prueba, funcion_prueba, clave, conocido))
+
+    def esperar(self):
+        """Ejecuta las pruebas encoladas y anota sus resultados en orden."""
+        if not self._pendientes:
+            return
+        lote, self._pendientes = self._pendientes, []
+        nuevos = iter(self._ejecutar_lote([p[2] for p in lote if p[4] is None]))
+        for grupo, nombre, _, clave, conocido in lote:
+            if conocido is None:
+                grupo._anotar(nombre, *next(nuevos), clave=clave)
+            else:
+                grupo._anotar(nombre, *conocido)
+
+    def _ejecutar_lote(self, funciones: list[Callable]) -> list[tuple[str, str, dict]]:
+        """Ejecuta las pruebas con hasta `procesos` hijos vivos a la vez."""
+        resultados: list[tuple] = [(FALLIDA, "", _medicion())] * len(funciones)
+        activos = {}  # receptor -> (índice, proceso, instante límite)
+        siguiente = 0
+
+        while siguiente < len(funciones) or activos:
+            # Lanzar hijos hasta llenar los huecos libres
+            while siguiente < len(funciones) and len(activos) < self.procesos:
+                receptor, emisor = self._contexto.Pipe(duplex=False)
+                proceso = self._contexto.Process(
+                    target=_proceso_prueba,
+                    args=(
+                        funciones[siguiente],
+                        emisor,
+                        self.memoria_limite,
+                        self.medir_memoria,
+                    ),
+                    daemon=True,
+                )
+                proceso.start()
+                emisor.close()
+                fin = (
+                    time.monotonic() + self.tiempo_limite
+                    if self.tiempo_limite is not None
+                    else None
+                )
+                activos[receptor] = (siguiente, proceso, fin)
+                siguiente += 1
+
+            # Esperar un resultado o el primer plazo que venza
+            plazos = [fin for _, _, fin in activos.values() if fin is not None]
+            espera = max(0.0, min(plazos) - time.monotonic()) if plazos else None
+            for receptor in wait(list(activos), timeout=espera):
+                indice, proceso, _ = activos.pop(receptor)
+                try:
+                    resultados[indice] = receptor.recv()
+                except EOFError:
+                    # El hijo murió sin responder (memoria agotada, señal...)
+                    _cerrar_proceso(proceso)
+                    resultados[indice] = (
+                        FALLIDA,
+                        f"{_PROCESO_TERMINADO} {proceso.exitcode}",
+                        _medicion(),
+                    )
+                receptor.close()
+                _cerrar_proceso(proceso)
+
+            ahora = time.monotonic()
+            for receptor, (indice, proceso, fin) in list(activos.items()):
+                if fin is not None and ahora >= fin:
+                    proceso.kill()
+                    proceso.join()
+                    receptor.close()
+                    del activos[receptor]
+                    resultados[indice] = (
+                        TIEMPO_AGOTADO,
+                        f"TIEMPO AGOTADO (> {self.tiempo_limite:g} s)",
+                        _medicion(self.tiempo_limite),
+                    )
+
+        return resultados
+
+
+def _ruta_cache() -> str:
+    """Archivo de la caché: CALIFICACION_CACHE o la caché del usuario."""
+    ruta = os.environ.get("CALIFICACION_CACHE")
+    if ruta:
+        return ruta
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "sistema_de_calificacion", "resultados.json")
+
+
+class _NoCacheable(Exception):
+    """La prueba depende de un valor cuyo contenido no se puede resumir."""
+
+
+def _nombres_de_codigo(codigo) -> set[str]:
+    """Nombres globales y atributos usados por un código y sus funciones internas."""
+    nombres = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if inspect.iscode(constante):
+            nombres |= _nombres_de_codigo(constante)
+    return nombres
+
+
+def _huella_codigo(codigo) -> str:
+    """Resume un código compilado sin depender de su archivo ni de sus líneas."""
+    partes = [codigo.co_code.hex(), repr(codigo.co_names)]
+    for constante in codigo.co_consts:
+        partes.append(
+            _huella_codigo(constante) if inspect.iscode(constante) else repr(constante)
+        )
+    return "|".join(partes)
+
+
+def _fuente(objeto) -> str:
+    try:
+        return inspect.getsource(objeto)
+    except (OSError, TypeError):
+        # Funciones sin archivo fuente (por ejemplo, definidas con exec)
+        return _huella_codigo(objeto.__code__)
+
+
+def _es_local(modulo) -> bool:
+    """True si el módulo es código del proyecto (no de la biblioteca estándar
+    ni de un paquete instalado), como el numpyless.py de la entrega."""
+    ruta = getattr(modulo, "__file__", None)
+    if not ruta or not ruta.endswith(".py"):
+        return False
+    ruta = os.path.abspath(ruta)
+    instalados = {sys.prefix, sys.base_prefix, sys.exec_prefix}
+    return "site-packages" not in ruta and not any(
+        ruta.startswith(os.path.abspath(p) + os.sep) for p in instalados
+    )
+
+
+class CacheResultados:
+    """Caché persistente (JSON) de resultados de pruebas.
+
+    La clave de cada prueba resume la versión de Python, el código fuente de
+    la función de prueba y, recursivamente, el de todo lo que usa: funciones
+    del notebook, constantes simples y, de los módulos del proyecto como
+    numpyless.py, solo las definiciones alcanzables desde los nombres que
+    menciona la prueba (una prueba de `det` no se invalida al editar
+    `matmul`, salvo que `det` lo use). Los módulos instalados entran con su
+    nombre y versión.
+
+    Las variables capturadas por la función (closure) y sus valores por
+    defecto entran en la clave igual que los globales, y también los límites
+    de tiempo y memoria del ejecutor.
+
+    Una prueba que lee un valor global o capturado que no se puede resumir
+    (un DataFrame, una figura...) no se cachea y se ejecuta siempre. Tampoco
+    se guardan las pruebas con TIEMPO AGOTADO, memoria agotada o un proceso
+    que murió sin responder, que dependen de la máquina.
+
+    Pista: lo que una prueba lee de archivos (como benchmarks.csv) no forma
+        parte de la clave; si cambian, borre la caché con `limpiar()`.
+    """
+
+    def __init__(self, ruta: str | None = None):
+        """Inicializa la caché.
+
+        Args:
+            ruta: Archivo JSON (None = CALIFICACION_CACHE o
+                ~/.cache/sistema_de_calificacion/resultados.json)
+        """
+        self.ruta = ruta or _ruta_cache()
+        self.aciertos = 0
+        self.fallos = 0
+        self.no_cacheables = 0
+        self._datos = self._leer()
+        # ruta del módulo -> (mtime, definiciones, referencias, base)
+        self._modulos: dict[str, tuple] = {}
+
+    def _leer(self) -> dict:
+        try:
+            with open(self.ruta, encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            return {}
+        return datos if isinstance(datos, dict) else {}
+
+    def _analizar_modulo(self, ruta: str) -> tuple:
+        """Separa un módulo en definiciones de primer nivel (con los nombres
+        que referencia cada una) y el resto de sentencias (la base)."""
+        mtime = os.path.getmtime(ruta)
+        if ruta in self._modulos and self._modulos[ruta][0] == mtime:
+            return self._modulos[ruta]
+
+        with open(ruta, encoding="utf-8") as archivo:
+            arbol = ast.parse(archivo.read())
+        definiciones: dict[str, str] = {}
+        referencias: dict[str, set[str]] = {}
+        base = []
+        for nodo in arbol.body:
+            if isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                nombres = [nodo.name]
+            elif isinstance(nodo, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                objetivos = (
+                    nodo.targets if isinstance(nodo, ast.Assign) else [nodo.target]
+                )
+                nombres = [
+                    n.id
+                    for o in objetivos
+                    for n in ast.walk(o)
+                    if isinstance(n, ast.Name)
+                ]
+            else:
+                nombres = []
+            if not nombres:
+                base.append(ast.unparse(nodo))
+                continue
+            usados = {
+                n.id if isinstance(n, ast.Name) else n.attr
+                for n in ast.walk(nodo)
+                if isinstance(n, (ast.Name, ast.Attribute))
+            }
+            for nombre in nombres:
+                definiciones[nombre] = definiciones.get(nombre, "") + ast.unparse(nodo)
+                referencias[nombre] = referencias.get(nombre, set()) | usados
+
+        analisis = (mtime, definiciones, referencias, "\n".join(base))
+        self._modulos[ruta] = analisis
+        return analisis
+
+    def _huella_modulo(self, modulo, nombres: set[str]) -> str:
+        """Huella de las definiciones de `modulo` alcanzables desde `nombres`."""
+        if not _es_local(modulo):
+            return f"{modulo.__name__}=={getattr(modulo, '__version__', '')}"
+        _, definiciones, referencias, base = self._analizar_modulo(modulo.__file__)
+        alcanzables: set[str] = set()
+        pendientes = [n for n in nombres if n in definiciones]
+        while pendientes:
+            nombre = pendientes.pop()
+            if nombre in alcanzables:
+                continue
+            alcanzables.add(nombre)
+            pendientes.extend(n for n in referencias[nombre] if n in definiciones)
+        cuerpo = "\n".join([base] + [definiciones[n] for n in sorted(alcanzables)])
+        return f"{modulo.__name__}:{hashlib.sha256(cuerpo.encode()).hexdigest()}"
+
+    def _huellas_valor(self, nombre: str, valor, nombres: set[str], vistas: set):
+        """Huellas de un valor que usa la prueba (global, celda o por defecto)."""
+        if inspect.ismodule(valor):
+            return [self._huella_modulo(valor, nombres)]
+        if inspect.isfunction(valor):
+            return [f"{nombre}:{_fuente(valor)}"] + self._dependencias(valor, vistas)
+        if inspect.isclass(valor) or inspect.isbuiltin(valor):
+            modulo = sys.modules.get(valor.__module__)
+            if modulo is not None and _es_local(modulo):
+                return [self._huella_modulo(modulo, {valor.__name__})]
+            return [f"{nombre}:{valor.__module__}.{valor.__qualname__}"]
+        if isinstance(valor, (bool, int, float, complex, str, bytes, type(None))):
+            return [f"{nombre}={valor!r}"]
+        raise _NoCacheable(nombre)
+
+    def _dependencias(self, funcion, vistas: set) -> list[str]:
+        """Huellas de todo lo que la función toma de sus variables globales, de
+        las variables capturadas (closure) y de sus valores por defecto.
+
+        Dos lambdas creadas en un bucle comparten el código fuente; lo que las
+        distingue es el valor capturado o el argumento por defecto.
+        """
+        if funcion in vistas:
+            return []
+        vistas.add(funcion)
+        codigo = funcion.__code__
+        nombres = _nombres_de_codigo(codigo)
+        globales = funcion.__globals__
+        huellas = []
+        for nombre in sorted(nombres & globales.keys()):
+            huellas += self._huellas_valor(nombre, globales[nombre], nombres, vistas)
+        for nombre, celda in zip(codigo.co_freevars, funcion.__closure__ or ()):
+            try:
+                valor = celda.cell_contents
+            except ValueError:  # celda todavía vacía
+                huellas.append(f"{nombre}:<vacía>")
+                continue
+            huellas += self._huellas_valor(nombre, valor, nombres, vistas)
+        defectos = list(enumerate(funcion.__defaults__ or ()))
+        defectos += sorted((funcion.__kwdefaults__ or {}).items())
+        for nombre, valor in defectos:
+            huellas += self._huellas_valor(f"<{nombre}>", valor, nombres, vistas)
+        return huellas
+
+    def clave(
+        self, funcion_prueba: Callable, ejecutor: EjecutorPruebas | None = None
+    ) -> str | None:
+        """Calcula la clave de una prueba (None si no se puede cachear).
+
+        Los límites de tiempo y memoria del ejecutor forman parte de la clave:
+        la misma prueba puede pasar o no según cuánto se le permita usar.
+        """
+        try:
+            partes = [platform.python_version(), _fuente(funcion_prueba)]
+            if ejecutor is not None:
+                partes.append(f"{ejecutor.tiempo_limite}|{ejecutor.memoria_limite}")
+            partes += self._dependencias(funcion_prueba, set())
+        except (_NoCacheable, AttributeError, OSError, SyntaxError):
+            self.no_cacheables += 1
+            return None
+        return hashlib.sha256("\0".join(partes).encode()).hexdigest()
+
+    def obtener(self, clave: str) -> tuple[str, str, dict] | None:
+        """Retorna el (resultado, detalle, medicion) guardado, contando acierto o
+        fallo. La medición es la de la corrida original."""
+        guardado = self._datos.get(clave)
+        if guardado is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        medicion = guardado[2] if len(guardado) > 2 else _medicion()
+        return guardado[0], guardado[1], medicion
+
+    def guardar(self, clave: str, resultado: str, detalle: str, medicion: dict):
+        """Guarda un resultado; escribe de forma atómica y sin pisar a otros.
+
+        No guarda los resultados debidos a los límites de recursos (ver
+        `_por_limite_de_recursos`): se vuelven a ejecutar la próxima vez.
+        """
+        if _por_limite_de_recursos(resultado, detalle):
+            return
+        self._datos[clave] = [resultado, detalle, medicion]
+        try:
+            os.makedirs(os.path.dirname(self.ruta) or ".", exist_ok=True)
+            # Se relee para no pisar lo que otro proceso guardó mientras tanto
+            datos = self._leer()
+            datos[clave] = self._datos[clave]
+            temporal = f"{self.ruta}.{os.getpid()}.tmp"
+            with open(temporal, "w", encoding="utf-8") as archivo:
+                json.dump(datos, archivo, ensure_ascii=False)
+            os.replace(temporal, self.ruta)
+        except OSError:
+            pass  # sin disco escribible la caché vive solo en memoria
+
+    def info(self) -> dict:
+        """Estadísticas de uso de la caché en esta sesión."""
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "no_cacheables": self.no_cacheables,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            "entradas": len(self._datos),
+            "ruta": self.ruta,
+        }
+
+    def limpiar(self):
+        """Borra todos los resultados guardados (en memoria y en disco)."""
+        self._datos.clear()
+        try:
+            os.remove(self.ruta)
+        except OSError:
+            pass
+
+
+# ===================================================================
+# Salida: Reporteros
+# ===================================================================
+
+
+class Reportero:
+    """Destino de todo lo que muestra el sistema de calificación.
+
+    Recibe líneas de texto para personas (`linea`) y eventos estructurados
+    (`evento`: una prueba anotada, el resumen de un grupo, la nota total).
+    Cada subclase se queda con lo que le sirve; esta base descarta todo.
+    """
+
+    __slots__ = ()
+
+    def linea(self, texto: str = ""):
+        """Recibe una línea de texto del resumen."""
+
+    def evento(self, tipo: str, datos: dict):
+        """Recibe un evento estructurado ("prueba", "grupo", "seccion",
+        "total" o "cache")."""
+
+    def vaciar(self):
+        """Escribe lo que quede en el buffer."""
+
+    def cerrar(self):
+        """Vacía el buffer y libera lo que el reportero haya abierto.
+
+        Puede seguir usándose después: si hace falta, vuelve a abrir su destino.
+        """
+        self.vaciar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class ReporteroSilencioso(Reportero):
+    """No muestra nada; útil cuando solo interesan las notas."""
+
+    __slots__ = ()
+
+
+class ReporteroConsola(Reportero):
+    """Escribe las líneas en la consola, agrupadas en bloques.
+
+    Con `tamano_buffer=1` (por defecto) cada línea sale al instante, como con
+    print. Con un buffer mayor se escribe una vez cada `tamano_buffer`
+    líneas y al terminar cada resumen, lo que abarata calificar miles de
+    pruebas (la salida de las propias pruebas puede quedar intercalada).
+    """
+
+    __slots__ = ("destino", "tamano_buffer", "_lineas")
+
+    def __init__(self, destino=None, tamano_buffer: int = 1):
+        """Inicializa el reportero.
+
+        Args:
+            destino: Archivo de texto (None = sys.stdout al momento de escribir)
+            tamano_buffer: Líneas acumuladas antes de escribir
+        """
+        self.destino = destino
+        self.tamano_buffer = max(1, tamano_buffer)
+        self._lineas: list[str] = []
+
+    def linea(self, texto: str = ""):
+        self._lineas.append(texto)
+        if len(self._lineas) >= self.tamano_buffer:
+            self.vaciar()
+
+    def vaciar(self):
+        if self._lineas:
+            destino = self.destino if self.destino is not None else sys.stdout
+            destino.write("\n".join(self._lineas) + "\n")
+            self._lineas.clear()
+
+
+class ReporteroJSONL(Reportero):
+    """Escribe cada evento como una línea JSON (JSON Lines); ignora el texto.
+
+    Si recibe una ruta, abre el archivo con el primer evento y lo cierra en
+    `cerrar()` (SistemaCalificacion lo llama al terminar cada resumen); un
+    evento posterior lo vuelve a abrir para agregar al final. Un archivo ya
+    abierto que se le pase es de quien lo abrió: `cerrar()` solo lo vacía.
+
+    Ejemplo (con una ruta, como "notas.jsonl", funciona igual):
+        >>> import io
+        >>> salida = io.StringIO()
+        >>> with SistemaCalificacion(reportero=ReporteroJSONL(salida)) as sistema:
+        ...     sistema.crear_grupo("Básicas", 10.0).registrar_prueba("suma", int)
+        True
+        >>> evento = json.loads(salida.getvalue().splitlines()[0])
+        >>> evento["evento"], evento["nombre"], evento["resultado"]
+        ('prueba', 'suma', 'pasada')
+    """
+
+    __slots__ = ("ruta", "_archivo")
+
+    def __init__(self, destino):
+        """Inicializa el reportero.
+
+        Args:
+            destino: Ruta (se agrega al final del archivo) o archivo de texto
+        """
+        if isinstance(destino, (str, os.PathLike)):
+            self.ruta, self._archivo = destino, None
+        else:
+            self.ruta, self._archivo = None, destino
+
+    def evento(self, tipo: str, datos: dict):
+        if self._archivo is None:
+            self._archivo = open(self.ruta, "a", encoding="utf-8")
+        self._archivo.write(
+            json.dumps({"evento": tipo, **datos}, ensure_ascii=False) + "\n"
+        )
+
+    def vaciar(self):
+        if self._archivo is not None:
+            self._archivo.flush()
+
+    def cerrar(self):
+        self.vaciar()
+        if self.ruta is not None and self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+
+def _reportero_de_entorno() -> Reportero:
+    """Reportero según CALIFICACION_SALIDA: "silencio", un archivo .jsonl o
+    (por defecto) la consola."""
+    salida = os.environ.get("CALIFICACION_SALIDA", "")
+    if salida == "silencio":
+        return ReporteroSilencioso()
+    if salida.endswith(".jsonl"):
+        return ReporteroJSONL(salida)
+    return ReporteroConsola()
+
+
+# ===================================================================
+# Grupos y Sistema
+# ===================================================================
+
+
+class ResultadoPrueba:
+    """Resultado anotado de una prueba."""
+
+    __slots__ = ("nombre", "resultado", "detalle", "medicion")
+
+    def __init__(self, nombre: str, resultado: str, detalle: str, medicion: dict):
+        self.nombre = nombre
+        self.resultado = resultado
+        self.detalle = detalle
+        self.medicion = medicion
+
+    def __repr__(self) -> str:
+        return f"ResultadoPrueba({self.nombre!r}, {self.resultado!r})"
+
 
 class GrupoCalificacion:
     """Representa un grupo de pruebas con un valor total configurable.
 
     Este diseño modular permite tener múltiples grupos de pruebas
     (básicas, extras, bonificaciones) cada uno con su propio valor.
+
+    Los resultados se guardan en orden de registro y el grupo lleva
+    contadores por resultado y totales de tiempo, así la nota y las
+    estadísticas salen en O(1) sin recorrer las pruebas.
+
+    Pista: `pruebas_pasadas`, `pruebas_fallidas`, `pruebas_no_implementadas`
+        y `pruebas_tiempo_agotado` son propiedades de solo lectura que arman
+        una lista nueva en cada acceso. Antes eran listas del grupo; ahora
+        agregarles elementos o reasignarlas no cambia la nota. Para anotar
+        un resultado use `registrar_prueba`.
     """
 
-    def __init__(self, nombre: str, valor_maximo: float):
+    def __init__(
+        self,
+        nombre: str,
+        valor_maximo: float,
+        ejecutor: EjecutorPruebas | None = None,
+        cache: CacheResultados | None = None,
+        medir_memoria: bool = False,
+        reportero: Reportero | None = None,
+    ):
         """Inicializa un grupo de calificación.
 
         Args:
             nombre: Nombre descriptivo del grupo (ej: "Funciones Básicas")
             valor_maximo: Valor máximo en % que vale este grupo (ej: 5.0 para 5%)
+            ejecutor: Ejecutor con límites de tiempo/memoria (None = ejecutar
+                cada prueba directamente en este proceso)
+            cache: Caché de resultados (None = ejecutar siempre las pruebas)
+            medir_memoria: Medir el pico de memoria de cada prueba (lento)
+            reportero: Destino de la salida (None = la consola)
         """
         self.nombre = nombre
         self.valor_maximo = valor_maximo
-        self.pruebas_pasadas: list[tuple[str, float]] = []
-        self.pruebas_fallidas: list[tuple[str, float]] = []
-        self.pruebas_no_implementadas: list[tuple[str, float]] = []
+        self.resultados: list[ResultadoPrueba] = []
         self.num_pruebas_registradas = 0
+        self._conteos = dict.fromkeys(
+            (PASADA, FALLIDA, NO_IMPLEMENTADA, TIEMPO_AGOTADO), 0
+        )
+        self._tiempo_total = 0.0
+        self._cpu_total = 0.0
+        self._memoria_pico: int | None = None
+        self._rendimiento: list[ResultadoPrueba] = []
+        self._ejecutor = ejecutor
+        self._cache = cache
+        self._medir_memoria = medir_memoria
+        self._reportero = reportero if reportero is not None else ReporteroConsola()
+
+    # --- Vistas de los resultados (se arman al pedirlas; solo lectura) ---
+
+    def _valor_por_prueba(self) -> float:
+        if self.num_pruebas_registradas == 0:
+            return 0.0
+        return self.valor_maximo / self.num_pruebas_registradas
+
+    def _pruebas(self, resultado: str) -> list[tuple[str, float]]:
+        valor = self._valor_por_prueba()
+        return [(r.nombre, valor) for r in self.resultados if r.resultado == resultado]
 
-    def registrar_prueba(self, nombre_prueba: str, funcion_prueba: Callable) -> bool:
+    @property
+    def pruebas_pasadas(self) -> list[tuple[str, float]]:
+        """(nombre, puntos) de las pruebas que pasaron."""
+        return self._pruebas(PASADA)
+
+    @property
+    def pruebas_fallidas(self) -> list[tuple[str, float]]:
+        """(nombre, puntos) de las pruebas que fallaron."""
+        return self._pruebas(FALLIDA)
+
+    @property
+    def pruebas_no_implementadas(self) -> list[tuple[str, float]]:
+        """(nombre, puntos) de las pruebas sin implementar."""
+        return self._pruebas(NO_IMPLEMENTADA)
+
+    @property
+    def pruebas_tiempo_agotado(self) -> list[tuple[str, float]]:
+        """(nombre, puntos) de las pruebas que agotaron su tiempo."""
+        return self._pruebas(TIEMPO_AGOTADO)
+
+    @property
+    def mediciones(self) -> dict[str, dict]:
+        """Nombre de la prueba -> {"tiempo", "cpu", "memoria", ...}."""
+        return {r.nombre: r.medicion for r in self.resultados}
+
+    # --- Registro ---
+
+    def registrar_prueba(
+        self, nombre_prueba: str, funcion_prueba: Callable
+    ) -> bool | None:
         """Registra y ejecuta una prueba, calculando su valor automáticamente.
 
         Args:
@@ -33,42 +971,127 @@ class GrupoCalificacion:
             funcion_prueba: Función que ejecuta la prueba
 
         Returns:
-            bool: True si la prueba pasó, False en caso contrario
+            bool | None: True si la prueba pasó, False en caso contrario.
+            None si el ejecutor es concurrente: la prueba queda encolada y su
+            resultado se anota al llamar a `esperar()`.
         """
         self.num_pruebas_registradas += 1
-        try:
-            funcion_prueba()
-            self.pruebas_pasadas.append((nombre_prueba, 0.0))
-            print(f"✓ {nombre_prueba}: PASÓ")
-            return True
-        except NotImplementedError:
-            self.pruebas_no_implementadas.append((nombre_prueba, 0.0))
-            print(f"✗ {nombre_prueba}: FALTA IMPLEMENTACIÓN")
-            return False
-        except AssertionError as e:
-            self.pruebas_fallidas.append((nombre_prueba, 0.0))
-            print(f"✗ {nombre_prueba}: FALLÓ - {str(e)}")
-            return False
-        except Exception as e:
-            self.pruebas_fallidas.append((nombre_prueba, 0.0))
-            print(f"✗ {nombre_prueba}: ERROR - {type(e).__name__}: {str(e)}")
-            return False
+        clave = conocido = None
+        # Las pruebas de rendimiento dependen de la máquina: no se cachean
+        rendimiento = isinstance(funcion_prueba, PruebaRendimiento)
+        if self._cache is not None and not rendimiento:
+            clave = self._cache.clave(funcion_prueba, self._ejecutor)
+            if clave is not None:
+                conocido = self._cache.obtener(clave)
 
-    def _recalcular_puntos(self):
-        """Recalcula los puntos de todas las pruebas de forma equitativa."""
-        if self.num_pruebas_registradas == 0:
-            return
+        if self._ejecutor is not None and self._ejecutor.diferido:
+            self._ejecutor.registrar(
+                self, nombre_prueba, funcion_prueba, clave, conocido
+            )
+            return None
+        if conocido is not None:
+            return self._anotar(nombre_prueba, *conocido)
+        if self._ejecutor is None:
+            nuevo = _ejecutar_prueba(funcion_prueba, self._medir_memoria)
+        else:
+            nuevo = self._ejecutor.ejecutar(funcion_prueba)
+        return self._anotar(nombre_prueba, *nuevo, clave=clave)
 
-        valor_por_prueba = self.valor_maximo / self.num_pruebas_registradas
+    def registrar_prueba_rendimiento(
+        self,
+        nombre_prueba: str,
+        operacion: Callable,
+        tiempo_ms: float | None = None,
+        memoria_mb: float | None = None,
+        repeticiones: int = 5,
+    ) -> bool | None:
+        """Registra una prueba que exige cumplir un presupuesto de rendimiento.
 
-        # Actualizar todos los valores
-        self.pruebas_pasadas = [(n, valor_por_prueba) for n, _ in self.pruebas_pasadas]
-        self.pruebas_fallidas = [
-            (n, valor_por_prueba) for n, _ in self.pruebas_fallidas
-        ]
-        self.pruebas_no_implementadas = [
-            (n, valor_por_prueba) for n, _ in self.pruebas_no_implementadas
-        ]
+        Vale lo mismo que cualquier otra prueba del grupo. El presupuesto de
+        tiempo se escala con `factor_maquina()` (ver `PruebaRendimiento`).
+
+        Args:
+            nombre_prueba: Nombre descriptivo de la prueba
+            operacion: Función sin argumentos que se mide
+            tiempo_ms: Presupuesto en ms de la máquina de referencia
+            memoria_mb: Pico de memoria permitido en MB
+            repeticiones: Corridas medidas (se usa la mediana)
+
+        Returns:
+            bool | None: Igual que `registrar_prueba`
+
+        Ejemplo (el resultado depende de la máquina, no se ejecuta con doctest):
+            >>> import numpyless as npl  # doctest: +SKIP
+            >>> grupo = GrupoCalificacion("Rendimiento", 10.0)
+            >>> A = [[1.0] * 100 for _ in range(100)]
+            >>> grupo.registrar_prueba_rendimiento(  # doctest: +SKIP
+            ...     "matmul 100x100", lambda: npl.matmul(A, A), tiempo_ms=150
+            ... )
+            ✓ matmul 100x100: PASÓ (...)
+            True
+        """
+        factor_maquina()  # calibrar aquí para que los hijos lo hereden
+        prueba = PruebaRendimiento(operacion, tiempo_ms, memoria_mb, repeticiones)
+        return self.registrar_prueba(nombre_prueba, prueba)
+
+    def _anotar(
+        self,
+        nombre_prueba: str,
+        resultado: str,
+        detalle: str,
+        medicion: dict,
+        clave: str | None = None,
+    ) -> bool:
+        """Anota el resultado de una prueba, actualiza los contadores y lo reporta.
+
+        Si se indica `clave`, el resultado es nuevo y se guarda en la caché.
+        """
+        if clave is not None:
+            self._cache.guardar(clave, resultado, detalle, medicion)
+        registro = ResultadoPrueba(nombre_prueba, resultado, detalle, medicion)
+        self.resultados.append(registro)
+        self._conteos[resultado] += 1
+        if medicion.get("tiempo") is not None:
+            self._tiempo_total += medicion["tiempo"]
+        if medicion.get("cpu") is not None:
+            self._cpu_total += medicion["cpu"]
+        if medicion.get("memoria") is not None:
+            self._memoria_pico = max(self._memoria_pico or 0, medicion["memoria"])
+        if "presupuesto" in medicion:
+            self._rendimiento.append(registro)
+
+        self._reportero.evento(
+            "prueba",
+            {
+                "grupo": self.nombre,
+                "nombre": nombre_prueba,
+                "resultado": resultado,
+                "detalle": detalle,
+                **medicion,
+            },
+        )
+        if resultado == PASADA:
+            # Solo las pruebas de rendimiento traen detalle al pasar
+            extra = f" ({detalle})" if detalle else ""
+            self._reportero.linea(f"✓ {nombre_prueba}: PASÓ{extra}")
+        elif resultado == NO_IMPLEMENTADA:
+            self._reportero.linea(f"✗ {nombre_prueba}: FALTA IMPLEMENTACIÓN")
+        elif resultado == TIEMPO_AGOTADO:
+            self._reportero.linea(f"⏱ {nombre_prueba}: {detalle}")
+        else:
+            self._reportero.linea(f"✗ {nombre_prueba}: {detalle}")
+        return resultado == PASADA
+
+    def esperar(self):
+        """Ejecuta las pruebas encoladas (ejecutor concurrente) y anota su resultado."""
+        if self._ejecutor is not None:
+            self._ejecutor.esperar()
+
+    def _recalcular_puntos(self):
+        """Se conserva por compatibilidad: los puntos ya salen de los contadores."""
+        self.esperar()
+
+    # --- Notas y estadísticas ---
 
     def calcular_nota(self) -> tuple[float, float]:
         """Calcula la nota obtenida y el máximo posible.
@@ -76,81 +1099,181 @@ class GrupoCalificacion:
         Returns:
             tuple[float, float]: (nota_obtenida, valor_maximo)
         """
-        nota_obtenida = sum(puntos for _, puntos in self.pruebas_pasadas)
+        self.esperar()
+        nota_obtenida = self._conteos[PASADA] * self._valor_por_prueba()
         return nota_obtenida, self.valor_maximo
 
+    def _resumen_mediciones(self) -> dict:
+        """Totales de tiempo/CPU, pico de memoria y pruebas de rendimiento."""
+        rendimiento = [
+            {
+                "nombre": r.nombre,
+                "tiempo": r.medicion["tiempo"],
+                "presupuesto": r.medicion["presupuesto"],
+                "memoria": r.medicion["memoria"],
+                "memoria_max": r.medicion["memoria_max"],
+                "cumple": r.medicion["cumple"],
+            }
+            for r in self._rendimiento
+        ]
+        return {
+            "tiempo_total": self._tiempo_total,
+            "cpu_total": self._cpu_total,
+            "memoria_pico": self._memoria_pico,
+            "rendimiento": rendimiento,
+            "factor_maquina": _FACTOR_MAQUINA if rendimiento else None,
+        }
+
     def obtener_estadisticas(self) -> dict:
         """Obtiene estadísticas detalladas del grupo.
 
+        Además de los conteos incluye tiempo_total y cpu_total (segundos),
+        memoria_pico (bytes, None si no se midió) y rendimiento: una entrada
+        por prueba de rendimiento con su tiempo, presupuesto y si cumple.
+
         Returns:
             dict: Diccionario con estadísticas
         """
         nota_obtenida, _ = self.calcular_nota()
-        total_pruebas = (
-            len(self.pruebas_pasadas)
-            + len(self.pruebas_fallidas)
-            + len(self.pruebas_no_implementadas)
-        )
 
         return {
             "nombre": self.nombre,
             "nota_obtenida": nota_obtenida,
             "valor_maximo": self.valor_maximo,
-            "total_pruebas": total_pruebas,
-            "pasadas": len(self.pruebas_pasadas),
-            "fallidas": len(self.pruebas_fallidas),
-            "no_implementadas": len(self.pruebas_no_implementadas),
+            "total_pruebas": len(self.resultados),
+            "pasadas": self._conteos[PASADA],
+            "fallidas": self._conteos[FALLIDA],
+            "no_implementadas": self._conteos[NO_IMPLEMENTADA],
+            "tiempo_agotado": self._conteos[TIEMPO_AGOTADO],
             "porcentaje": (nota_obtenida / self.valor_maximo * 100)
             if self.valor_maximo > 0
             else 0,
+            **self._resumen_mediciones(),
         }
 
+    def _detalle_medicion(self, m: dict) -> str:
+        """Texto corto con el costo de una prueba para el resumen."""
+        partes = []
+        if m.get("tiempo") is not None:
+            tiempo = _formatear_tiempo(m["tiempo"])
+            if m.get("presupuesto") is not None:
+                tiempo += f" / {_formatear_tiempo(m['presupuesto'])}"
+            partes.append(tiempo)
+        if m.get("cpu") is not None:
+            partes.append(f"CPU {_formatear_tiempo(m['cpu'])}")
+        if m.get("memoria") is not None:
+            memoria = _formatear_memoria(m["memoria"])
+            if m.get("memoria_max") is not None:
+                memoria += f" / {_formatear_memoria(m['memoria_max'])}"
+            partes.append(memoria)
+        return f"  [{', '.join(partes)}]" if partes else ""
+
     def mostrar_resumen(self, verbose: bool = True):
         """Muestra el resumen de este grupo.
 
         Args:
             verbose: Si False, solo muestra estadísticas sin detalles de cada prueba
         """
-        self._recalcular_puntos()
-
         stats = self.obtener_estadisticas()
+        self._reportero.evento("grupo", stats)
+        linea = self._reportero.linea
 
-        print(f"\n{'─' * 70}")
-        print(f"📦 {self.nombre}")
-        print(f"{'─' * 70}")
-        print(f"Valor: {stats['nota_obtenida']:.2f}% / {stats['valor_maximo']:.2f}%")
-        print(
+        linea(f"\n{'─' * 70}")
+        linea(f"📦 {self.nombre}")
+        linea(f"{'─' * 70}")
+        linea(f"Valor: {stats['nota_obtenida']:.2f}% / {stats['valor_maximo']:.2f}%")
+        linea(
             f"Pruebas: {stats['pasadas']}/{stats['total_pruebas']} pasadas "
             f"({stats['porcentaje']:.1f}%)"
         )
+        linea(
+            f"Tiempo: {_formatear_tiempo(stats['tiempo_total'])} "
+            f"(CPU {_formatear_tiempo(stats['cpu_total'])})"
+            + (
+                f", pico de memoria {_formatear_memoria(stats['memoria_pico'])}"
+                if stats["memoria_pico"] is not None
+                else ""
+            )
+        )
+        if stats["rendimiento"]:
+            cumplen = sum(r["cumple"] for r in stats["rendimiento"])
+            linea(
+                f"Rendimiento: {cumplen}/{len(stats['rendimiento'])} dentro del "
+                f"presupuesto (factor de máquina {stats['factor_maquina']:.2f})"
+            )
 
         # Solo mostrar detalles si verbose=True
-        if not verbose:
-            return
+        if verbose:
+            valor = self._valor_por_prueba()
+            secciones = [
+                (PASADA, "✓ Pasadas", "+"),
+                (FALLIDA, "✗ Fallidas", "0/"),
+                (NO_IMPLEMENTADA, "⚠ Sin Implementar", "0/"),
+                (TIEMPO_AGOTADO, "⏱ Tiempo Agotado", "0/"),
+            ]
+            for resultado, titulo, prefijo in secciones:
+                if not self._conteos[resultado]:
+                    continue
+                linea(f"\n  {titulo} ({self._conteos[resultado]}):")
+                for r in self.resultados:
+                    if r.resultado == resultado:
+                        costo = self._detalle_medicion(r.medicion)
+                        linea(f"    • {r.nombre}: {prefijo}{valor:.3f}%{costo}")
+        self._reportero.vaciar()
 
-        if self.pruebas_pasadas:
-            print(f"\n  ✓ Pasadas ({len(self.pruebas_pasadas)}):")
-            for nombre, puntos in self.pruebas_pasadas:
-                print(f"    • {nombre}: +{puntos:.3f}%")
 
-        if self.pruebas_fallidas:
-            print(f"\n  ✗ Fallidas ({len(self.pruebas_fallidas)}):")
-            for nombre, puntos in self.pruebas_fallidas:
-                print(f"    • {nombre}: 0/{puntos:.3f}%")
+class SistemaCalificacion:
+    """Sistema de calificación que maneja múltiples grupos de pruebas."""
 
-        if self.pruebas_no_implementadas:
-            print(f"\n  ⚠ Sin Implementar ({len(self.pruebas_no_implementadas)}):")
-            for nombre, puntos in self.pruebas_no_implementadas:
-                print(f"    • {nombre}: 0/{puntos:.3f}%")
+    def __init__(
+        self,
+        procesos: int = 1,
+        tiempo_limite: float | None = None,
+        memoria_limite: float | None = None,
+        cache: bool | str | None = None,
+        medir_memoria: bool = False,
+        reportero: Reportero | None = None,
+    ):
+        """Inicializa el sistema de calificación.
 
+        Sin argumentos las pruebas se ejecutan como siempre, una tras otra en
+        este proceso. Con límites o `procesos > 1` cada prueba corre aislada
+        en su propio proceso (ver `EjecutorPruebas`).
 
-class SistemaCalificacion:
-    """Sistema de calificación que maneja múltiples grupos de pruebas."""
+        Args:
+            procesos: Pruebas simultáneas como máximo (0 = un proceso por núcleo)
+            tiempo_limite: Segundos de reloj por prueba (None = sin límite)
+            memoria_limite: MB adicionales por prueba (None = sin límite)
+            cache: True o la ruta de un JSON para reutilizar los resultados de
+                las pruebas cuyo código no cambió (ver `CacheResultados`).
+                None = activa solo si está definida CALIFICACION_CACHE.
+            medir_memoria: Registrar el pico de memoria de cada prueba con
+                tracemalloc (hace las pruebas varias veces más lentas). Las
+                pruebas de rendimiento con memoria_mb lo miden siempre.
+            reportero: Destino de la salida: ReporteroConsola (por defecto),
+                ReporteroJSONL o ReporteroSilencioso. None = según
+                CALIFICACION_SALIDA ("silencio" o un archivo .jsonl).
 
-    def __init__(self):
-        """Inicializa el sistema de calificación."""
+        Ejemplo:
+            >>> sistema = SistemaCalificacion(procesos=0, tiempo_limite=10)
+            >>> sistema = SistemaCalificacion(cache=True)
+        """
         self.grupos: list[GrupoCalificacion] = []
         self._grupos_por_nombre: dict[str, GrupoCalificacion] = {}
+        self._medir_memoria = medir_memoria
+        if reportero is None:
+            reportero = _reportero_de_entorno()
+        self._reportero = reportero
+        self._ejecutor = None
+        if procesos != 1 or tiempo_limite is not None or memoria_limite is not None:
+            self._ejecutor = EjecutorPruebas(
+                procesos, tiempo_limite, memoria_limite, medir_memoria
+            )
+        if cache is None:
+            cache = os.environ.get("CALIFICACION_CACHE") or False
+        self._cache = None
+        if cache:
+            self._cache = CacheResultados(cache if isinstance(cache, str) else None)
 
     def crear_grupo(self, nombre: str, valor_maximo: float) -> GrupoCalificacion:
         """Crea y registra un nuevo grupo de calificación.
@@ -168,26 +1291,81 @@ class SistemaCalificacion:
         if nombre in self._grupos_por_nombre:
             return self._grupos_por_nombre[nombre]
 
-        grupo = GrupoCalificacion(nombre, valor_maximo)
+        grupo = GrupoCalificacion(
+            nombre,
+            valor_maximo,
+            self._ejecutor,
+            self._cache,
+            self._medir_memoria,
+            self._reportero,
+        )
         self.grupos.append(grupo)
         self._grupos_por_nombre[nombre] = grupo
         return grupo
 
     def limpiar(self):
         """Limpia todos los grupos registrados. Útil para reiniciar el sistema."""
+        if self._ejecutor is not None:
+            self._ejecutor._pendientes.clear()
         self.grupos.clear()
         self._grupos_por_nombre.clear()
 
+    def esperar(self):
+        """Ejecuta juntas las pruebas encoladas de todos los grupos."""
+        if self._ejecutor is not None:
+            self._ejecutor.esperar()
+
+    def cache_info(self) -> dict | None:
+        """Aciertos y fallos de la caché de resultados (None si no está activa).
+
+        Returns:
+            dict | None: aciertos, fallos, no_cacheables, tasa_aciertos,
+            entradas y ruta
+        """
+        return None if self._cache is None else self._cache.info()
+
+    def mostrar_estadisticas_cache(self):
+        """Muestra el uso de la caché de resultados en esta sesión."""
+        info = self.cache_info()
+        if info is None:
+            self._reportero.linea("💾 Caché de resultados desactivada")
+        else:
+            self._reportero.evento("cache", info)
+            self._reportero.linea(
+                f"💾 Caché: {info['aciertos']} aciertos, {info['fallos']} fallos, "
+                f"{info['no_cacheables']} sin cachear "
+                f"({info['tasa_aciertos']:.0%} de aciertos) - {info['ruta']}"
+            )
+        self._reportero.vaciar()
+
+    def limpiar_cache(self):
+        """Borra los resultados guardados en la caché."""
+        if self._cache is not None:
+            self._cache.limpiar()
+
     def calcular_nota_total(self) -> tuple[float, float]:
         """Calcula la nota total de todos los grupos.
 
         Returns:
             tuple[float, float]: (nota_obtenida_total, valor_maximo_total)
         """
+        self.esperar()
         nota_total = sum(grupo.calcular_nota()[0] for grupo in self.grupos)
-        valor_total = sum(grupo.calcular_nota()[1] for grupo in self.grupos)
+        valor_total = sum(grupo.valor_maximo for grupo in self.grupos)
         return nota_total, valor_total
 
+    def _reportar_total(self, nota_total: float, valor_total: float) -> float:
+        porcentaje_global = (nota_total / valor_total * 100) if valor_total > 0 else 0
+        self._reportero.evento(
+            "total",
+            {
+                "nota_total": nota_total,
+                "valor_total": valor_total,
+                "porcentaje": porcentaje_global,
+            },
+        )
+        return porcentaje_global
+
     def mostrar_resumen_completo(self, verbose: bool = False):
         """Muestra el resumen completo de todos los grupos.
 
@@ -195,45 +1373,49 @@ class SistemaCalificacion:
             verbose: Si True, muestra el detalle de todas las pruebas.
                     Si False (default), solo muestra estadísticas resumidas.
         """
-        print("\n" + "=" * 70)
-        print("📊 RESUMEN DE CALIFICACIÓN COMPLETO")
-        print("=" * 70)
+        self.esperar()
+        linea = self._reportero.linea
+        linea("\n" + "=" * 70)
+        linea("📊 RESUMEN DE CALIFICACIÓN COMPLETO")
+        linea("=" * 70)
 
         for grupo in self.grupos:
             grupo.mostrar_resumen(verbose=verbose)
 
         nota_total, valor_total = self.calcular_nota_total()
+        porcentaje_global = self._reportar_total(nota_total, valor_total)
 
-        print("\n" + "=" * 70)
-        print(f"🎓 NOTA FINAL: {nota_total:.2f}% / {valor_total:.2f}%")
+        linea("\n" + "=" * 70)
+        linea(f"🎓 NOTA FINAL: {nota_total:.2f}% / {valor_total:.2f}%")
 
         if valor_total > 0:
-            porcentaje_global = (nota_total / valor_total) * 100
-            print(f"📈 Porcentaje de Completitud Global: {porcentaje_global:.1f}%")
+            linea(f"📈 Porcentaje de Completitud Global: {porcentaje_global:.1f}%")
 
             # Mensaje motivacional
             if porcentaje_global == 100:
-                print("🌟 ¡PERFECTO! Todas las funciones implementadas correctamente.")
+                linea("🌟 ¡PERFECTO! Todas las funciones implementadas correctamente.")
             elif porcentaje_global >= 90:
-                print("🎉 ¡EXCELENTE! Casi perfecto.")
+                linea("🎉 ¡EXCELENTE! Casi perfecto.")
             elif porcentaje_global >= 75:
-                print("👏 ¡MUY BIEN! Buen trabajo.")
+                linea("👏 ¡MUY BIEN! Buen trabajo.")
             elif porcentaje_global >= 50:
-                print("👍 Buen progreso. Sigue adelante.")
+                linea("👍 Buen progreso. Sigue adelante.")
             else:
-                print("💪 Continúa trabajando. ¡Tú puedes!")
+                linea("💪 Continúa trabajando. ¡Tú puedes!")
 
-        print("=" * 70)
+        linea("=" * 70)
+        self._reportero.cerrar()
 
     def mostrar_resumen_por_seccion(self):
         """Muestra un resumen compacto agrupado por secciones (Parte 1, Parte 2, etc.)"""
-        print("\n" + "=" * 70)
-        print("📊 RESUMEN POR SECCIÓN")
-        print("=" * 70)
+        self.esperar()
+        linea = self._reportero.linea
+        linea("\n" + "=" * 70)
+        linea("📊 RESUMEN POR SECCIÓN")
+        linea("=" * 70)
 
-        # Primero recalcular puntos de TODOS los grupos
-        for grupo in self.grupos:
-            grupo._recalcular_puntos()
+        # Estadísticas de cada grupo, una sola vez
+        estadisticas = {id(g): g.obtener_estadisticas() for g in self.grupos}
 
         # Agrupar por "Parte"
         parte1 = [g for g in self.grupos if not g.nombre.startswith("Parte 2")]
@@ -243,16 +1425,26 @@ class SistemaCalificacion:
             if not grupos:
                 return
 
-            nota_seccion = sum(g.calcular_nota()[0] for g in grupos)
-            valor_seccion = sum(g.calcular_nota()[1] for g in grupos)
-            total_pruebas = sum(
-                g.obtener_estadisticas()["total_pruebas"] for g in grupos
-            )
-            pruebas_pasadas = sum(g.obtener_estadisticas()["pasadas"] for g in grupos)
+            stats = [estadisticas[id(g)] for g in grupos]
+            nota_seccion = sum(s["nota_obtenida"] for s in stats)
+            valor_seccion = sum(s["valor_maximo"] for s in stats)
+            total_pruebas = sum(s["total_pruebas"] for s in stats)
+            pruebas_pasadas = sum(s["pasadas"] for s in stats)
 
             porcentaje = (
                 (nota_seccion / valor_seccion * 100) if valor_seccion > 0 else 0
             )
+            self._reportero.evento(
+                "seccion",
+                {
+                    "nombre": nombre,
+                    "nota": nota_seccion,
+                    "valor": valor_seccion,
+                    "pasadas": pruebas_pasadas,
+                    "total_pruebas": total_pruebas,
+                    "porcentaje": porcentaje,
+                },
+            )
 
             # Determinar símbolo según progreso
             if porcentaje == 100:
@@ -262,25 +1454,38 @@ class SistemaCalificacion:
             else:
                 simbolo = "❌"
 
-            print(f"\n{simbolo} {nombre}")
-            print(f"   Nota: {nota_seccion:.2f}% / {valor_seccion:.2f}%")
-            print(f"   Pruebas: {pruebas_pasadas}/{total_pruebas} ({porcentaje:.1f}%)")
+            linea(f"\n{simbolo} {nombre}")
+            linea(f"   Nota: {nota_seccion:.2f}% / {valor_seccion:.2f}%")
+            linea(f"   Pruebas: {pruebas_pasadas}/{total_pruebas} ({porcentaje:.1f}%)")
 
-            for grupo in grupos:
-                stats = grupo.obtener_estadisticas()
-                print(
-                    f"      • {grupo.nombre}: {stats['nota_obtenida']:.2f}% / {stats['valor_maximo']:.2f}%"
+            for grupo, s in zip(grupos, stats):
+                linea(
+                    f"      • {grupo.nombre}: {s['nota_obtenida']:.2f}% / {s['valor_maximo']:.2f}%"
                 )
 
         mostrar_seccion("PARTE 1: Implementación NumpyLess", parte1)
         mostrar_seccion("PARTE 2: Benchmarking y Análisis", parte2)
 
         # Total
-        nota_total, valor_total = self.calcular_nota_total()
-        porcentaje_global = (nota_total / valor_total * 100) if valor_total > 0 else 0
+        nota_total = sum(s["nota_obtenida"] for s in estadisticas.values())
+        valor_total = sum(s["valor_maximo"] for s in estadisticas.values())
+        porcentaje_global = self._reportar_total(nota_total, valor_total)
 
-        print("\n" + "─" * 70)
-        print(
+        linea("\n" + "─" * 70)
+        linea(
             f"🎓 CALIFICACIÓN TOTAL: {nota_total:.2f}% / {valor_total:.2f}% ({porcentaje_global:.1f}%)"
         )
-        print("=" * 70)
+        linea("=" * 70)
+        self._reportero.cerrar()
+
+    def cerrar(self):
+        """Ejecuta lo pendiente y cierra el reportero (un archivo JSONL, por
+        ejemplo). Los resúmenes ya lo cierran al terminar."""
+        self.esperar()
+        self._reportero.cerrar()
+
+    def __enter__(self) -> "SistemaCalificacion":
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -0,0 +1,229 @@
+"""Pruebas de numpyless: las variantes con out= y en su lugar no asignan
+una matriz nueva (se mide con tracemalloc), los formatos dispersos, la
+factorización LU y casos borde de los métodos iterativos.
+
+Uso:
+    python -m pytest test_numpyless.py
+"""
+
+import builtins
+import tracemalloc
+
+import pytest
+
+import numpyless as npl
+
+N = 200
+
+
+def _pico(funcion) -> int:
+    """Bytes de pico por encima de lo ya asignado mientras corre funcion().
+
+    Una primera llamada ya medida calienta cachés y reemplaza los valores
+    creados antes de activar tracemalloc, así liberarlos en la segunda
+    llamada también se descuenta.
+    """
+    tracemalloc.start()
+    try:
+        funcion()
+        actual, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        funcion()
+        return tracemalloc.get_traced_memory()[1] - actual
+    finally:
+        tracemalloc.stop()
+
+
+def _compacta(valor: float) -> npl.Matrix:
+    return npl.Matrix.full((N, N), valor)
+
+
+def _listas(valor: float) -> npl.Matriz:
+    # Un objeto float distinto por elemento, como en una matriz calculada
+    return [[valor * 1.0 for _ in range(N)] for _ in range(N)]
+
+
+def test_multiply_matrix_out_no_asigna_matriz():
+    A, C = _compacta(2.0), _compacta(0.0)
+    datos = C._data
+    pico = _pico(lambda: npl.multiply_matrix(3.0, A, out=C))
+    assert C._data is datos and C[N - 1, N - 1] == 6.0
+    # Una fila temporal cabe de sobra; una matriz nueva ocuparía C.nbytes
+    assert pico < C.nbytes // 10
+
+
+def test_iadd_matrices_no_asigna_matriz():
+    A, B = _compacta(1.0), _compacta(1.0)
+    datos = A._data
+    pico = _pico(lambda: npl.iadd_matrices(A, B))
+    assert A._data is datos and A[0, 0] == 3.0
+    assert pico < A.nbytes // 10
+
+
+def test_imultiply_matrix_no_asigna_matriz():
+    A = _compacta(1.0)
+    datos = A._data
+    pico = _pico(lambda: npl.imultiply_matrix(2.0, A))
+    assert A._data is datos and A[0, 0] == 4.0
+    assert pico < A.nbytes // 10
+
+
+def _retenido_sin_floats(funcion) -> int:
+    """Bytes que funcion() deja asignados en bloques mayores que un float.
+
+    En listas de listas cada resultado es un float nuevo (y la lista libre
+    de floats de CPython esconde parte de esas asignaciones a tracemalloc),
+    así que lo que se mide es si quedan filas o matrices nuevas vivas.
+    """
+    funcion()
+    tracemalloc.start()
+    try:
+        funcion()
+        instantanea = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return builtins.sum(t.size for t in instantanea.traces if t.size > 64)
+
+
+def test_listas_en_su_lugar_no_asignan_matriz():
+    A, B = _listas(1.0), _listas(1.0)
+    filas = list(A)
+    fila = N * 8  # Lo que ocupa una fila nueva: un puntero por elemento
+    retenido = _retenido_sin_floats(lambda: npl.iadd_matrices(A, B))
+    assert all(map(lambda x, y: x is y, A, filas)) and A[0][0] == 3.0
+    assert retenido < fila
+    retenido = _retenido_sin_floats(lambda: npl.imultiply_matrix(2.0, A))
+    assert all(map(lambda x, y: x is y, A, filas)) and A[0][0] == 12.0
+    assert retenido < fila
+
+
+def test_iterativos_con_max_iter_cero():
+    A, b = [[4, 1], [1, 3]], [1, 2]
+    assert npl.power_iteration(A, max_iter=0)[2]["iteraciones"] == 0
+    assert npl.conjugate_gradient(A, b, max_iter=0)[1]["iteraciones"] == 0
+    assert npl.jacobi(A, b, max_iter=0)[1]["iteraciones"] == 0
+
+
+def test_out_de_listas_recibe_los_mismos_tipos_que_sin_out():
+    A, B = [[1, 2], [3, 4]], [[1, 1], [1, 1]]
+    out = [[0, 0], [0, 0]]
+    npl.add_matrices(A, B, out=out)
+    assert out == npl.add_matrices(A, B)
+    assert all(isinstance(x, float) for fila in out for x in fila)
+    npl.multiply_matrix(2, A, out=out)
+    assert out == npl.multiply_matrix(2, A)
+    assert all(isinstance(x, float) for fila in out for x in fila)
+
+
+# --- Matrices dispersas: formatos y despacho desde las funciones públicas ---
+
+DENSA = [[1.0, 0.0, 2.0], [0.0, 0.0, 3.0], [4.0, 5.0, 0.0]]
+OTRA = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+OTRA_CUADRADA = [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0], [3.0, 3.0, 3.0]]
+
+
+def test_formatos_dispersos_ida_y_vuelta():
+    for formato in (npl.COOMatrix, npl.CSRMatrix, npl.CSCMatrix):
+        S = formato.from_dense(DENSA)
+        assert S.nnz == 5
+        assert S.todense() == DENSA
+        assert S.tocsr().todense() == S.tocsc().todense() == S.tocoo().todense()
+        assert S.todense(compacta=True).tolist() == DENSA
+
+
+def test_coo_suma_tripletas_repetidas():
+    S = npl.COOMatrix([0, 0, 1], [1, 1, 0], [2.0, 3.0, 7.0], (2, 2))
+    assert S.todense() == [[0.0, 5.0], [7.0, 0.0]]
+    assert S.tocsr().nnz == 2
+
+
+def test_matmul_despacha_con_operandos_dispersos():
+    esperado = npl.matmul(DENSA, OTRA)
+    for formato in (npl.COOMatrix, npl.CSRMatrix, npl.CSCMatrix):
+        S = formato.from_dense(DENSA)
+        assert npl.matmul(S, OTRA) == esperado
+        compacto = npl.matmul(S, npl.Matrix.from_lists(OTRA))
+        assert compacto.tolist() == esperado
+        assert npl.matmul(S, [1, 1, 1]) == npl.matmul(DENSA, [1, 1, 1])
+        assert npl.matmul(npl.transpose(OTRA), S) == npl.matmul(
+            npl.transpose(OTRA), DENSA
+        )
+        producto = npl.matmul(S, npl.CSRMatrix.from_dense(DENSA))
+        assert isinstance(producto, npl.CSRMatrix)
+        assert producto.todense() == npl.matmul(DENSA, DENSA)
+
+
+def test_operaciones_elemento_a_elemento_dispersas():
+    S = npl.CSRMatrix.from_dense(DENSA)
+    assert npl.transpose(S).todense() == npl.transpose(DENSA)
+    assert npl.multiply_matrix(2.0, S).todense() == npl.multiply_matrix(2.0, DENSA)
+    assert npl.norm(S) == npl.norm([x for fila in DENSA for x in fila])
+    assert npl.add_matrices(S, S).todense() == npl.add_matrices(DENSA, DENSA)
+    assert npl.add_matrices(S, OTRA_CUADRADA) == npl.add_matrices(DENSA, OTRA_CUADRADA)
+
+
+# --- Factorización LU: det, solve, solve_many e inv ---
+
+SISTEMA = [
+    [2.0, 1.0, 1.0, 0.0],
+    [4.0, 3.0, 3.0, 1.0],
+    [8.0, 7.0, 9.0, 5.0],
+    [6.0, 7.0, 9.0, 8.0],
+]
+
+
+def _cerca(X, Y, tol=1e-9) -> bool:
+    planos = (npl.Matrix.from_lists(M)._plana() for M in (X, Y))
+    return all(map(lambda x, y: abs(x - y) <= tol, *planos))
+
+
+def test_lu_reconstruye_pa():
+    F = npl.lu(SISTEMA)
+    PA = [SISTEMA[p] for p in F.perm]
+    assert _cerca(npl.matmul(F.L, F.U), PA)
+
+
+def test_det_por_lu():
+    # 5x5 no pasa por las fórmulas cerradas; det de esta tridiagonal es n + 1
+    A = [
+        [2, -1, 0, 0, 0],
+        [-1, 2, -1, 0, 0],
+        [0, -1, 2, -1, 0],
+        [0, 0, -1, 2, -1],
+        [0, 0, 0, -1, 2],
+    ]
+    assert abs(npl.det(A) - 6.0) < 1e-9
+    assert abs(npl.det(SISTEMA) - npl.lu(SISTEMA).det()) < 1e-12
+    assert abs(npl.det(npl.Matrix.from_lists(A)) - 6.0) < 1e-9
+
+
+def test_solve_solve_many_e_inv():
+    b = [1.0, 2.0, 3.0, 4.0]
+    x = npl.solve(SISTEMA, b)
+    assert _cerca([npl.matmul(SISTEMA, x)], [b])
+    F = npl.lu(SISTEMA)
+    assert npl.solve(F, b) == x
+    B = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 0.0]]
+    X = npl.solve_many(F, B)
+    assert _cerca(npl.matmul(SISTEMA, X), B)
+    assert _cerca(npl.matmul(SISTEMA, npl.inv(SISTEMA)), npl.identity(4))
+    compacta = npl.inv(npl.Matrix.from_lists(SISTEMA))
+    assert isinstance(compacta, npl.Matrix)
+    assert _cerca(compacta, npl.inv(SISTEMA))
+
+
+def test_matriz_singular():
+    A = [[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [1.0, 0.0, 1.0]]
+    assert npl.det(A) == 0.0
+    for operacion in (
+        lambda: npl.solve(A, [1, 2, 3]),
+        lambda: npl.solve_many(A, npl.identity(3)),
+        lambda: npl.inv(A),
+    ):
+        with pytest.raises(ValueError, match="singular"):
+            operacion()
+
+
+def test_lu_rechaza_matrices_no_cuadradas():
+    with pytest.raises(ValueError, match="cuadrada"):
+        npl.lu([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
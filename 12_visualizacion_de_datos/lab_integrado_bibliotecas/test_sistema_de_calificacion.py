@@ -0,0 +1,181 @@
+"""Pruebas del sistema de calificación: ejecución aislada con límites de tiempo
+y caché de resultados.
+
+Uso:
+    python -m pytest test_sistema_de_calificacion.py
+"""
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+import sistema_de_calificacion as sc
+
+necesita_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="el ejecutor aislado necesita fork",
+)
+
+
+def _dormir(segundos: float):
+    def prueba():
+        time.sleep(segundos)
+
+    return prueba
+
+
+def _falla():
+    assert 1 == 2, "uno no es dos"
+
+
+def _falta():
+    raise NotImplementedError
+
+
+def _sistema(**opciones) -> sc.SistemaCalificacion:
+    opciones.setdefault("cache", False)  # sin importar CALIFICACION_CACHE
+    return sc.SistemaCalificacion(reportero=sc.ReporteroSilencioso(), **opciones)
+
+
+@necesita_fork
+def test_tiempo_agotado_es_su_propio_resultado():
+    grupo = _sistema(tiempo_limite=0.5).crear_grupo("Límites", 4.0)
+    inicio = time.monotonic()
+    grupo.registrar_prueba("colgada", _dormir(30))
+    grupo.registrar_prueba("pasa", _dormir(0))
+    grupo.registrar_prueba("falla", _falla)
+    grupo.registrar_prueba("falta", _falta)
+    assert time.monotonic() - inicio < 10
+
+    resultados = [(r.nombre, r.resultado) for r in grupo.resultados]
+    assert resultados == [
+        ("colgada", sc.TIEMPO_AGOTADO),
+        ("pasa", sc.PASADA),
+        ("falla", sc.FALLIDA),
+        ("falta", sc.NO_IMPLEMENTADA),
+    ]
+    assert "TIEMPO AGOTADO" in grupo.resultados[0].detalle
+    assert "uno no es dos" in grupo.resultados[2].detalle
+    estadisticas = grupo.obtener_estadisticas()
+    assert estadisticas["tiempo_agotado"] == 1
+    assert estadisticas["nota_obtenida"] == pytest.approx(1.0)
+
+
+@necesita_fork
+def test_concurrente_anota_en_orden_de_registro():
+    sistema = _sistema(procesos=3, tiempo_limite=5)
+    grupo = sistema.crear_grupo("Orden", 3.0)
+    # Terminan en orden inverso al de registro
+    for nombre, segundos in (("lenta", 0.6), ("media", 0.3), ("rapida", 0.0)):
+        assert grupo.registrar_prueba(nombre, _dormir(segundos)) is None
+    assert grupo.resultados == []
+
+    inicio = time.monotonic()
+    nota, maximo = sistema.calcular_nota_total()
+    assert time.monotonic() - inicio < 0.6 + 0.3 + 0.5  # corrieron a la vez
+    assert [r.nombre for r in grupo.resultados] == ["lenta", "media", "rapida"]
+    assert (nota, maximo) == (pytest.approx(3.0), 3.0)
+
+
+@necesita_fork
+def test_hijo_que_muere_sin_responder_falla():
+    grupo = _sistema(procesos=2).crear_grupo("Muertes", 2.0)
+    grupo.registrar_prueba("sale", lambda: os._exit(3))
+    grupo.registrar_prueba("pasa", _dormir(0))
+    grupo.esperar()
+    assert [r.resultado for r in grupo.resultados] == [sc.FALLIDA, sc.PASADA]
+    assert grupo.resultados[0].detalle.endswith("código 3")
+
+
+# --- Caché de resultados: aciertos e invalidación ---
+
+
+def _cuaderno(codigo: str) -> dict:
+    """Ejecuta código como una celda del notebook y devuelve sus globales."""
+    espacio = {"__name__": "__main__"}
+    exec(compile(codigo, "<celda>", "exec"), espacio)
+    return espacio
+
+
+CELDA = """
+LIMITE = 3
+
+def ayuda(x):
+    return x + 1
+
+def prueba():
+    assert ayuda(1) < LIMITE
+"""
+
+
+def test_cache_repite_el_resultado_sin_ejecutar(tmp_path):
+    ruta = str(tmp_path / "cache.json")
+    # Las ejecuciones se cuentan en un archivo: una lista capturada haría
+    # que la prueba no se pudiera cachear
+    registro = str(tmp_path / "ejecuciones.txt")
+
+    def prueba():
+        with open(registro, "a") as archivo:
+            archivo.write("x")
+        raise ValueError("siempre falla")
+
+    for _ in range(2):
+        grupo = _sistema(cache=ruta).crear_grupo("Caché", 1.0)
+        grupo.registrar_prueba("prueba", prueba)
+        assert grupo.resultados[0].resultado == sc.FALLIDA
+        assert grupo.resultados[0].detalle == "ERROR - ValueError: siempre falla"
+    with open(registro) as archivo:
+        assert archivo.read() == "x"
+
+    info = sc.CacheResultados(ruta)
+    assert info.obtener(info.clave(prueba)) is not None
+    assert info.info()["aciertos"] == 1
+
+
+def test_clave_cambia_con_dependencias_y_constantes(tmp_path):
+    cache = sc.CacheResultados(str(tmp_path / "cache.json"))
+    base = cache.clave(_cuaderno(CELDA)["prueba"])
+    assert base is not None
+    assert cache.clave(_cuaderno(CELDA)["prueba"]) == base
+    otra_ayuda = CELDA.replace("return x + 1", "return x + 2")
+    assert cache.clave(_cuaderno(otra_ayuda)["prueba"]) != base
+    otro_limite = CELDA.replace("LIMITE = 3", "LIMITE = 4")
+    assert cache.clave(_cuaderno(otro_limite)["prueba"]) != base
+
+
+def test_clave_cambia_con_closures_y_valores_por_defecto(tmp_path):
+    cache = sc.CacheResultados(str(tmp_path / "cache.json"))
+
+    def con_closure(n):
+        return lambda: n * 2
+
+    claves = {cache.clave(con_closure(n)) for n in range(3)}
+    assert len(claves) == 3 and None not in claves
+    por_defecto = [lambda n=n: n * 2 for n in range(3)]
+    assert len({cache.clave(prueba) for prueba in por_defecto}) == 3
+    # Un valor capturado que no se puede resumir impide cachear
+    assert cache.clave(con_closure([1, 2])) is None
+    assert cache.info()["no_cacheables"] == 1
+
+
+def test_clave_cambia_con_los_limites_del_ejecutor(tmp_path):
+    cache = sc.CacheResultados(str(tmp_path / "cache.json"))
+    prueba = _cuaderno(CELDA)["prueba"]
+    claves = {
+        cache.clave(prueba),
+        cache.clave(prueba, sc.EjecutorPruebas(tiempo_limite=1)),
+        cache.clave(prueba, sc.EjecutorPruebas(tiempo_limite=2)),
+        cache.clave(prueba, sc.EjecutorPruebas(memoria_limite=100)),
+    }
+    assert len(claves) == 4
+
+
+def test_no_guarda_fallas_por_limite_de_recursos(tmp_path):
+    cache = sc.CacheResultados(str(tmp_path / "cache.json"))
+    cache.guardar("tiempo", sc.TIEMPO_AGOTADO, "TIEMPO AGOTADO (> 1 s)", {})
+    cache.guardar("memoria", sc.FALLIDA, "ERROR - MemoryError: ", {})
+    cache.guardar("muerto", sc.FALLIDA, "ERROR - el proceso terminó con código -9", {})
+    cache.guardar("falla", sc.FALLIDA, "FALLÓ - uno no es dos", {})
+    assert set(sc.CacheResultados(cache.ruta)._datos) == {"falla"}